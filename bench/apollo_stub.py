@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for Apollo's /api/v1/people/bulk_match, for tests and benchmarks.
+
+    python bench/apollo_stub.py [--port 8765] [--latency 0.2] [--throttle-rate 0.05]
+    APOLLO_BASE_URL=http://127.0.0.1:8765 APOLLO_API_KEY=stub python main.py enrich
+
+Answers like the real endpoint: one entry in "matches" per detail (null when
+there's no match), 422 for more than 10 details, 401 without an API key, and
+429 with Retry-After for a configurable share of requests. Matches are
+deterministic: roughly match_rate of people get first.last@domain.
+"""
+
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MAX_DETAILS = 10
+
+
+class StubState:
+    def __init__(self, latency: float = 0.2, throttle_rate: float = 0.0, match_rate: float = 0.7):
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.match_rate = match_rate
+        self.requests = 0
+        self.throttled = 0
+        self.details = 0
+        self.rng = random.Random(3)
+        self.lock = threading.Lock()
+
+
+def stub_match(details: dict, match_rate: float) -> dict | None:
+    name = details.get("name") or f"{details.get('first_name', '')} {details.get('last_name', '')}".strip()
+    domain = details.get("domain") or ""
+    if not name or not domain:
+        return None
+    bucket = hashlib.blake2b(f"{name}|{domain}".encode(), digest_size=2).digest()
+    if int.from_bytes(bucket) / 0xFFFF >= match_rate:
+        return None
+    local = ".".join(part.lower() for part in name.split() if part.isalpha()) or "contact"
+    return {
+        "id": bucket.hex(),
+        "name": name,
+        "email": f"{local}@{domain}",
+        "email_status": "verified",
+        "linkedin_url": details.get("linkedin_url"),
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "ApolloStub/1.0"
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+    def _send(self, status: int, body: dict, headers: dict | None = None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        state = self.server.state
+        if self.path.split("?")[0] != "/api/v1/people/bulk_match":
+            return self._send(404, {"error": "not found"})
+        if not self.headers.get("X-Api-Key"):
+            return self._send(401, {"error": "missing api key"})
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        details = payload.get("details") or []
+        if len(details) > MAX_DETAILS:
+            return self._send(422, {"error": f"at most {MAX_DETAILS} details per request"})
+
+        with state.lock:
+            state.requests += 1
+            throttle = state.rng.random() < state.throttle_rate
+            if throttle:
+                state.throttled += 1
+            else:
+                state.details += len(details)
+        if throttle:
+            return self._send(429, {"error": "rate limited"}, {"Retry-After": "0.1"})
+
+        time.sleep(state.latency)
+        matches = [stub_match(d, state.match_rate) for d in details]
+        self._send(200, {
+            "status": "success",
+            "matches": matches,
+            "credits_consumed": sum(1 for m in matches if m),
+        })
+
+
+def start_stub(port: int = 0, **options) -> tuple[ThreadingHTTPServer, str]:
+    """Start the stub on a background thread. Returns (server, base_url); call server.shutdown() to stop."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Apollo bulk_match stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds per request (default: 0.2)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--match-rate", type=float, default=0.7, help="Share of people with an email")
+    args = parser.parse_args()
+    server, url = start_stub(args.port, latency=args.latency, throttle_rate=args.throttle_rate, match_rate=args.match_rate)
+    print(f"🧪 Apollo stub listening on {url} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Compare the turn-by-turn agent loop with plan-then-fan-out discovery.
+
+    python bench/bench_agent.py "developer tools startups" "cloud providers with student credits"
+
+Runs live against OpenRouter and Exa (API keys required). For each prompt and
+mode it reports LLM round trips, Exa calls, wall time and approved companies,
+using the spans recorded by common/tracing.py.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "find-companies"))
+import headhunter
+from common.tracing import load_spans
+
+MODES = ["loop", "plan"]
+DEFAULT_PROMPTS = [
+    "Developer tools startups that might give credits to hackathon participants",
+    "Cloud infrastructure companies with university programs",
+]
+
+
+def run_mode(prompt: str, mode: str) -> dict:
+    before = len(load_spans())
+    started = time.perf_counter()
+    companies = headhunter.discover_companies(prompt, mode=mode)
+    elapsed = time.perf_counter() - started
+    spans = load_spans()[before:]
+    return {
+        "llm_turns": sum(1 for s in spans if s["stage"] in ("agent", "plan")),
+        "llm_calls": sum(1 for s in spans if s["operation"].startswith("chat.")),
+        "exa_calls": sum(1 for s in spans if s["operation"].startswith("exa.")),
+        "seconds": elapsed,
+        "approved": len(companies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark discovery agent modes")
+    parser.add_argument("prompts", nargs="*", default=DEFAULT_PROMPTS)
+    args = parser.parse_args()
+    
+    rows = []
+    for prompt in args.prompts:
+        for mode in MODES:
+            rows.append((prompt, mode, run_mode(prompt, mode)))
+    
+    print(f"\n{'Prompt':<40}{'Mode':<6}{'Turns':>7}{'LLM':>6}{'Exa':>6}{'Seconds':>9}{'Approved':>10}")
+    for prompt, mode, r in rows:
+        print(f"{prompt[:38]:<40}{mode:<6}{r['llm_turns']:>7}{r['llm_calls']:>6}{r['exa_calls']:>6}{r['seconds']:>9.1f}{r['approved']:>10}")
+
+
+if __name__ == "__main__":
+    main()
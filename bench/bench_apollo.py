@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark email enrichment against the local Apollo stub.
+
+    python bench/bench_apollo.py [--contacts 300] [--latency 0.2] [--throttle-rate 0.05]
+
+Enriches the same synthetic contacts one person per request, in sequential
+batches of 10, and in concurrent batches of 10, then repeats the last run to
+show the match cache and negative cache. Reports requests, wall time, emails
+found and lookups skipped. No API key or
+network access needed.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from apollo_stub import start_stub
+from common.apollo import ApolloEnricher
+from common.cache import DiskCache
+from common.negative_cache import NegativeCache
+
+CONFIGS = [
+    ("1 per request", 1, 1),
+    ("batches of 10", 10, 1),
+    ("batches of 10 x3", 10, 3),
+]
+
+
+def synthetic_contacts(count: int) -> list[dict]:
+    return [
+        {
+            "Company": f"Company {i % 40}",
+            "Domain": f"company{i % 40}.com",
+            "Name": f"Alex{chr(97 + i % 26)} Rivera{chr(97 + i // 26 % 26)}",
+            "Title": "Developer Advocate",
+            "LinkedIn": f"https://www.linkedin.com/in/person-{i}",
+            "Email": "",
+        }
+        for i in range(count)
+    ]
+
+
+def run(base_url: str, batch_size: int, workers: int, contacts: int, cache: DiskCache | None = None,
+        negative: NegativeCache | None = None) -> tuple[dict, float, int]:
+    enricher = ApolloEnricher(
+        "stub-key", base_url=base_url, batch_size=batch_size, max_workers=workers, cache=cache, negative=negative
+    )
+    rows = synthetic_contacts(contacts)
+    started = time.perf_counter()
+    enricher.enrich(rows)
+    return enricher.stats, time.perf_counter() - started, sum(1 for r in rows if r["Email"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Apollo email enrichment against a local stub")
+    parser.add_argument("--contacts", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub seconds per request (default: 0.2)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of stub requests answered with 429")
+    args = parser.parse_args()
+
+    server, base_url = start_stub(latency=args.latency, throttle_rate=args.throttle_rate)
+    print(f"{args.contacts} contacts, stub latency {args.latency * 1000:.0f} ms\n")
+    print(f"   {'Mode':<22}{'Requests':>10}{'Seconds':>10}{'Emails':>8}{'Cached':>8}{'No match':>10}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DiskCache("apollo_bench", path=os.path.join(tmp, "apollo.sqlite"))
+            negative = NegativeCache(DiskCache("apollo_bench_negative", path=os.path.join(tmp, "negative.sqlite")))
+            runs = [(label, batch_size, workers, index == len(CONFIGS) - 1) for index, (label, batch_size, workers) in enumerate(CONFIGS)]
+            runs.append(("rerun (cache)", 10, 3, True))
+            for label, batch_size, workers, cached in runs:
+                stats, elapsed, emails = run(
+                    base_url, batch_size, workers, args.contacts, cache if cached else None, negative if cached else None
+                )
+                print(
+                    f"   {label:<22}{stats['requests']:>10}{elapsed:>10.2f}{emails:>8}"
+                    f"{stats['cached']:>8}{stats['known_missing']:>10}"
+                )
+            cache.close()
+            negative.cache.close()
+    finally:
+        server.shutdown()
+    print(f"\n   Stub saw {server.state.requests} requests, {server.state.throttled} throttled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compare reading contacts from CSV and Parquet.
+
+    python bench/bench_columnar.py [--count 200000]
+
+Writes the same synthetic LinkedIn-export-style contacts (wide rows with long
+summary columns) as CSV and Parquet, then times emailer.iter_contacts over
+each with the column projection a simple template needs, reporting wall time
+and peak traced memory. Requires the parquet extra (pyarrow).
+"""
+
+import os
+import sys
+import csv
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "request-sponsorship"))
+import emailer
+from common.columnar import require_pyarrow
+
+TEMPLATE = "Subject: Sponsoring our hackathon\n\nHi {first_name},\n\n{{a line about {company}'s work}}\n"
+COLUMNS = [
+    "First Name (Linkedin)", "Last Name (Linkedin)", "Full Name (Linkedin)", "Company",
+    "Job Title (Linkedin)", "Headline (Linkedin)", "Location (Linkedin)", "summary (Linkedin)",
+    "Company Description (Linkedin)", "Company Industry (Linkedin)", "LinkedIn Profile Url",
+    "Email (FullEnrich)", "Phone (FullEnrich)", "Skills (Linkedin)", "Experience (Linkedin)",
+]
+
+
+def synthetic_rows(count: int):
+    rng = random.Random(7)
+    filler = "Building developer tools and communities. " * 12
+    for i in range(count):
+        first, last = f"First{i}", f"Last{i}"
+        yield {
+            "First Name (Linkedin)": first,
+            "Last Name (Linkedin)": last,
+            "Full Name (Linkedin)": f"{first} {last}",
+            "Company": f"Company{rng.randrange(5000)}",
+            "Job Title (Linkedin)": rng.choice(["Developer Advocate", "CTO", "Software Engineer", "Recruiter"]),
+            "Headline (Linkedin)": "Helping developers ship faster",
+            "Location (Linkedin)": "San Francisco, CA",
+            "summary (Linkedin)": filler,
+            "Company Description (Linkedin)": filler,
+            "Company Industry (Linkedin)": "Software Development",
+            "LinkedIn Profile Url": f"https://linkedin.com/in/person{i}",
+            "Email (FullEnrich)": f"person{i}@example.com",
+            "Phone (FullEnrich)": "",
+            "Skills (Linkedin)": "Python, Go, Kubernetes, Public Speaking",
+            "Experience (Linkedin)": filler,
+        }
+
+
+def measure(path: str, columns: set[str]) -> tuple[int, float, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = sum(1 for _ in emailer.iter_contacts(path, columns=columns))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare reading contacts from CSV and Parquet")
+    parser.add_argument("--count", type=int, default=200_000, help="Synthetic contacts (default: 200000)")
+    args = parser.parse_args()
+    pa, pq = require_pyarrow()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "contacts.csv")
+        parquet_path = os.path.join(tmp, "contacts.parquet")
+        rows = list(synthetic_rows(args.count))
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        pq.write_table(pa.Table.from_pylist(rows), parquet_path, compression="zstd")
+        del rows
+
+        columns = emailer.template_columns(TEMPLATE)
+        print(f"{args.count:,} contacts, {len(COLUMNS)} columns, template reads {len(columns)} column names\n")
+        print(f"   {'Format':<10}{'Size MB':>10}{'Rows':>10}{'Seconds':>10}{'Peak MB':>10}")
+        for label, path in (("CSV", csv_path), ("Parquet", parquet_path)):
+            size = os.path.getsize(path) / 1024 / 1024
+            count, elapsed, peak = measure(path, columns)
+            print(f"   {label:<10}{size:>10.1f}{count:>10,}{elapsed:>10.2f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
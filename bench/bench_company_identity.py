@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark company identity lookups as the index grows.
+
+    python bench/bench_company_identity.py [--sizes 1000,10000,50000]
+
+Fills a temporary index with synthetic companies, then times match() for
+near-duplicates (same brand on another TLD, name with a legal suffix) and
+for unrelated names. With blocking, lookup time should stay flat as the
+index grows instead of scaling with its size.
+"""
+
+import os
+import sys
+import time
+import random
+import string
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.company_identity import CompanyIndex
+
+LOOKUPS = 2000
+
+
+def brand(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark company identity lookups")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated index sizes")
+    args = parser.parse_args()
+
+    print(f"   {'Companies':>10}{'Build s':>10}{'Dup µs':>10}{'New µs':>10}{'Dup found':>11}{'Max block':>11}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        rng = random.Random(size)
+        brands = [brand(rng) for _ in range(size)]
+        with tempfile.TemporaryDirectory() as tmp:
+            started = time.perf_counter()
+            index = CompanyIndex(os.path.join(tmp, "index.jsonl"))
+            for name in brands:
+                index.resolve(f"{name}.com", f"{name.title()} - The platform for teams")
+            build = time.perf_counter() - started
+
+            sample = rng.sample(brands, min(LOOKUPS, size))
+            started = time.perf_counter()
+            found = sum(1 for name in sample if index.match(f"{name}.io", f"{name.title()} Inc.")[1] >= index.threshold)
+            dup_us = (time.perf_counter() - started) / len(sample) * 1e6
+
+            strangers = [brand(rng) + "zq" for _ in sample]
+            started = time.perf_counter()
+            for name in strangers:
+                index.match(f"{name}.dev", name.title())
+            new_us = (time.perf_counter() - started) / len(strangers) * 1e6
+
+            largest = max(len(block) for block in index.blocks.values())
+            print(f"   {size:>10,}{build:>10.2f}{dup_us:>10.0f}{new_us:>10.0f}{found / len(sample):>10.0%}{largest:>11}")
+
+
+if __name__ == "__main__":
+    main()
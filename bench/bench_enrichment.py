@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark LinkedIn enrichment strategies: API calls vs role coverage.
+
+Record live Exa results once for a saved search, then replay them offline:
+
+    python bench/bench_enrichment.py record find-companies/searches/<search>.json recording.json
+    python bench/bench_enrichment.py replay recording.json
+
+Replay runs every strategy in headhunter.enrichment_queries against the same
+recorded responses and compares calls, contacts and target-role coverage.
+Only profiles whose headline names the company count as coverage; people at
+other companies that a search returned are reported separately ("Elsewhere").
+"""
+
+import os
+import sys
+import json
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "find-companies"))
+import headhunter
+
+STRATEGIES = ["per_role", "broad"]
+
+
+def record(search_file: str, output_file: str) -> None:
+    """Run every strategy's queries live and save the raw results."""
+    with open(search_file, 'r') as f:
+        companies = json.load(f).get("companies", [])
+    
+    exa = headhunter.Exa(headhunter.EXA_API_KEY)
+    recording = {"companies": [], "queries": {}}
+    
+    for company in companies:
+        name = company.get("title", company.get("domain", ""))
+        domain = company.get("domain", "")
+        if not domain:
+            continue
+        recording["companies"].append({"name": name, "domain": domain})
+        for strategy in STRATEGIES:
+            for query, num_results in headhunter.enrichment_queries(name, strategy):
+                if query in recording["queries"]:
+                    continue
+                print(f"🔎 {query[:70]}")
+                response = headhunter.call_with_retry(
+                    "exa", exa.search, query=query, num_results=num_results, type="neural", category="people"
+                )
+                recording["queries"][query] = [{"url": r.url, "title": r.title or ""} for r in response.results]
+    
+    with open(output_file, 'w') as f:
+        json.dump(recording, f, indent=2)
+    print(f"\n💾 Recorded {len(recording['queries'])} queries for {len(recording['companies'])} companies to {output_file}")
+
+
+def replay(recording_file: str) -> dict[str, dict]:
+    """Score each strategy against the recorded responses."""
+    with open(recording_file, 'r') as f:
+        recording = json.load(f)
+    
+    report = {}
+    for strategy in STRATEGIES:
+        calls = 0
+        contacts = 0
+        matched = 0
+        roles_covered = 0
+        companies_covered = 0
+        elsewhere = 0
+        for company in recording["companies"]:
+            name, domain = company["name"], company["domain"]
+            keys = headhunter.company_keys(name, domain)
+            seen = set()
+            found = []
+            for query, _ in headhunter.enrichment_queries(name, strategy):
+                calls += 1
+                for result in recording["queries"].get(query, []):
+                    if "linkedin.com/in/" in result["url"] and result["url"] not in seen:
+                        seen.add(result["url"])
+                        contact = headhunter.parse_contact(result["url"], result["title"], name, domain)
+                        contact["_headline"] = result["title"]
+                        elsewhere += not headhunter.mentions_company(result["title"], keys)
+                        found.append(contact)
+            ranked = headhunter.rank_contacts(found, name, domain)
+            roles = {c["Role Match"] for c in ranked if c["Role Match"]}
+            contacts += len(ranked)
+            matched += sum(1 for c in ranked if c["Role Match"])
+            roles_covered += len(roles)
+            companies_covered += bool(roles)
+        
+        report[strategy] = {
+            "calls": calls,
+            "contacts": contacts,
+            "matched_contacts": matched,
+            "target_roles": roles_covered,
+            "companies_with_match": companies_covered,
+            "elsewhere": elsewhere,
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare enrichment strategies on recorded Exa data")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="Record live Exa people searches for a saved search")
+    rec.add_argument("search_file")
+    rec.add_argument("output_file")
+    rep = sub.add_parser("replay", help="Compare strategies on a recording")
+    rep.add_argument("recording_file")
+    args = parser.parse_args()
+    
+    if args.command == "record":
+        record(args.search_file, args.output_file)
+        return
+    
+    report = replay(args.recording_file)
+    print(f"\n{'Strategy':<10}{'Calls':>8}{'Contacts':>10}{'Matched':>9}{'Roles':>7}{'Companies':>11}{'Elsewhere':>11}")
+    for strategy, r in report.items():
+        print(f"{strategy:<10}{r['calls']:>8}{r['contacts']:>10}{r['matched_contacts']:>9}{r['target_roles']:>7}"
+              f"{r['companies_with_match']:>11}{r['elsewhere']:>11}")
+    base, new = report["per_role"], report["broad"]
+    if new["calls"]:
+        print(f"\nbroad uses {base['calls'] / new['calls']:.1f}x fewer calls, "
+              f"covering {new['target_roles']} target roles vs {base['target_roles']}")
+
+
+if __name__ == "__main__":
+    main()
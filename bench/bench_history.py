@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-text search over saved searches.
+
+    python bench/bench_history.py [--searches 3000]
+
+Writes synthetic saved searches (prompt, ~40 evaluated companies with
+rationales, a few conversation turns) to a temporary directory, times the
+initial index build, incremental updates and the top-10 queries, and
+compares queries with opening and grepping every JSON file.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.history_index import HistoryIndex
+
+TOPICS = ["observability", "developer tools", "databases", "AI infrastructure", "fintech APIs", "security", "edge compute"]
+WORDS = ["platform", "monitoring", "developers", "open source", "students", "API", "cloud", "sponsor", "hackathon", "scale"]
+# Rationales draw from a wider vocabulary so term frequencies look like real text
+VOCABULARY = WORDS + [f"{stem}{suffix}" for stem in ("data", "infra", "query", "deploy", "trace", "log", "auth", "edge",
+                      "vector", "stream", "build", "test", "ship", "team", "grant", "campus", "intern", "credit",
+                      "tool", "agent") for suffix in ("", "s", "ing", "er", "able", "ops", "base", "kit")]
+QUERIES = ["observability", "datadog", "acme7", "open source monitoring", "company123"]
+
+
+def synthetic_search(rng: random.Random, i: int) -> dict:
+    topic = rng.choice(TOPICS)
+    companies = []
+    for _ in range(40):
+        n = rng.randrange(20_000)
+        companies.append({
+            "domain": f"company{n}.com",
+            "title": f"Company{n} - {rng.choice(WORDS)} for {rng.choice(WORDS)}",
+            "rationale": " ".join(rng.choice(VOCABULARY) for _ in range(20)),
+            "confidence": rng.choice(["high", "medium"]),
+        })
+    if i % 50 == 0:
+        companies.append({"domain": "datadoghq.com", "title": "Datadog", "rationale": "Observability leader, big on hackathons"})
+    return {
+        "initial_prompt": f"Find {topic} companies that sponsor student hackathons (run {i})",
+        "timestamp": f"2026-01-01T00:{i % 60:02d}:00",
+        "company_count": len(companies),
+        "companies": companies,
+        "conversation": [
+            {"role": "user", "content": "initial"},
+            {"role": "user", "content": f"more {rng.choice(TOPICS)} please, fewer enterprise vendors"},
+            {"role": "assistant", "content": " ".join(rng.choice(VOCABULARY) for _ in range(30))},
+        ],
+    }
+
+
+def grep_all(directory: str, query: str) -> int:
+    hits = 0
+    for name in os.listdir(directory):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name)) as f:
+                hits += query.lower() in json.dumps(json.load(f)).lower()
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-text search over saved searches")
+    parser.add_argument("--searches", type=int, default=3000, help="Synthetic saved searches (default: 3000)")
+    args = parser.parse_args()
+    rng = random.Random(11)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.searches):
+            with open(os.path.join(tmp, f"search_{i:05d}.json"), "w") as f:
+                json.dump(synthetic_search(rng, i), f)
+
+        index = HistoryIndex(tmp)
+        started = time.perf_counter()
+        index.sync()
+        print(f"{args.searches:,} saved searches, initial index build {time.perf_counter() - started:.2f}s")
+
+        started = time.perf_counter()
+        index.sync()
+        print(f"   Sync with nothing changed: {(time.perf_counter() - started) * 1000:.1f} ms")
+        with open(os.path.join(tmp, f"search_{args.searches:05d}.json"), "w") as f:
+            json.dump(synthetic_search(rng, args.searches), f)
+        started = time.perf_counter()
+        index.sync()
+        print(f"   Sync after one new file: {(time.perf_counter() - started) * 1000:.1f} ms")
+        started = time.perf_counter()
+        index.update_file(os.path.join(tmp, "search_00001.json"))
+        print(f"   Reindex one file (what save_search_results does): {(time.perf_counter() - started) * 1000:.1f} ms\n")
+
+        print(f"   {'Query':<26}{'Top hits':>9}{'Index ms':>10}{'Grep ms':>10}")
+        for query in QUERIES:
+            started = time.perf_counter()
+            hits = index.search(query)
+            index_ms = (time.perf_counter() - started) * 1000
+            started = time.perf_counter()
+            grep_all(tmp, query)
+            grep_ms = (time.perf_counter() - started) * 1000
+            print(f"   {query:<26}{len(hits):>9}{index_ms:>10.1f}{grep_ms:>10.0f}")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
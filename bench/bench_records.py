@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark slotted records against the dicts they replace.
+
+    python bench/bench_records.py [--count 100000] [--companies 10000]
+
+Writes synthetic headhunter contacts (sponsor_contacts.csv columns) and
+compares holding them all in memory as csv.DictReader dicts, as Contacts
+built from those dicts, and as Contacts from read_contacts(), reporting
+retained and peak traced memory and read time, then the write time of
+csv.DictWriter against write_contacts(). Finally compares search results
+plus approved verdicts as dicts (the approved dict copies the company's
+fields) against Company and Evaluation records sharing one Company.
+"""
+
+import os
+import sys
+import csv
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.records import Company, Evaluation, Contact, CONTACT_FIELDS, read_contacts, write_contacts
+
+TITLES = ["Developer Advocate", "Head of Developer Relations", "CTO", "University Recruiter", "VP Engineering"]
+
+
+def synthetic_rows(count: int):
+    rng = random.Random(5)
+    for i in range(count):
+        n = rng.randrange(5000)
+        title = rng.choice(TITLES)
+        yield {
+            "Company": f"Company{n}",
+            "Domain": f"company{n}.com",
+            "Name": f"First{i} Last{i}",
+            "Title": title,
+            "LinkedIn": f"https://www.linkedin.com/in/person{i}",
+            "Email": f"person{i}@company{n}.com" if i % 3 else "",
+            "Role Match": title,
+            "Role Score": f"{rng.random():.2f}",
+        }
+
+
+def measure(build) -> tuple[int, float, float, float]:
+    """(records, seconds, retained MB, peak MB) for building a list with build()."""
+    started = time.perf_counter()
+    count = len(build())
+    elapsed = time.perf_counter() - started  # timed untraced: tracemalloc slows every allocation
+    tracemalloc.start()
+    records = build()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return count, elapsed, retained / 1024 / 1024, peak / 1024 / 1024
+
+
+def read_dicts(path: str) -> list[dict]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def company_dicts(count: int) -> list[dict]:
+    found, approved = [], []
+    for i in range(count):
+        company = {"domain": f"company{i}.com", "title": f"Company{i} - Developer platform", "url": f"https://company{i}.com/"}
+        found.append(company)
+        approved.append({**company, "rationale": "Known for student developer programs", "confidence": "high"})
+    return found + approved
+
+
+def company_records(count: int) -> list:
+    found, approved = [], []
+    for i in range(count):
+        company = Company(f"company{i}.com", f"Company{i} - Developer platform", f"https://company{i}.com/")
+        found.append(company)
+        approved.append(Evaluation(company, True, "Known for student developer programs", "high"))
+    return found + approved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark slotted records against dicts")
+    parser.add_argument("--count", type=int, default=100_000, help="Synthetic contacts (default: 100000)")
+    parser.add_argument("--companies", type=int, default=10_000, help="Synthetic companies (default: 10000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "contacts.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CONTACT_FIELDS)
+            writer.writeheader()
+            writer.writerows(synthetic_rows(args.count))
+
+        print(f"{args.count:,} contacts held in memory\n")
+        print(f"   {'Representation':<30}{'Seconds':>9}{'Kept MB':>9}{'Peak MB':>9}{'B/contact':>11}")
+        for label, build in (
+            ("DictReader rows", lambda: read_dicts(path)),
+            ("Contact.from_row(row)", lambda: [Contact.from_row(row) for row in read_dicts(path)]),
+            ("read_contacts()", lambda: list(read_contacts(path))),
+        ):
+            count, elapsed, retained, peak = measure(build)
+            per_contact = retained * 1024 * 1024 / count
+            print(f"   {label:<30}{elapsed:>9.2f}{retained:>9.1f}{peak:>9.1f}{per_contact:>11.0f}")
+        contacts = list(read_contacts(path))
+
+        out = os.path.join(tmp, "out.csv")
+        started = time.perf_counter()
+        with open(out, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CONTACT_FIELDS)
+            writer.writeheader()
+            writer.writerows(contact.to_row() for contact in contacts)
+        dict_write = time.perf_counter() - started
+        started = time.perf_counter()
+        write_contacts(out, contacts)
+        print(f"\n   Write: DictWriter(to_row()) {dict_write:.2f}s, write_contacts() {time.perf_counter() - started:.2f}s")
+
+    print(f"\n{args.companies:,} search results plus an approved verdict for each\n")
+    print(f"   {'Representation':<30}{'Seconds':>9}{'Kept MB':>9}{'Peak MB':>9}")
+    for label, build in (
+        ("dicts (verdict copies company)", lambda: company_dicts(args.companies)),
+        ("Company + Evaluation", lambda: company_records(args.companies)),
+    ):
+        _, elapsed, retained, peak = measure(build)
+        print(f"   {label:<30}{elapsed:>9.2f}{retained:>9.1f}{peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup time.
+
+    python bench/bench_startup.py [--runs 20] [--budget-ms 100]
+
+Runs each command in a fresh interpreter and reports median and p95 wall
+time, flagging fast commands that exceed the budget. Also lists the slowest
+imports of `main.py --help` from -X importtime, to catch a heavy dependency
+sneaking into the top-level import path.
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.tracing import percentile
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+MAIN = os.path.join(PROJECT_ROOT, "main.py")
+
+# Commands that must stay under the budget: they never load a subsystem
+FAST_COMMANDS = [
+    ["--help"],
+    ["enrich", "--help"],
+    ["bench"],
+    ["daemon", "status"],  # thin client: must not import the server's dependencies
+]
+# Reported for comparison; these import OpenAI/Exa/pandas by design
+SLOW_COMMANDS = [
+    ["email", "--help"],
+    ["pipeline", "--help"],
+]
+
+
+def time_command(args: list[str], runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, MAIN, *args], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def slowest_imports(args: list[str], top: int = 8) -> list[tuple[int, str]]:
+    """(cumulative µs, module) for the slowest imports of one run."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN, *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        rows.append((int(parts[1]), parts[2].strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per command (default: 20)")
+    parser.add_argument("--budget-ms", type=float, default=100, help="Budget for fast commands (default: 100)")
+    args = parser.parse_args()
+
+    baseline = []
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"])
+        baseline.append((time.perf_counter() - started) * 1000)
+    print(f"Bare interpreter: median {percentile(baseline, 50):.1f} ms\n")
+
+    print(f"   {'Command':<28}{'median ms':>11}{'p95 ms':>9}")
+    over_budget = False
+    for command in FAST_COMMANDS + SLOW_COMMANDS:
+        timings = time_command(command, args.runs)
+        median = percentile(timings, 50)
+        flag = ""
+        if command in FAST_COMMANDS:
+            flag = "✅" if median < args.budget_ms else "❌ over budget"
+            over_budget |= median >= args.budget_ms
+        print(f"   {' '.join(command):<28}{median:>11.1f}{percentile(timings, 95):>9.1f}  {flag}")
+
+    print("\nSlowest imports for `main.py --help` (cumulative):")
+    for micros, module in slowest_imports(["--help"]):
+        print(f"   {micros / 1000:>7.1f} ms  {module}")
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
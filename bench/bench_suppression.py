@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark suppression list build and lookup.
+
+    python bench/bench_suppression.py [--size 500000] [--checks 200000]
+
+Builds a suppression list of synthetic addresses in a temporary directory,
+then checks a mix of suppressed and clean contacts, reporting build time,
+on-disk size, lookups per second, the bloom filter's false-positive rate and
+the memory the loaded list holds.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.suppression import SuppressionList, entry_key, _digest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suppression list build and lookup")
+    parser.add_argument("--size", type=int, default=500_000, help="Suppressed addresses (default: 500000)")
+    parser.add_argument("--checks", type=int, default=200_000, help="Lookups to time (default: 200000)")
+    parser.add_argument("--hit-rate", type=float, default=0.05, help="Share of lookups that are suppressed (default: 0.05)")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    suppressed = [f"user{i}@company{i % 9000}.com" for i in range(args.size)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        suppression = SuppressionList(tmp)
+        suppression.add(suppressed, reason="bench")
+        build = time.perf_counter() - started
+        size = (suppression.index_file.stat().st_size + suppression.bloom_file.stat().st_size) / 1024 / 1024
+
+        tracemalloc.start()
+        loaded = SuppressionList(tmp)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        lookups = [
+            rng.choice(suppressed) if rng.random() < args.hit_rate else f"someone{i}@elsewhere{i % 500}.org"
+            for i in range(args.checks)
+        ]
+        started = time.perf_counter()
+        hits = sum(1 for email in lookups if loaded.is_suppressed(email))
+        elapsed = time.perf_counter() - started
+
+        clean = [f"fresh{i}@elsewhere.org" for i in range(50_000)]
+        false_positives = sum(1 for email in clean if loaded._might_contain(_digest(entry_key(email))))
+
+    print(f"Suppressed keys:   {len(suppressed):,}")
+    print(f"Build:             {build:.2f} s")
+    print(f"Index + bloom:     {size:.1f} MB on disk, {peak / 1024 / 1024:.1f} MB held in memory")
+    print(f"Lookups:           {args.checks:,} in {elapsed:.2f} s ({args.checks / elapsed:,.0f}/s, {elapsed / args.checks * 1e6:.1f} µs each)")
+    print(f"Suppressed hits:   {hits:,}")
+    print(f"Bloom false pos.:  {false_positives / len(clean):.2%} (each one costs a binary search, never a wrong answer)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk title classification.
+
+    python bench/bench_titles.py [--count 100000]
+
+Builds synthetic LinkedIn-style headlines mixing target roles, unrelated
+roles and noise, then times TitleMatcher.score_many over all of them.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.titles import TARGET_TITLES, TitleMatcher
+
+ROLES = [
+    "Developer Advocate", "Senior Developer Relations Engineer", "Head of DevRel",
+    "University Recruiter", "Campus Recruiting Lead", "Co-Founder & CTO", "Founder",
+    "VP of Engineering", "Partnerships Manager", "Sponsorship Coordinator",
+    "Software Engineer", "Account Executive", "Product Designer", "Sales Development Rep",
+    "Data Scientist", "Former CTO", "Recruiting Intern", "Marketing Manager",
+]
+COMPANIES = ["Vercel", "Stripe", "Datadog", "Cloudflare", "Twilio", "MongoDB", "Supabase"]
+NOISE = ["", " | LinkedIn", " | Building the future of dev tools", " - Ex-Google, ex-Meta"]
+
+
+def synthetic_titles(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"Person {i} - {rng.choice(ROLES)} - {rng.choice(COMPANIES)}{rng.choice(NOISE)}"
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time bulk title classification")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    
+    titles = synthetic_titles(args.count)
+    
+    t0 = time.perf_counter()
+    matcher = TitleMatcher(TARGET_TITLES)
+    build_ms = (time.perf_counter() - t0) * 1000
+    
+    t0 = time.perf_counter()
+    scores = matcher.score_many(titles)
+    score_ms = (time.perf_counter() - t0) * 1000
+    
+    kept = sum(1 for _, score in scores if score > 0)
+    print(f"Matcher build:   {build_ms:.2f} ms")
+    print(f"Scored {len(titles):,} titles in {score_ms:.1f} ms ({score_ms * 1000 / len(titles):.2f} µs/title)")
+    print(f"Relevant:        {kept:,} ({kept / len(titles):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Helpers shared by find-companies/headhunter.py and request-sponsorship/emailer.py."""
@@ -0,0 +1,173 @@
+"""
+Email enrichment through Apollo's bulk people match endpoint.
+
+Contacts are matched up to BATCH_SIZE per request (Apollo's limit for
+/people/bulk_match), with a few batches in flight at once. Every request goes
+through call_with_retry, and matched emails are cached on disk so a contact is
+only ever paid for once. People Apollo has no email for go to the negative
+cache, which keeps them out of lookups for a couple of weeks.
+
+Point APOLLO_BASE_URL at bench/apollo_stub.py to run without a real key.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from common.cache import DiskCache, make_key
+from common.negative_cache import NegativeCache, get_negative_cache
+from common.resilience import call_with_retry
+from common.tracing import trace_span
+
+APOLLO_BASE_URL = os.getenv("APOLLO_BASE_URL", "https://api.apollo.io")
+BULK_MATCH_PATH = "/api/v1/people/bulk_match"
+BATCH_SIZE = 10
+MAX_WORKERS = 3
+REQUEST_TIMEOUT = 30
+MATCH_TTL = 30 * 24 * 3600  # people change jobs; re-check after a month
+
+# Apollo returns placeholders like "email_not_unlocked@domain.com" for locked emails
+LOCKED_EMAIL_MARKERS = ("email_not_unlocked", "not_unlocked")
+
+
+def match_details(contact: dict) -> dict:
+    """Apollo match fields for a contact row (headhunter/Contact schema)."""
+    name = (contact.get("Name") or "").strip()
+    first, _, last = name.partition(" ")
+    details = {
+        "name": name,
+        "first_name": first,
+        "last_name": last,
+        "organization_name": contact.get("Company", ""),
+        "domain": contact.get("Domain", ""),
+        "linkedin_url": contact.get("LinkedIn", ""),
+    }
+    return {k: v for k, v in details.items() if v}
+
+
+def match_key(contact: dict) -> str:
+    """Cache key: the LinkedIn URL when there is one, else name + company domain."""
+    linkedin = (contact.get("LinkedIn") or "").strip().lower().rstrip("/")
+    if linkedin:
+        return make_key("apollo_match", linkedin)
+    return make_key("apollo_match", (contact.get("Name") or "").lower(), (contact.get("Domain") or "").lower())
+
+
+def usable_email(match: dict | None) -> str:
+    email = ((match or {}).get("email") or "").strip()
+    if not email or any(marker in email for marker in LOCKED_EMAIL_MARKERS):
+        return ""
+    return email
+
+
+class ApolloEnricher:
+    """Fills in the Email field of contact rows using batched Apollo lookups."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = APOLLO_BASE_URL,
+        batch_size: int = BATCH_SIZE,
+        max_workers: int = MAX_WORKERS,
+        cache: DiskCache | None = None,
+        negative: NegativeCache | None = None
+    ):
+        self.api_key = api_key
+        self.url = base_url.rstrip("/") + BULK_MATCH_PATH
+        self.batch_size = max(1, min(batch_size, BATCH_SIZE))
+        self.max_workers = max_workers
+        self.cache = cache
+        self.negative = negative
+        self.session = requests.Session()
+        self.session.headers.update({
+            "X-Api-Key": api_key,
+            "Content-Type": "application/json",
+            "Cache-Control": "no-cache",
+        })
+        self.stats = {"requests": 0, "looked_up": 0, "matched": 0, "cached": 0, "known_missing": 0, "failed_batches": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, **amounts) -> None:
+        with self._lock:
+            for key, amount in amounts.items():
+                self.stats[key] += amount
+
+    def _post(self, payload: dict) -> dict:
+        response = self.session.post(self.url, json=payload, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()  # HTTPError carries the status for call_with_retry
+        return response.json()
+
+    def match_batch(self, contacts: list[dict]) -> list[str]:
+        """Emails for up to batch_size contacts, in order ("" where Apollo has none)."""
+        payload = {"details": [match_details(c) for c in contacts], "reveal_personal_emails": False}
+        with trace_span("email_enrichment", "apollo.bulk_match", contacts=len(contacts)) as span:
+            data = call_with_retry("apollo", self._post, payload, span=span)
+            span.attrs["credits"] = data.get("credits_consumed")
+        self._count(requests=1, looked_up=len(contacts))
+        matches = data.get("matches") or []
+        return [usable_email(matches[i] if i < len(matches) else None) for i in range(len(contacts))]
+
+    def enrich(self, contacts: list[dict]) -> list[dict]:
+        """
+        Set "Email" on every contact Apollo can match, in place; contacts that
+        already have one are left alone. A batch that fails after retries
+        leaves its contacts without email. Returns the same list.
+        """
+        pending = []
+        for contact in contacts:
+            if contact.get("Email"):
+                continue
+            cached = self.cache.get(match_key(contact)) if self.cache is not None else None
+            if cached:
+                contact["Email"] = cached
+                self._count(cached=1)
+            elif self.negative is not None and self.negative.is_known_empty("apollo", match_key(contact)):
+                self._count(known_missing=1)
+            else:
+                pending.append(contact)
+
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        if not batches:
+            return contacts
+
+        def run(batch: list[dict]) -> None:
+            try:
+                emails = self.match_batch(batch)
+            except Exception as e:
+                print(f"   ⚠️ Apollo lookup failed for {len(batch)} contacts: {e}")
+                self._count(failed_batches=1)
+                return
+            for contact, email in zip(batch, emails):
+                if email:
+                    contact["Email"] = email
+                    self._count(matched=1)
+                    if self.cache is not None:
+                        self.cache.set(match_key(contact), email, ttl=MATCH_TTL)
+                elif self.negative is not None:
+                    self.negative.record_empty("apollo", match_key(contact))
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            list(pool.map(run, batches))
+        return contacts
+
+
+_enricher = None
+_enricher_lock = threading.Lock()
+
+
+def get_enricher(api_key: str | None = None) -> ApolloEnricher | None:
+    """Shared enricher for the configured APOLLO_API_KEY, or None if no key is set."""
+    global _enricher
+    api_key = api_key or os.getenv("APOLLO_API_KEY", "")
+    if not api_key or api_key == "YOUR_APOLLO_KEY":
+        return None
+    with _enricher_lock:
+        if _enricher is None or _enricher.api_key != api_key:
+            _enricher = ApolloEnricher(
+                api_key,
+                cache=DiskCache("apollo_match", max_entries=200_000),
+                negative=get_negative_cache()
+            )
+        return _enricher
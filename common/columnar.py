@@ -0,0 +1,185 @@
+"""
+Columnar (Parquet) export and import of outreach history.
+
+Saved searches are pretty-printed JSON and contacts and drafts are CSV, so
+analysing months of them means re-parsing everything. export_history()
+flattens them into four Parquet tables (companies, evaluations, contacts,
+drafts) that load column by column; iter_parquet_rows() lets the emailer
+read Parquet contact files reading only the columns a template needs.
+
+pyarrow is optional and only imported when one of these functions runs.
+"""
+
+import os
+import json
+import glob
+from pathlib import Path
+
+from common.contacts import read_contacts
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SEARCHES_DIR = PROJECT_ROOT / "find-companies" / "searches"
+DRAFTS_DIR = PROJECT_ROOT / "request-sponsorship"
+DEFAULT_EXPORT_DIR = PROJECT_ROOT / "exports"
+
+# (column, type) per table; types are pyarrow factory names
+TABLES = {
+    "companies": [
+        ("search_file", "string"), ("prompt", "string"), ("searched_at", "string"),
+        ("domain", "string"), ("title", "string"), ("url", "string"),
+    ],
+    "evaluations": [
+        ("search_file", "string"), ("domain", "string"), ("confidence", "string"), ("rationale", "string"),
+    ],
+    "contacts": [
+        ("source_file", "string"), ("Company", "string"), ("Domain", "string"), ("Name", "string"),
+        ("Title", "string"), ("LinkedIn", "string"), ("Email", "string"),
+        ("Role Match", "string"), ("Role Score", "float64"),
+    ],
+    "drafts": [
+        ("source_file", "string"), ("action", "string"), ("email", "string"), ("name", "string"),
+        ("company", "string"), ("subject", "string"), ("body", "string"), ("timestamp", "string"),
+    ],
+}
+
+
+def require_pyarrow():
+    """Import pyarrow and pyarrow.parquet, or explain how to get them."""
+    try:
+        import pyarrow
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet support needs pyarrow, which moneyprinter doesn't install by default. "
+            "Install the parquet extra with `uv sync --extra parquet` (or `pip install -e .[parquet]`)."
+        ) from e
+    return pyarrow, pq
+
+
+def is_parquet(path) -> bool:
+    return str(path).lower().endswith((".parquet", ".pq"))
+
+
+def table_schema(name: str):
+    pa, _ = require_pyarrow()
+    return pa.schema([(column, getattr(pa, kind)()) for column, kind in TABLES[name]])
+
+
+def write_table(name: str, rows: list[dict], path) -> int:
+    """Write rows to a Parquet file with the named table's schema. Returns the row count."""
+    pa, pq = require_pyarrow()
+    schema = table_schema(name)
+    columns = {}
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if pa.types.is_floating(field.type):
+            values = [float(v) if v not in (None, "") else None for v in values]
+        else:
+            values = [None if v is None else str(v) for v in values]
+        columns[field.name] = values
+    table = pa.Table.from_pydict(columns, schema=schema)
+    pq.write_table(table, str(path), compression="zstd")
+    return table.num_rows
+
+
+def search_history_rows(searches_dir=SEARCHES_DIR) -> tuple[list[dict], list[dict]]:
+    """(companies, evaluations) rows from every saved search JSON."""
+    companies, evaluations = [], []
+    for filepath in sorted(glob.glob(os.path.join(str(searches_dir), "*.json"))):
+        try:
+            with open(filepath, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            continue
+        search_file = os.path.basename(filepath)
+        for company in data.get("companies", []):
+            domain = company.get("domain", "")
+            companies.append({
+                "search_file": search_file,
+                "prompt": data.get("initial_prompt", ""),
+                "searched_at": data.get("timestamp", ""),
+                "domain": domain,
+                "title": company.get("title", ""),
+                "url": company.get("url", ""),
+            })
+            if company.get("rationale") or company.get("confidence"):
+                evaluations.append({
+                    "search_file": search_file,
+                    "domain": domain,
+                    "confidence": company.get("confidence", ""),
+                    "rationale": company.get("rationale", ""),
+                })
+    return companies, evaluations
+
+
+def contact_rows(paths) -> list[dict]:
+    """Contact rows from headhunter or LinkedIn-export CSVs, in the shared Contact schema."""
+    rows = []
+    for path in paths:
+        source_file = os.path.basename(path)
+        rows.extend({"source_file": source_file, **contact.to_row()} for contact in read_contacts(path))
+    return rows
+
+
+def draft_rows(journal_paths) -> list[dict]:
+    """Every review decision (approved drafts and skips) from emailer journals."""
+    rows = []
+    for path in journal_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line
+                rows.append({"source_file": os.path.basename(path), **entry})
+    return rows
+
+
+def export_history(
+    out_dir=DEFAULT_EXPORT_DIR,
+    searches_dir=SEARCHES_DIR,
+    contact_files: list[str] | None = None,
+    journal_files: list[str] | None = None
+) -> dict[str, int]:
+    """
+    Write companies/evaluations/contacts/drafts .parquet files to out_dir.
+    Defaults: every saved search, sponsor_contacts.csv in the working
+    directory, and every emailer journal next to emailer.py.
+    Returns rows written per table.
+    """
+    require_pyarrow()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if contact_files is None:
+        contact_files = [p for p in ["sponsor_contacts.csv"] if os.path.exists(p)]
+    if journal_files is None:
+        journal_files = sorted(glob.glob(str(DRAFTS_DIR / "*.journal.jsonl")))
+
+    companies, evaluations = search_history_rows(searches_dir)
+    tables = {
+        "companies": companies,
+        "evaluations": evaluations,
+        "contacts": contact_rows(contact_files),
+        "drafts": draft_rows(journal_files),
+    }
+    return {name: write_table(name, rows, out_dir / f"{name}.parquet") for name, rows in tables.items()}
+
+
+def iter_parquet_rows(path, columns: set[str] | None = None, batch_size: int = 10_000):
+    """
+    Rows of a Parquet file as dicts of strings (None becomes "").
+    If columns (lowercased names) is given, only those columns are read from disk.
+    """
+    _, pq = require_pyarrow()
+    parquet_file = pq.ParquetFile(str(path))
+    names = parquet_file.schema_arrow.names
+    keep = [name for name in names if columns is None or name.lower() in columns]
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=keep):
+        for row in batch.to_pylist():
+            yield {k: "" if v is None else str(v) for k, v in row.items()}
+
+
+def load_table(name: str, export_dir=DEFAULT_EXPORT_DIR, columns: list[str] | None = None):
+    """An exported table as a pyarrow Table (call .to_pandas() for a DataFrame)."""
+    _, pq = require_pyarrow()
+    return pq.read_table(str(Path(export_dir) / f"{name}.parquet"), columns=columns)
@@ -0,0 +1,287 @@
+"""
+Company identity index: recognizes the same company behind different domains
+or names ("vercel.com" / "vercel.io", "Vercel" / "Vercel Inc.").
+
+Every company we've seen is stored as (domain, name, canonical domain) in an
+append-only .cache/company_identity.jsonl, seeded from saved searches the
+first time. A new company is compared against the index by:
+
+- domain stem: the registered label without TLD, or without a "get"/"try"-
+  style prefix when the rest is a stem we already know, so product domains
+  and TLD variants of one brand collide - but only if their names agree too
+  (delta.io is Delta Lake, delta.com an airline)
+- normalized name: lowercase, accents and legal suffixes (Inc, LLC, GmbH)
+  stripped, scored by character trigram Jaccard similarity. Bot walls and
+  error pages ("Just a moment...", "403 Forbidden") give no name.
+
+Candidates come from blocking keys (stem, name tokens, name prefix), so a
+lookup only scores the handful of entries sharing a key, not the whole
+history. Matches at or above MATCH_THRESHOLD get the existing company's
+canonical domain. split() undoes a wrong merge (`python main.py companies split`).
+"""
+
+import os
+import re
+import json
+import glob
+import threading
+import unicodedata
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+INDEX_FILE = Path(os.getenv("MONEYPRINTER_COMPANY_INDEX", PROJECT_ROOT / ".cache" / "company_identity.jsonl"))
+SEARCHES_DIR = PROJECT_ROOT / "find-companies" / "searches"
+
+MATCH_THRESHOLD = 0.8
+STEM_NAME_THRESHOLD = 0.5  # name similarity a shared domain stem still needs
+MIN_NAME_LENGTH = 4  # shorter names are too ambiguous to match on
+MAX_BLOCK_SIZE = 500  # keys shared by more entries than this carry no signal
+
+TITLE_SEPARATORS = re.compile(r"\s+[|\-–—·•]\s+|:\s+")
+GENERIC_SEGMENTS = {"home", "homepage", "welcome", "official site", "official website", "about", "about us"}
+# Login pages: dropped like generic segments, but never used as the name
+LOGIN_SEGMENTS = {"login", "log in", "sign in", "signin", "sign up", "signup", "log in or sign up", "register", "create account"}
+# Bot walls and error pages: a title with any such segment says nothing about the company
+BLOCKED_TITLE = re.compile(
+    r"just a moment|attention required|access denied|checking your browser|are you (?:a )?(?:robot|human)"
+    r"|security check|captcha|ddos protection|^(?:\d{3} )?(?:forbidden|unauthorized|bad request)$|not found$"
+    r"|too many requests|service unavailable|bad gateway|internal server error|an error occurred|^(?:error )?[45]\d\d$",
+    re.I,
+)
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "gmbh", "ag", "sa", "sas", "bv", "plc", "pty", "pbc",
+}
+# Too common to say anything about identity as blocking keys
+STOP_TOKENS = {"the", "and", "of", "for", "ai", "app", "apps", "hq", "io", "labs", "lab", "tech", "technologies",
+               "technology", "software", "systems", "platform", "cloud", "data", "group", "global"}
+MULTI_PART_TLDS = {"co.uk", "org.uk", "com.au", "co.jp", "com.br", "co.in", "co.nz", "com.sg", "co.za", "com.mx"}
+# Hosting platforms and directories: the brand is the subdomain, if there is one
+SHARED_HOSTS = {
+    "github.io", "gitlab.io", "vercel.app", "netlify.app", "herokuapp.com", "pages.dev", "webflow.io",
+    "notion.site", "substack.com", "medium.com", "wixsite.com", "framer.website", "carrd.co",
+    "linkedin.com", "crunchbase.com", "producthunt.com", "ycombinator.com", "github.com",
+}
+DOMAIN_PREFIXES = ("get", "try", "use", "join", "go")
+DOMAIN_SUFFIXES = ("hq", "app", "inc")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase ASCII words with punctuation, "the" and legal suffixes removed."""
+    name = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode().lower()
+    tokens = re.sub(r"[^a-z0-9]+", " ", name).split()
+    if tokens and tokens[0] == "the":
+        tokens = tokens[1:]
+    while tokens and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def domain_stem(domain: str, known=None) -> str:
+    """
+    Brand part of a domain: "acme.co.uk" -> "acme", "acmehq.com" -> "acme".
+    A "get"/"try"-style prefix is only stripped when what remains is in known
+    (stems already indexed): "app.getacme.io" -> "acme" once acme is known,
+    while google.com and userpilot.com keep theirs.
+    """
+    host = (domain or "").strip().lower().split("://")[-1].split("/")[0].split(":")[0].removeprefix("www.")
+    labels = host.split(".")
+    if len(labels) < 2:
+        return host
+    if ".".join(labels[-2:]) in SHARED_HOSTS:
+        if len(labels) == 2:
+            return ""
+        stem = labels[-3]
+    else:
+        tld_size = 2 if ".".join(labels[-2:]) in MULTI_PART_TLDS and len(labels) > 2 else 1
+        stem = labels[-tld_size - 1]
+    stem = re.sub(r"[^a-z0-9]", "", stem)
+    for suffix in DOMAIN_SUFFIXES:
+        if stem.endswith(suffix) and len(stem) - len(suffix) >= MIN_NAME_LENGTH:
+            stem = stem[:-len(suffix)]
+            break
+    if known:
+        for prefix in DOMAIN_PREFIXES:
+            if stem.startswith(prefix) and stem[len(prefix):] in known:
+                return stem[len(prefix):]
+    return stem
+
+
+def trigrams(text: str) -> frozenset:
+    padded = f"##{text}#"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two trigram sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def company_name(title: str, domain: str = "", known=None) -> str:
+    """
+    The company name from an Exa page title: of the title's segments
+    ("Vercel: Build and deploy..." / "Home | Acme Inc."), the one closest
+    to the domain (its stem given known, as in domain_stem), else the first
+    non-generic one. Empty for bot walls, error and login pages.
+    """
+    segments = [s.strip() for s in TITLE_SEPARATORS.split(title or "") if s.strip()]
+    if any(BLOCKED_TITLE.search(s.rstrip(".…! ")) for s in segments):
+        return ""
+    segments = [s for s in segments if s.lower().rstrip(".…! ") not in LOGIN_SEGMENTS]
+    segments = [s for s in segments if s.lower() not in GENERIC_SEGMENTS] or segments
+    if not segments:
+        return ""
+    stem = trigrams(domain_stem(domain, known)) if domain else frozenset()
+    scored = [(similarity(trigrams(normalize_name(s).replace(" ", "")), stem), -i, s) for i, s in enumerate(segments)]
+    best = max(scored)
+    return best[2] if best[0] >= 0.5 else segments[0]
+
+
+class Entry:
+    __slots__ = ("domain", "name", "canonical", "stem", "compact", "grams")
+
+    def __init__(self, domain: str, name: str, canonical: str, known_stems=None):
+        self.domain = domain
+        self.name = name
+        self.canonical = canonical
+        self.stem = domain_stem(domain, known_stems)
+        self.compact = normalize_name(name).replace(" ", "")
+        self.grams = trigrams(self.compact) if len(self.compact) >= MIN_NAME_LENGTH else frozenset()
+
+    def block_keys(self) -> set[str]:
+        keys = set()
+        if len(self.stem) >= 3:
+            keys.add(f"s:{self.stem}")
+        if self.grams:
+            keys.add(f"p:{self.compact[:4]}")
+            keys.update(f"t:{t}" for t in normalize_name(self.name).split() if len(t) >= 3 and t not in STOP_TOKENS)
+        return keys
+
+
+class CompanyIndex:
+    """Persistent fuzzy index of every company seen, mapping each domain to a canonical one."""
+
+    def __init__(self, path=INDEX_FILE, threshold: float = MATCH_THRESHOLD):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.entries = {}  # domain -> Entry
+        self.blocks = {}  # block key -> [Entry]
+        self.stems = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            self._seed_from_searches()
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                canonical = record.get("canonical") or record["domain"]
+                known = self.entries.get(record["domain"])
+                if known is not None:
+                    known.canonical = canonical  # a later split() record
+                    continue
+                self._add(Entry(record["domain"], record.get("name", ""), canonical, self.stems))
+
+    def _seed_from_searches(self) -> None:
+        """Build the index from saved searches the first time it's used."""
+        for filepath in sorted(glob.glob(str(SEARCHES_DIR / "*.json"))):
+            try:
+                with open(filepath, "r") as f:
+                    companies = json.load(f).get("companies", [])
+            except (OSError, json.JSONDecodeError):
+                continue
+            for company in companies:
+                self.resolve(company.get("domain", ""), company.get("title", ""))
+
+    def _add(self, entry: Entry) -> None:
+        self.entries[entry.domain] = entry
+        if entry.stem:
+            self.stems.add(entry.stem)
+        for key in entry.block_keys():
+            self.blocks.setdefault(key, []).append(entry)
+
+    def match(self, domain: str, title: str = "") -> tuple[Entry | None, float]:
+        """Best existing entry for a company and its score, without adding it."""
+        probe = Entry(domain, company_name(title, domain, self.stems), domain, self.stems)
+        best, best_score = None, 0.0
+        seen = set()
+        for key in probe.block_keys():
+            block = self.blocks.get(key, ())
+            if len(block) > MAX_BLOCK_SIZE:
+                continue
+            for entry in block:
+                if entry.domain in seen or entry.domain == domain:
+                    continue
+                seen.add(entry.domain)
+                score = similarity(probe.grams, entry.grams)
+                if probe.stem and probe.stem == entry.stem and score >= STEM_NAME_THRESHOLD:
+                    score = 1.0
+                if score > best_score:
+                    best, best_score = entry, score
+        return best, best_score
+
+    def resolve(self, domain: str, title: str = "") -> str:
+        """Canonical domain for a company, adding it to the index if it's new."""
+        domain = (domain or "").strip().lower().removeprefix("www.")
+        if not domain:
+            return ""
+        with self._lock:
+            known = self.entries.get(domain)
+            if known is not None:
+                return known.canonical
+            best, score = self.match(domain, title)
+            canonical = best.canonical if best is not None and score >= self.threshold else domain
+            entry = Entry(domain, company_name(title, domain, self.stems), canonical, self.stems)
+            self._add(entry)
+            self._append(entry)
+            return canonical
+
+    def members(self, domain: str) -> list[str]:
+        """Every indexed domain sharing this domain's canonical one, canonical first."""
+        known = self.entries.get((domain or "").strip().lower().removeprefix("www."))
+        if known is None:
+            return []
+        others = sorted(e.domain for e in self.entries.values() if e.canonical == known.canonical and e.domain != known.canonical)
+        return [known.canonical, *others]
+
+    def split(self, domain: str) -> bool:
+        """
+        Undo a merge: make the domain its own company again, persisted so later
+        runs keep it apart. Returns False if it wasn't merged into another.
+        """
+        domain = (domain or "").strip().lower().removeprefix("www.")
+        with self._lock:
+            known = self.entries.get(domain)
+            if known is None or known.canonical == domain:
+                return False
+            known.canonical = domain
+            self._append(known)
+            return True
+
+    def _append(self, entry: Entry) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"domain": entry.domain, "name": entry.name, "canonical": entry.canonical}) + "\n")
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_company_index() -> CompanyIndex:
+    """Process-wide index backed by INDEX_FILE."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = CompanyIndex()
+        return _default
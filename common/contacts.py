@@ -0,0 +1,192 @@
+"""
+Contact record shared by enrichment (headhunter) and drafting (emailer).
+
+Headhunter writes sponsor_contacts.csv with Name/Email/LinkedIn columns,
+while LinkedIn + FullEnrich exports use "Full Name (Linkedin)",
+"Email (FullEnrich)" and friends. Contact reads either schema and writes the
+headhunter one; the emailer accepts both.
+
+Contacts are slotted, so holding a large export in memory costs a fraction
+of the equivalent dicts. read_contacts() and write_contacts() stream CSV
+files without building a dict per row: the header is resolved to column
+positions once per file.
+"""
+
+import csv
+from operator import itemgetter
+
+# Columns of sponsor_contacts.csv, in order
+CONTACT_FIELDS = ["Company", "Domain", "Name", "Title", "LinkedIn", "Email", "Role Match", "Role Score"]
+ENRICHED_EMAIL_COLUMN = "Email (FullEnrich)"
+
+# Alternative column names per field, checked in order
+FIELD_SOURCES = {
+    "company": ["Company"],
+    "domain": ["Domain"],
+    "name": ["Name", "Full Name (Linkedin)"],
+    "title": ["Title", "Job Title (Linkedin)", "Headline (Linkedin)"],
+    "linkedin": ["LinkedIn", "LinkedIn Profile Url", "Linkedin Url"],
+    "email": [ENRICHED_EMAIL_COLUMN, "Email"],
+    "role_match": ["Role Match"],
+    "role_score": ["Role Score"],
+}
+FIRST_NAME_COLUMNS = ["First Name (Linkedin)", "First Name"]
+LAST_NAME_COLUMNS = ["Last Name (Linkedin)", "Last Name"]
+# Columns mapped onto Contact fields; anything else goes to Contact.extra
+KNOWN_COLUMNS = frozenset(column for columns in FIELD_SOURCES.values() for column in columns)
+
+
+def _first(row: dict, columns: list[str]) -> str:
+    for column in columns:
+        value = row.get(column)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def _role_score(value: str) -> float:
+    try:
+        return float(value or 0)
+    except ValueError:
+        return 0.0
+
+
+class Contact:
+    """One person to reach out to. Unmapped CSV columns are kept in extra (None if there are none)."""
+
+    __slots__ = ("name", "company", "domain", "title", "linkedin", "email", "role_match", "role_score", "extra")
+
+    def __init__(
+        self,
+        name: str,
+        company: str,
+        domain: str = "",
+        title: str = "",
+        linkedin: str = "",
+        email: str = "",
+        role_match: str = "",
+        role_score: float = 0.0,
+        extra: dict | None = None
+    ):
+        self.name = name
+        self.company = company
+        self.domain = domain
+        self.title = title
+        self.linkedin = linkedin
+        self.email = email
+        self.role_match = role_match
+        self.role_score = role_score
+        self.extra = extra or None
+
+    @classmethod
+    def from_row(cls, row: dict, keep_extra: bool = True) -> "Contact":
+        """Build a contact from a headhunter row or a LinkedIn/FullEnrich export row."""
+        name = _first(row, FIELD_SOURCES["name"])
+        if not name:
+            name = f"{_first(row, FIRST_NAME_COLUMNS)} {_first(row, LAST_NAME_COLUMNS)}".strip()
+        extra = None
+        if keep_extra:
+            extra = {k: v for k, v in row.items() if k not in KNOWN_COLUMNS and not k.startswith("_")}
+        return cls(
+            name=name,
+            company=_first(row, FIELD_SOURCES["company"]),
+            domain=_first(row, FIELD_SOURCES["domain"]),
+            title=_first(row, FIELD_SOURCES["title"]),
+            linkedin=_first(row, FIELD_SOURCES["linkedin"]),
+            email=_first(row, FIELD_SOURCES["email"]),
+            role_match=_first(row, FIELD_SOURCES["role_match"]),
+            role_score=_role_score(_first(row, FIELD_SOURCES["role_score"])),
+            extra=extra,
+        )
+
+    def to_row(self) -> dict:
+        """CSV row with the CONTACT_FIELDS columns followed by any extra columns."""
+        row = {
+            "Company": self.company,
+            "Domain": self.domain,
+            "Name": self.name,
+            "Title": self.title,
+            "LinkedIn": self.linkedin,
+            "Email": self.email,
+            "Role Match": self.role_match,
+            "Role Score": self.role_score,
+        }
+        if self.extra:
+            row.update(self.extra)
+        return row
+
+    def to_values(self) -> list:
+        """The CONTACT_FIELDS columns as a list, for csv.writer."""
+        return [self.company, self.domain, self.name, self.title, self.linkedin,
+                self.email, self.role_match, self.role_score]
+
+    def __repr__(self) -> str:
+        return f"Contact({self.name!r}, {self.company!r}, title={self.title!r}, email={self.email!r})"
+
+
+class _ColumnMap:
+    """Positions of each Contact field's source columns in one CSV header."""
+
+    __slots__ = ("width", "primary", "fallbacks", "first_name", "last_name", "extra")
+
+    def __init__(self, header: list[str]):
+        position = {column: i for i, column in enumerate(header)}  # a repeated column: last wins, like DictReader
+        self.width = len(header)
+        # In FIELD_SOURCES order: company, domain, name, title, linkedin, email, role_match, role_score
+        fields = [[position[c] for c in columns if c in position] for columns in FIELD_SOURCES.values()]
+        # Position self.width is padding, always "": the value of a field with no column in this file
+        self.primary = itemgetter(*(positions[0] if positions else self.width for positions in fields))
+        self.fallbacks = [(field, positions[1:]) for field, positions in enumerate(fields) if len(positions) > 1]
+        self.first_name = [position[c] for c in FIRST_NAME_COLUMNS if c in position]
+        self.last_name = [position[c] for c in LAST_NAME_COLUMNS if c in position]
+        self.extra = [(column, i) for column, i in position.items()
+                      if column and column not in KNOWN_COLUMNS and not column.startswith("_")]
+
+    @staticmethod
+    def first(values: list[str], positions: list[int]) -> str:
+        for i in positions:
+            if values[i]:
+                return values[i].strip()
+        return ""
+
+    def contact(self, values: list[str], keep_extra: bool) -> Contact:
+        if len(values) > self.width:
+            del values[self.width:]
+        values.extend([""] * (self.width + 1 - len(values)))
+        fields = list(self.primary(values))
+        for field, positions in self.fallbacks:
+            if not fields[field]:
+                fields[field] = self.first(values, positions)
+        company, domain, name, title, linkedin, email, role_match, role_score = (value.strip() for value in fields)
+        if not name:
+            name = f"{self.first(values, self.first_name)} {self.first(values, self.last_name)}".strip()
+        extra = {column: values[i] for column, i in self.extra} if keep_extra and self.extra else None
+        return Contact(name, company, domain, title, linkedin, email, role_match, _role_score(role_score), extra)
+
+
+def read_contacts(path: str, keep_extra: bool = True):
+    """
+    Stream Contacts from a headhunter or LinkedIn/FullEnrich CSV. Same result
+    as Contact.from_row() on every csv.DictReader row, without the dicts.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        columns = _ColumnMap(header)
+        for values in reader:
+            if values:
+                yield columns.contact(values, keep_extra)
+
+
+def write_contacts(path: str, contacts) -> int:
+    """Write Contacts as a CONTACT_FIELDS CSV (extra columns are dropped). Returns rows written."""
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CONTACT_FIELDS)
+        for contact in contacts:
+            writer.writerow(contact.to_values())
+            written += 1
+    return written
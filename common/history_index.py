@@ -0,0 +1,240 @@
+"""
+Full-text index over saved searches: prompts, company domains and titles,
+evaluation rationales and conversation turns.
+
+Answers "have we looked at observability companies before?" or "which
+search found Datadog?" without opening every JSON in searches/. The index is
+a SQLite FTS5 table (an inverted index with BM25 ranking) in
+searches/.index/history.sqlite. save_search_results() reindexes the file it
+writes, and every query first picks up files added, changed or deleted
+behind our back by comparing mtimes, so it never needs a full rebuild.
+"""
+
+import os
+import re
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SEARCHES_DIR = PROJECT_ROOT / "find-companies" / "searches"
+
+# BM25 column weights: a hit in a domain or company name beats one in a rationale
+COLUMN_WEIGHTS = {"domain": 8.0, "title": 4.0, "body": 1.0}
+SNIPPET_TOKENS = 12
+
+
+def query_pattern(words: list[str]) -> list[re.Pattern]:
+    """One regex per query word matching words that start with it, loosely stemmed like the index."""
+    patterns = []
+    for word in words:
+        stem = re.sub(r"(ing|es|s|ed)$", "", word) if len(word) > 4 else word
+        patterns.append(re.compile(rf"\b{re.escape(stem)}\w*", re.IGNORECASE))
+    return patterns
+
+
+def highlight(text: str, patterns: list[re.Pattern]) -> str:
+    """A window of text around the first query match, with matches in [brackets]."""
+    first = min((m.start() for p in patterns if (m := p.search(text))), default=None)
+    if first is None:
+        return ""
+    words = text.split()
+    position = len(text[:first].split())
+    start = max(0, position - SNIPPET_TOKENS // 2)
+    window = " ".join(words[start:start + SNIPPET_TOKENS])
+    for pattern in patterns:
+        window = pattern.sub(lambda m: f"[{m.group(0)}]", window)
+    return ("…" if start else "") + window + ("…" if start + SNIPPET_TOKENS < len(words) else "")
+
+
+class HistoryIndex:
+    """Incrementally maintained FTS5 index of one searches directory."""
+
+    def __init__(self, searches_dir=SEARCHES_DIR):
+        self.searches_dir = Path(searches_dir)
+        self.path = self.searches_dir / ".index" / "history.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                mtime INTEGER NOT NULL,
+                prompt TEXT,
+                timestamp TEXT,
+                company_count INTEGER
+            )"""
+        )
+        # FTS5 can't look rows up by an unindexed column, so this maps each file to its rowids
+        self._conn.execute("CREATE TABLE IF NOT EXISTS rows (id INTEGER PRIMARY KEY, path TEXT NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS rows_path ON rows(path)")
+        # kind: prompt | company | turn; one row per company so hits can name it
+        self._conn.execute(
+            """CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5(
+                path UNINDEXED, kind UNINDEXED, domain, title, body,
+                tokenize = 'porter unicode61'
+            )"""
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def update_file(self, filepath: str, commit: bool = True) -> bool:
+        """(Re)index one saved search. Returns False if it couldn't be read."""
+        filepath = str(Path(filepath).resolve())
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+            with open(filepath, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        rows = [(filepath, "prompt", "", "", data.get("initial_prompt", ""))]
+        for company in data.get("companies", []):
+            body = " ".join(filter(None, (company.get("rationale"), company.get("reason"), " ".join(company.get("aliases", [])))))
+            rows.append((filepath, "company", company.get("domain", ""), company.get("title", ""), body))
+        for turn in data.get("conversation", [])[1:]:  # the first turn repeats the prompt
+            if isinstance(turn.get("content"), str) and turn["content"].strip():
+                rows.append((filepath, "turn", "", turn.get("role", ""), turn["content"]))
+
+        with self._lock:
+            self._delete_rows(filepath)
+            for row in rows:
+                row_id = self._conn.execute("INSERT INTO rows (path) VALUES (?)", (filepath,)).lastrowid
+                self._conn.execute(
+                    "INSERT INTO entries (rowid, path, kind, domain, title, body) VALUES (?, ?, ?, ?, ?, ?)",
+                    (row_id, *row)
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, mtime, prompt, timestamp, company_count) VALUES (?, ?, ?, ?, ?)",
+                (filepath, mtime, data.get("initial_prompt", ""),
+                 data.get("last_updated", data.get("timestamp", "")), len(data.get("companies", [])))
+            )
+            if commit:
+                self._conn.commit()
+        return True
+
+    def _delete_rows(self, filepath: str) -> None:
+        self._conn.execute("DELETE FROM entries WHERE rowid IN (SELECT id FROM rows WHERE path = ?)", (filepath,))
+        self._conn.execute("DELETE FROM rows WHERE path = ?", (filepath,))
+
+    def remove_file(self, filepath: str, commit: bool = True) -> None:
+        with self._lock:
+            self._delete_rows(filepath)
+            self._conn.execute("DELETE FROM files WHERE path = ?", (filepath,))
+            if commit:
+                self._conn.commit()
+
+    def sync(self) -> int:
+        """Index new or modified saved searches and drop deleted ones. Returns files reindexed."""
+        # Always stat every file: an in-place edit doesn't change the directory's mtime
+        with self._lock:
+            indexed = dict(self._conn.execute("SELECT path, mtime FROM files").fetchall())
+        present = set()
+        updated = 0
+        if self.searches_dir.exists():
+            directory = self.searches_dir.resolve()
+            for entry in os.scandir(directory):
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                filepath = os.path.join(directory, entry.name)
+                present.add(filepath)
+                if indexed.get(filepath) != entry.stat().st_mtime_ns:
+                    updated += self.update_file(filepath, commit=False)
+        removed = set(indexed) - present
+        for filepath in removed:
+            self.remove_file(filepath, commit=False)
+        if updated or removed:
+            with self._lock:
+                self._conn.commit()
+        return updated
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        """
+        Saved searches matching every word of the query (prefix matches, so
+        "datadog" finds datadoghq.com), best first. Each hit has the file's
+        metadata plus the companies and snippets that matched.
+        """
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return []
+        match = " ".join(f'"{w}"*' for w in words)
+        self.sync()
+        weights = ", ".join(str(w) for w in COLUMN_WEIGHTS.values())
+        with self._lock:
+            # Rank files by their summed BM25 (lower is better), then fetch details for the top few only
+            ranked = self._conn.execute(
+                f"""WITH matched AS MATERIALIZED (
+                        SELECT path, bm25(entries, 0, 0, {weights}) AS rank FROM entries WHERE entries MATCH ?
+                    )
+                    SELECT f.path, f.prompt, f.timestamp, f.company_count, SUM(matched.rank) AS score
+                    FROM matched JOIN files f ON f.path = matched.path
+                    GROUP BY f.path ORDER BY score LIMIT ?""",
+                (match, limit)
+            ).fetchall()
+            # Companies and snippets for the top files only. MATCH plus a rowid filter makes FTS5 walk
+            # every matching row, so these rows are fetched by rowid and highlighted here instead
+            details = {path: ([], []) for path, *_ in ranked}
+            rows = self._conn.execute(
+                f"""SELECT r.path, e.kind, e.domain, e.title, e.body
+                    FROM rows r JOIN entries e ON e.rowid = r.id
+                    WHERE r.path IN ({", ".join("?" * len(details))})""",
+                tuple(details)
+            ).fetchall() if details else []
+        patterns = query_pattern(words)
+        for path, kind, domain, title, body in rows:
+            companies, snippets = details[path]
+            if not all(p.search(f"{domain} {title} {body}") for p in patterns):
+                continue
+            if kind == "company" and domain not in companies:
+                companies.append(domain)
+            snippet = highlight(body, patterns)
+            if kind != "prompt" and snippet and len(snippets) < 3:
+                snippets.append(snippet)
+        hits = []
+        for path, prompt, timestamp, company_count, score in ranked:
+            companies, snippets = details[path]
+            hits.append({
+                "filepath": path,
+                "filename": os.path.basename(path),
+                "prompt": prompt,
+                "timestamp": timestamp,
+                "company_count": company_count,
+                "score": -score,  # bm25() is lower-is-better
+                "companies": companies,
+                "snippets": snippets,
+            })
+        return hits
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_history_index() -> HistoryIndex:
+    """Process-wide index of SEARCHES_DIR."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = HistoryIndex()
+        return _default
+
+
+def print_hits(hits: list[dict]) -> None:
+    """Numbered list of search hits, as shown by `main.py history` and browse_searches."""
+    for i, hit in enumerate(hits, 1):
+        timestamp = hit["timestamp"][:16]
+        print(f"\n{i}. [{timestamp}] {hit['prompt'][:60]}")
+        if hit["companies"]:
+            more = f" (+{len(hit['companies']) - 5} more)" if len(hit["companies"]) > 5 else ""
+            print(f"   🏢 {', '.join(hit['companies'][:5])}{more}")
+        for snippet in hit["snippets"]:
+            print(f"   “{snippet}”")
@@ -0,0 +1,99 @@
+"""
+Negative-result cache: remembers lookups that came back empty, so we don't
+pay for them again on the next run.
+
+A company with no LinkedIn profiles, an Exa query that returns zero companies
+or a person Apollo can't match will usually give the same answer next week.
+Empty answers are stored in their own DiskCache with shorter TTLs than
+positive results (the world does change - a company hires its first DevRel),
+and every skipped call is counted so the run can report what it saved.
+
+Set MONEYPRINTER_NEGATIVE_CACHE=0 to ignore and stop recording empty results.
+"""
+
+import os
+import atexit
+import threading
+
+from common.cache import DiskCache, make_key
+
+DAY = 24 * 3600
+
+# How long an empty answer is trusted, per kind of lookup
+NEGATIVE_TTLS = {
+    "linkedin": 7 * DAY,
+    "exa_query": 3 * DAY,
+    "exa_similar": 3 * DAY,
+    "apollo": 14 * DAY,
+}
+DEFAULT_NEGATIVE_TTL = 3 * DAY
+
+# What one skipped lookup of each kind saves, for the report
+SAVED_UNITS = {
+    "linkedin": "Exa people searches",
+    "exa_query": "Exa searches",
+    "exa_similar": "Exa find-similar calls",
+    "apollo": "Apollo lookups",
+}
+
+
+def negative_cache_enabled() -> bool:
+    return os.getenv("MONEYPRINTER_NEGATIVE_CACHE", "1").lower() not in ("0", "false", "no", "off")
+
+
+class NegativeCache:
+    """Known-empty lookups keyed by (kind, *parts), with per-kind TTLs and a saved-calls tally."""
+
+    def __init__(self, cache: DiskCache | None = None, ttls: dict[str, float] | None = None):
+        self.cache = cache if cache is not None else DiskCache("negative_results", max_entries=50_000)
+        self.ttls = {**NEGATIVE_TTLS, **(ttls or {})}
+        self.saved = {}  # kind -> calls not made this run
+        self._lock = threading.Lock()
+        self._report_registered = False
+
+    def is_known_empty(self, kind: str, *parts, calls: int = 1) -> bool:
+        """
+        True if this lookup came back empty within its TTL. `calls` is how
+        many API calls the lookup would have cost; they're counted as saved.
+        """
+        if not negative_cache_enabled():
+            return False
+        if not self.cache.get(make_key(kind, *parts)):
+            return False
+        with self._lock:
+            self.saved[kind] = self.saved.get(kind, 0) + calls
+            if not self._report_registered:
+                self._report_registered = True
+                atexit.register(self.print_report)
+        return True
+
+    def record_empty(self, kind: str, *parts) -> None:
+        if negative_cache_enabled():
+            self.cache.set(make_key(kind, *parts), True, ttl=self.ttls.get(kind, DEFAULT_NEGATIVE_TTL))
+
+    def forget(self, kind: str, *parts) -> None:
+        """Drop a remembered empty result (e.g. after the lookup finally found something)."""
+        self.cache.delete(make_key(kind, *parts))
+
+    def print_report(self) -> None:
+        """Print how many calls the cache saved this run."""
+        with self._lock:
+            saved = dict(self.saved)
+        if not saved:
+            return
+        print(f"\n💾 Skipped {sum(saved.values())} calls with known-empty results:")
+        for kind, calls in sorted(saved.items()):
+            print(f"   {calls:>6} {SAVED_UNITS.get(kind, kind)}")
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_negative_cache() -> NegativeCache:
+    """Process-wide negative cache under .cache/negative_results.sqlite."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = NegativeCache()
+        return _default
@@ -0,0 +1,72 @@
+"""
+Terminal output for work that finishes out of order.
+
+Concurrent searches, evaluations and enrichment lookups report through
+emit() so each result block prints as one unit the moment its task is done,
+and Progress adds a running count and ETA to long phases.
+"""
+
+import sys
+import time
+import threading
+
+_print_lock = threading.Lock()
+
+
+def emit(*lines: str) -> None:
+    """Print lines as one block, without interleaving with other threads."""
+    text = "\n".join(lines)
+    with _print_lock:
+        print(text)
+        sys.stdout.flush()
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+class Progress:
+    """
+    Counter for a phase of `total` tasks. Each advance() prints one line with
+    the task's note, the completed count and an ETA from the mean time per task.
+    Thread-safe, so tasks can report from worker threads as they finish.
+    """
+
+    def __init__(self, total: int, label: str = ""):
+        self.total = total
+        self.label = label
+        self.done = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def eta(self) -> float | None:
+        """Seconds until every task is done, or None before the first finishes."""
+        if not self.done:
+            return None
+        elapsed = time.monotonic() - self.started
+        return elapsed / self.done * (self.total - self.done)
+
+    def advance(self, note: str = "", *details: str) -> None:
+        """Mark one task done and print its note (plus any detail lines under it)."""
+        with self._lock:
+            self.done += 1
+            done = self.done
+            eta = self.eta()
+        status = f"[{done}/{self.total}]"
+        if done < self.total and eta is not None:
+            status += f" ETA {format_duration(eta)}"
+        emit(f"   {status} {note}".rstrip(), *details)
+
+    def finish(self) -> float:
+        """Print the phase summary and return the elapsed seconds."""
+        elapsed = time.monotonic() - self.started
+        label = f"{self.label}: " if self.label else ""
+        emit(f"   ⏱️  {label}{self.done}/{self.total} done in {format_duration(elapsed)}")
+        return elapsed
@@ -0,0 +1,38 @@
+"""
+Client-side request pacing.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket limiting calls to `per_minute` requests per minute, with
+    bursts of up to `burst` requests. Thread-safe; acquire() blocks until
+    a token is available.
+    """
+
+    def __init__(self, per_minute: float, burst: int = 1):
+        self.per_minute = per_minute
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed. Returns the seconds spent waiting."""
+        if self.per_minute <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.per_minute / 60)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) * 60 / self.per_minute
+            time.sleep(delay)
+            waited += delay
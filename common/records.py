@@ -0,0 +1,128 @@
+"""
+Typed records for the companies and evaluations passed between search,
+evaluation and enrichment, plus the shared Contact (common/contacts.py).
+
+Search results used to travel as ad-hoc dicts, copied again for every
+verdict. Here a Company is built once per Exa result, and an Evaluation
+points at that same Company instead of repeating its domain, title and URL.
+Records stay slotted and turn into the existing dict format (saved search
+JSON, LLM tool messages, daemon responses) only at those boundaries, via
+to_dict() or json.dumps(..., default=to_json).
+"""
+
+from urllib.parse import urlparse
+
+# Re-exported so callers get every record type from one place
+from common.contacts import Contact, CONTACT_FIELDS, read_contacts, write_contacts  # noqa: F401
+
+
+class Company:
+    """A discovered company. aliases lists other domains merged into it by dedupe_companies()."""
+
+    __slots__ = ("domain", "title", "url", "aliases")
+
+    def __init__(self, domain: str, title: str = "", url: str = "", aliases: list[str] | None = None):
+        self.domain = domain
+        self.title = title
+        self.url = url
+        self.aliases = list(aliases) if aliases else []
+
+    @classmethod
+    def from_result(cls, result) -> "Company":
+        """From an Exa search result."""
+        return cls(urlparse(result.url).netloc.replace("www.", ""), result.title or "", result.url)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Company":
+        """From a saved search entry or LLM tool argument; evaluation fields are ignored."""
+        return cls(data.get("domain", ""), data.get("title") or "", data.get("url") or "", data.get("aliases"))
+
+    def to_dict(self) -> dict:
+        data = {"domain": self.domain, "title": self.title, "url": self.url}
+        if self.aliases:
+            data["aliases"] = list(self.aliases)
+        return data
+
+    def prompt_line(self) -> str:
+        """How the company is listed in evaluation prompts."""
+        return f"- {self.domain or 'unknown'}: {self.title or 'Unknown'} ({self.url})"
+
+    def __repr__(self) -> str:
+        return f"Company({self.domain!r}, {self.title!r})"
+
+
+class Evaluation:
+    """The LLM's verdict on one Company: a rationale and confidence if approved, a reason if not."""
+
+    __slots__ = ("company", "approved", "rationale", "confidence", "reason")
+
+    def __init__(self, company: Company, approved: bool, rationale: str = "", confidence: str = "", reason: str = ""):
+        self.company = company
+        self.approved = approved
+        self.rationale = rationale
+        self.confidence = confidence
+        self.reason = reason
+
+    # Read through to the company, so evaluations can be deduplicated like companies
+    @property
+    def domain(self) -> str:
+        return self.company.domain
+
+    @property
+    def title(self) -> str:
+        return self.company.title
+
+    @property
+    def url(self) -> str:
+        return self.company.url
+
+    @property
+    def aliases(self) -> list[str]:
+        return self.company.aliases
+
+    @classmethod
+    def from_dict(cls, data: dict, approved: bool = True, company: Company | None = None) -> "Evaluation":
+        """From an "approved" or "rejected" entry, or a company in a saved search."""
+        return cls(
+            company if company is not None else Company.from_dict(data),
+            approved,
+            rationale=data.get("rationale") or "",
+            confidence=data.get("confidence") or "",
+            reason=data.get("reason") or "",
+        )
+
+    @classmethod
+    def from_verdicts(cls, verdicts: dict, candidates: dict[str, Company]) -> list["Evaluation"]:
+        """
+        Evaluations from an {"approved": [...], "rejected": [...]} answer. Verdicts on
+        a candidate (by domain) share its Company; any other domain gets a new one.
+        """
+        evaluations = []
+        for key, approved in (("approved", True), ("rejected", False)):
+            for data in verdicts.get(key, []):
+                if isinstance(data, dict):
+                    evaluations.append(cls.from_dict(data, approved, candidates.get(data.get("domain", ""))))
+        return evaluations
+
+    def to_dict(self) -> dict:
+        """An "approved" entry (company fields, rationale, confidence) or a "rejected" one (domain, reason)."""
+        if not self.approved:
+            return {"domain": self.domain, "reason": self.reason}
+        data = self.company.to_dict()
+        data["rationale"] = self.rationale
+        data["confidence"] = self.confidence
+        return data
+
+    def __repr__(self) -> str:
+        verdict = (self.confidence or "approved") if self.approved else "rejected"
+        return f"Evaluation({self.domain!r}, {verdict})"
+
+
+def to_json(value):
+    """json.dumps default= hook: records become their dicts, anything else a string."""
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(value, Contact):
+        return value.to_row()
+    return str(value)
@@ -0,0 +1,250 @@
+"""
+Retry, backoff and load control for external API calls.
+
+call_with_retry() wraps a single request with:
+- jittered exponential backoff on throttling (429), timeouts and 5xx errors
+- Retry-After handling when the provider sends one
+- a per-host circuit breaker that fails fast after repeated server errors
+- a per-host adaptive concurrency limit (AIMD): halves on throttling and
+  grows by roughly one slot per window of successful calls
+"""
+
+import re
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+MAX_ATTEMPTS = 5
+BASE_DELAY = 1.0
+MAX_DELAY = 60.0
+
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504, 520, 522, 524, 529}
+THROTTLE_STATUS = {429, 529}
+# exa_py raises ValueError("Request failed with status code 429: ...")
+STATUS_IN_MESSAGE = re.compile(r"status code (\d{3})")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+def error_status(exc: BaseException) -> int | None:
+    """Best-effort HTTP status code from an OpenAI, requests or Exa exception."""
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        return status
+    match = STATUS_IN_MESSAGE.search(str(exc))
+    return int(match.group(1)) if match else None
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Seconds the provider asked us to wait (Retry-After / retry-after-ms), if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    status = error_status(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    # No status: connection resets, DNS failures, read timeouts
+    name = type(exc).__name__
+    return any(word in name for word in ("Timeout", "Connection", "Network", "RemoteDisconnected"))
+
+
+def backoff_delay(attempt: int, base: float = BASE_DELAY, cap: float = MAX_DELAY) -> float:
+    """Full-jitter exponential backoff for the given (1-based) attempt."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive server-side failures, rejects calls for
+    `cooldown` seconds, then lets a single trial call through (half-open).
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self, host: str) -> None:
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if time.monotonic() - self.opened_at < self.cooldown or self._trial_in_flight:
+                raise CircuitOpenError(f"{host} circuit open after {self.failures} consecutive failures")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_neutral(self) -> None:
+        """A call that says nothing about server health (throttled, bad request)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit: additive increase of ~1 slot per `limit` successes,
+    multiplicative decrease (halving) when the host throttles us.
+    """
+
+    def __init__(self, initial: float = 4, minimum: float = 1, maximum: float = 32):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    def on_success(self) -> None:
+        with self._cond:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def on_throttle(self) -> None:
+        with self._cond:
+            self.limit = max(self.minimum, self.limit / 2)
+
+
+class HostState:
+    """Breaker, limiter and counters for one upstream host."""
+
+    def __init__(self):
+        self.breaker = CircuitBreaker()
+        self.limiter = AdaptiveLimiter()
+        self.calls = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+
+
+_hosts: dict[str, HostState] = {}
+_hosts_lock = threading.Lock()
+
+
+def host_state(host: str) -> HostState:
+    with _hosts_lock:
+        if host not in _hosts:
+            _hosts[host] = HostState()
+        return _hosts[host]
+
+
+def call_with_retry(host: str, fn, *args, span=None, max_attempts: int = MAX_ATTEMPTS, **kwargs):
+    """
+    Call fn(*args, **kwargs) against `host` ("openrouter", "exa", ...) with
+    backoff, Retry-After, circuit breaking and adaptive concurrency.
+    Non-retryable errors (bad request, auth) are raised immediately.
+    If a trace span is passed, the attempt count is recorded on it.
+    """
+    state = host_state(host)
+    attempt = 0
+    while True:
+        attempt += 1
+        state.breaker.before_call(host)
+        state.limiter.acquire()
+        delay = None
+        try:
+            state.calls += 1
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            status = error_status(e)
+            throttled = status in THROTTLE_STATUS
+            if throttled:
+                state.throttled += 1
+                state.limiter.on_throttle()
+                state.breaker.record_neutral()
+            elif is_retryable(e):
+                state.breaker.record_failure()
+            else:
+                state.breaker.record_neutral()
+
+            if not is_retryable(e) or attempt >= max_attempts:
+                state.failures += 1
+                if span is not None:
+                    span.attrs["attempts"] = attempt
+                raise
+
+            delay = retry_after_seconds(e)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            state.retries += 1
+            reason = f"HTTP {status}" if status else type(e).__name__
+            print(f"   ⏳ {host}: {reason}, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_attempts})")
+        finally:
+            state.limiter.release()
+
+        if delay is not None:
+            # Back off without holding a concurrency slot, so other calls can use it meanwhile
+            time.sleep(min(delay, MAX_DELAY))
+            continue
+
+        state.breaker.record_success()
+        state.limiter.on_success()
+        if span is not None and attempt > 1:
+            span.attrs["attempts"] = attempt
+        return result
+
+
+def host_stats() -> dict[str, dict]:
+    """Counters and current concurrency limit per host."""
+    return {
+        host: {
+            "calls": s.calls,
+            "retries": s.retries,
+            "throttled": s.throttled,
+            "failures": s.failures,
+            "concurrency_limit": round(s.limiter.limit, 2),
+        }
+        for host, s in _hosts.items()
+    }
@@ -0,0 +1,225 @@
+"""
+Latency-aware model routing with hedged requests.
+
+Each call site ("agent", "evaluation", "refine", "email_slot", ...) has a
+routing policy: an ordered list of OpenRouter models plus hedging settings.
+routed_completion() sends the request to the healthiest model and, if it
+hasn't answered by the policy's latency percentile, sends a duplicate to the
+next model and returns whichever finishes first; if the primary fails
+outright first, the next model is tried at once. The losing request is
+cancelled if it hasn't started; otherwise it still runs and is billed, so
+its usage is traced in a span of its own (attrs["hedge_loser"]).
+
+Policies can be overridden with a JSON file named by MONEYPRINTER_ROUTING:
+    {"evaluation": {"models": ["openai/gpt-4o-mini"], "hedge": false}}
+"""
+
+import os
+import json
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from common.resilience import call_with_retry
+from common.tracing import Span, percentile, write_span
+
+GEMINI_FLASH = "google/gemini-2.0-flash-001"
+GPT_4O_MINI = "openai/gpt-4o-mini"
+
+# models: tried in order of health; the first healthy one is the primary
+# hedge: send a duplicate to the next model when the primary is slow
+# hedge_percentile: primary latency percentile that triggers the hedge
+# hedge_after: seconds to wait before hedging until enough samples exist
+# min_samples: latencies needed before the percentile is trusted
+DEFAULT_POLICIES = {
+    "agent": {"models": [GEMINI_FLASH, GPT_4O_MINI], "hedge": True, "hedge_percentile": 95, "hedge_after": 6.0},
+    "plan": {"models": [GEMINI_FLASH, GPT_4O_MINI], "hedge": True, "hedge_percentile": 95, "hedge_after": 6.0},
+    "evaluation": {"models": [GEMINI_FLASH, GPT_4O_MINI], "hedge": True, "hedge_percentile": 90, "hedge_after": 15.0},
+    "refine": {"models": [GEMINI_FLASH, GPT_4O_MINI], "hedge": True, "hedge_percentile": 90, "hedge_after": 12.0},
+    "email_slot": {"models": [GEMINI_FLASH, GPT_4O_MINI], "hedge": True, "hedge_percentile": 90, "hedge_after": 4.0},
+    "filename": {"models": [GPT_4O_MINI, GEMINI_FLASH], "hedge": False},
+}
+POLICY_DEFAULTS = {"hedge": False, "hedge_percentile": 90, "hedge_after": 5.0, "min_samples": 10, "max_error_rate": 0.5}
+
+STATS_WINDOW = 100
+
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hedge")
+_stats_lock = threading.Lock()
+_stats: dict[str, "ModelStats"] = {}
+_policies = None
+
+
+class ModelStats:
+    """Rolling latency and error statistics for one model."""
+
+    def __init__(self, window: int = STATS_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)  # True = success
+        self.wins = 0
+        self.hedges = 0
+
+    def record(self, seconds: float | None, ok: bool) -> None:
+        with _stats_lock:
+            if ok and seconds is not None:
+                self.latencies.append(seconds)
+            self.outcomes.append(ok)
+
+    def latency_percentile(self, pct: float) -> float:
+        with _stats_lock:
+            return percentile(list(self.latencies), pct)
+
+    @property
+    def samples(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def error_rate(self) -> float:
+        with _stats_lock:
+            if not self.outcomes:
+                return 0.0
+            return self.outcomes.count(False) / len(self.outcomes)
+
+
+def model_stats(model: str) -> ModelStats:
+    with _stats_lock:
+        if model not in _stats:
+            _stats[model] = ModelStats()
+        return _stats[model]
+
+
+def load_policies() -> dict[str, dict]:
+    """Default policies merged with the MONEYPRINTER_ROUTING override file, if any."""
+    global _policies
+    if _policies is None:
+        policies = {stage: dict(policy) for stage, policy in DEFAULT_POLICIES.items()}
+        override_path = os.getenv("MONEYPRINTER_ROUTING")
+        if override_path and os.path.exists(override_path):
+            with open(override_path, "r") as f:
+                for stage, override in json.load(f).items():
+                    policies.setdefault(stage, {}).update(override)
+        _policies = policies
+    return _policies
+
+
+def route_policy(stage: str) -> dict:
+    """Full policy for a call site, with defaults filled in."""
+    policy = dict(POLICY_DEFAULTS)
+    policy.update(load_policies().get(stage, {"models": [GEMINI_FLASH]}))
+    return policy
+
+
+def primary_model(stage: str) -> str:
+    return route_policy(stage)["models"][0]
+
+
+def rank_models(policy: dict) -> list[str]:
+    """Policy models in order, with unhealthy ones (high recent error rate) moved last."""
+    models = list(policy["models"])
+    healthy = [m for m in models if model_stats(m).error_rate <= policy["max_error_rate"]]
+    return healthy + [m for m in models if m not in healthy]
+
+
+def hedge_delay(model: str, policy: dict) -> float:
+    """Seconds to wait on the primary before hedging."""
+    stats = model_stats(model)
+    if stats.samples < policy["min_samples"]:
+        return policy["hedge_after"]
+    return stats.latency_percentile(policy["hedge_percentile"])
+
+
+def _timed_call(create, model: str, kwargs: dict, span=None):
+    started = time.perf_counter()
+    try:
+        response = call_with_retry("openrouter", create, span=span, model=model, **kwargs)
+    except Exception:
+        model_stats(model).record(None, ok=False)
+        raise
+    model_stats(model).record(time.perf_counter() - started, ok=True)
+    return response
+
+
+def _trace_loser(stage: str, model: str, started: float, t0: float):
+    """Done-callback for a losing hedge: trace its usage once it finishes."""
+    def callback(future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        loser = Span(stage, "chat.completions.create", model, hedge_loser=True)
+        loser.record(future.result())
+        write_span(loser, started, (time.perf_counter() - t0) * 1000)
+    return callback
+
+
+def routed_completion(client, stage: str, span=None, **kwargs):
+    """
+    client.chat.completions.create(**kwargs) with the model picked by the
+    stage's routing policy (any model in kwargs is ignored). Streaming
+    requests are routed but never hedged. The winning model, whether a
+    hedge or fallback was sent and retry attempts are recorded on the trace span.
+    """
+    kwargs.pop("model", None)
+    policy = route_policy(stage)
+    models = rank_models(policy)
+    create = client.chat.completions.create
+    primary = models[0]
+
+    if span is not None:
+        span.model = primary
+
+    if not policy["hedge"] or len(models) < 2 or kwargs.get("stream"):
+        return _timed_call(create, primary, kwargs, span)
+
+    futures = {}  # future -> model
+    submitted = {}  # future -> (wall clock, perf counter) at submission
+
+    def submit(model: str):
+        future = _executor.submit(_timed_call, create, model, kwargs, span)
+        futures[future] = model
+        submitted[future] = (time.time(), time.perf_counter())
+        return future
+
+    submit(primary)
+    done, _ = wait(futures, timeout=hedge_delay(primary, policy))
+    if not done:
+        model_stats(primary).hedges += 1
+        submit(models[1])
+        if span is not None:
+            span.attrs["hedged"] = models[1]
+
+    pending = set(futures)
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        if len(futures) == 1 and done:
+            # The primary failed before the hedge was due: fail over right away
+            if next(iter(done)).exception() is not None:
+                pending.add(submit(models[1]))
+                if span is not None:
+                    span.attrs["fallback"] = models[1]
+        for future in done:
+            if future.exception() is None:
+                winner = futures[future]
+                model_stats(winner).wins += 1
+                if span is not None:
+                    span.model = winner
+                for other in futures:
+                    if other is not future and not other.cancel():
+                        other.add_done_callback(_trace_loser(stage, futures[other], *submitted[other]))
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+def routing_stats() -> dict[str, dict]:
+    """Per-model rolling stats for reports."""
+    return {
+        model: {
+            "samples": s.samples,
+            "p50_s": round(s.latency_percentile(50), 3),
+            "p95_s": round(s.latency_percentile(95), 3),
+            "error_rate": round(s.error_rate, 3),
+            "hedges": s.hedges,
+            "wins": s.wins,
+        }
+        for model, s in _stats.items()
+    }
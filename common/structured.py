@@ -0,0 +1,198 @@
+"""
+Schema-constrained JSON from the LLM, with salvage for truncated output.
+
+structured_completion() asks for a json_schema response format, so models
+that support it can't wrap the JSON in prose or fences. Whatever comes back
+goes through parse_json(), which also copes with fenced or cut-off output:
+it keeps every complete array item and object member and drops only the
+unfinished tail. When the output was cut off (finish_reason == "length"), a
+caller-supplied continuation asks for just the missing part - e.g. the
+companies that weren't evaluated yet - instead of repeating the whole call.
+
+Completion tokens we paid for but couldn't use are recorded on each span as
+attrs["wasted_tokens"] and shown in the API call summary.
+"""
+
+import json
+
+from common.tracing import trace_span
+from common.resilience import error_status
+from common.routing import routed_completion
+
+MAX_CONTINUATIONS = 2
+
+
+def json_schema_format(name: str, schema: dict) -> dict:
+    """response_format for a strict JSON schema (every property required, no extras)."""
+    return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+
+
+def object_schema(**properties) -> dict:
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def array_of(items: dict) -> dict:
+    return {"type": "array", "items": items}
+
+
+STRING = {"type": "string"}
+BOOLEAN = {"type": "boolean"}
+CONFIDENCE = {"type": "string", "enum": ["high", "medium", "low"]}
+
+EVALUATED_COMPANY = object_schema(domain=STRING, title=STRING, url=STRING, rationale=STRING, confidence=CONFIDENCE)
+REJECTED_COMPANY = object_schema(domain=STRING, reason=STRING)
+
+EVALUATION_SCHEMA = object_schema(approved=array_of(EVALUATED_COMPANY), rejected=array_of(REJECTED_COMPANY))
+PLAN_SCHEMA = object_schema(queries=array_of(STRING), seed_urls=array_of(STRING))
+# Short fields first: if the list gets cut off, the summary has already been written
+REFINE_SCHEMA = object_schema(
+    changes_made=STRING,
+    should_search_more=BOOLEAN,
+    companies=array_of(EVALUATED_COMPANY),
+)
+COMPANY_LIST_SCHEMA = object_schema(companies=array_of(EVALUATED_COMPANY))
+
+
+def _strip_wrapping(text: str) -> str:
+    """Drop markdown fences and any prose before the first { or [."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    return text[min(starts):] if starts else text
+
+
+def _cut_points(text: str):
+    """
+    Yield (end, open_brackets) wherever the text can be cut and re-closed
+    into valid JSON holding only complete items: at each comma between
+    items and after each nested container closes, as long as the only open
+    object is the root - half an item is worse than none.
+    """
+    stack = []
+    in_string = escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append(char)
+        elif char in "}]":
+            if not stack:
+                return
+            stack.pop()
+            if stack and "{" not in stack[1:]:
+                yield i + 1, "".join(stack)
+        elif char == "," and stack and "{" not in stack[1:]:
+            yield i, "".join(stack)
+
+
+def parse_json(text: str) -> tuple[object, int]:
+    """
+    Parse LLM output as JSON, tolerating fences, surrounding prose and a
+    truncated tail. Returns (value, dropped_chars): value is None if nothing
+    could be salvaged; dropped_chars > 0 means an unfinished tail was cut.
+    """
+    body = _strip_wrapping(text or "")
+    try:
+        value, _ = json.JSONDecoder().raw_decode(body)
+        return value, 0
+    except json.JSONDecodeError:
+        pass
+
+    # Try the latest cut points first: the more complete items kept, the better
+    for end, open_brackets in reversed(list(_cut_points(body))):
+        closing = "".join("}" if b == "{" else "]" for b in reversed(open_brackets))
+        try:
+            return json.loads(body[:end] + closing), len(body) - end
+        except json.JSONDecodeError:
+            continue
+    return None, len(body)
+
+
+def structured_completion(
+    client,
+    stage: str,
+    messages: list[dict],
+    schema_name: str,
+    schema: dict,
+    max_tokens: int = 4000,
+    continue_with=None,
+    merge=None,
+    **span_attrs
+):
+    """
+    One schema-constrained completion, parsed with parse_json(). Returns
+    (value, complete): value is None if nothing usable came back, complete
+    is False if some of the output was cut off and never recovered.
+
+    If the output was truncated, continue_with(partial) may return the
+    messages for a follow-up request covering only what's missing (or None
+    if nothing is); merge(partial, more) combines the two. Up to
+    MAX_CONTINUATIONS follow-ups are sent.
+    """
+    value = None
+    complete = False
+    for attempt in range(MAX_CONTINUATIONS + 1):
+        if attempt:
+            messages = continue_with(value) if continue_with is not None else None
+            if not messages:
+                complete = True  # nothing left to ask for
+                break
+            span_attrs["continuation"] = attempt
+        part, truncated = _completion(client, stage, messages, schema_name, schema, max_tokens, **span_attrs)
+        if part is None:
+            break
+        value = part if value is None else merge(value, part)
+        complete = not truncated
+        if complete or merge is None:
+            break
+    return value, complete
+
+
+def _completion(client, stage, messages, schema_name, schema, max_tokens, **span_attrs):
+    """(parsed value or None, whether the output was cut off) for one request."""
+    with trace_span(stage, "chat.completions.create", **span_attrs) as span:
+        kwargs = {"messages": messages, "max_tokens": max_tokens,
+                  "response_format": json_schema_format(schema_name, schema)}
+        try:
+            response = routed_completion(client, stage, span=span, **kwargs)
+        except Exception as e:
+            if error_status(e) != 400:
+                raise
+            # Model or provider without structured output support: ask for plain JSON instead
+            span.attrs["schema_rejected"] = True
+            kwargs.pop("response_format")
+            response = routed_completion(client, stage, span=span, **kwargs)
+        span.record(response)
+
+        choice = response.choices[0]
+        text = choice.message.content or ""
+        value, dropped = parse_json(text)
+        truncated = getattr(choice, "finish_reason", None) == "length" or (value is not None and dropped > 0)
+
+        if value is None:
+            wasted = span.completion_tokens
+        elif dropped and text:
+            wasted = round(span.completion_tokens * dropped / len(text))
+        else:
+            wasted = 0
+        if wasted:
+            span.attrs["wasted_tokens"] = wasted
+        if truncated:
+            span.attrs["truncated"] = True
+        return value, truncated
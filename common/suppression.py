@@ -0,0 +1,300 @@
+"""
+Suppression list: people and companies we must not email again
+(unsubscribes, bounces, previous outreach).
+
+Entries are normalized keys - "e:<email>" or "d:<domain>" - kept in a
+human-readable entries.tsv. From it we build two compact files:
+
+- index.bin: sorted, de-duplicated 16-byte blake2b digests of every key,
+  binary-searched through mmap (exact membership, nothing loaded up front)
+- bloom.bin: a bloom filter over the same digests (~10 bits per key, ~1%
+  false positives) that rules out almost every non-suppressed contact with
+  a handful of bit tests, before the index is touched
+
+Lists of hundreds of thousands of addresses cost a few MB on disk and about
+a megabyte of memory.
+"""
+
+import os
+import csv
+import math
+import mmap
+import struct
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Not under .cache/: this is a record we must never lose, not something we can rebuild
+SUPPRESSION_DIR = Path(os.getenv("MONEYPRINTER_SUPPRESSION_DIR", PROJECT_ROOT / "suppression"))
+
+DIGEST_SIZE = 16
+BLOOM_BITS_PER_KEY = 10
+BLOOM_HASHES = 7
+BLOOM_HEADER = struct.Struct("<QI")  # bit count, hash count
+
+# Providers that ignore dots in the local part
+DOTLESS_DOMAINS = {"gmail.com", "googlemail.com"}
+
+
+class SuppressedContactError(ValueError):
+    """Raised when something tries to draft an email for a suppressed contact."""
+
+
+def normalize_domain(value: str) -> str:
+    """Bare lowercase domain from a domain, URL or email address."""
+    value = (value or "").strip().lower()
+    if "@" in value:
+        value = value.rsplit("@", 1)[1]
+    if "://" in value:
+        value = value.split("://", 1)[1]
+    value = value.split("/", 1)[0].split(":", 1)[0].rstrip(".")
+    return value.removeprefix("www.")
+
+
+def normalize_email(email: str) -> str:
+    """
+    Canonical form of an address: lowercase, "+tag" removed, and dots removed
+    from Gmail local parts, so every variant of an address maps to one key.
+    """
+    email = (email or "").strip().lower()
+    if "@" not in email:
+        return ""
+    local, domain = email.rsplit("@", 1)
+    domain = normalize_domain(domain)
+    local = local.split("+", 1)[0]
+    if domain == "googlemail.com":
+        domain = "gmail.com"
+    if domain in DOTLESS_DOMAINS:
+        local = local.replace(".", "")
+    return f"{local}@{domain}" if local and domain else ""
+
+
+def entry_key(value: str) -> str:
+    """Suppression key for a raw entry: an email address or a domain/URL."""
+    if "@" in (value or ""):
+        email = normalize_email(value)
+        return f"e:{email}" if email else ""
+    domain = normalize_domain(value)
+    return f"d:{domain}" if domain else ""
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+def _bloom_positions(digest: bytes, bits: int, hashes: int):
+    # Double hashing: two 64-bit halves of the digest generate every probe
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    for i in range(hashes):
+        yield (h1 + i * h2) % bits
+
+
+class SuppressionList:
+    """Read side of the on-disk suppression files, plus add() to extend them."""
+
+    def __init__(self, directory=SUPPRESSION_DIR):
+        self.directory = Path(directory)
+        self.entries_file = self.directory / "entries.tsv"
+        self.index_file = self.directory / "index.bin"
+        self.bloom_file = self.directory / "bloom.bin"
+        self.hits = 0  # contacts rejected since load
+        self._lock = threading.Lock()
+        self._index = None
+        self._index_handle = None
+        self._count = 0
+        self._bloom = b""
+        self._bloom_bits = 0
+        self._bloom_hashes = 0
+        self.loaded_mtime = None
+        self._load()
+
+    def _needs_rebuild(self) -> bool:
+        """True if entries.tsv has entries the index and bloom filter may not cover."""
+        if not self.entries_file.exists():
+            return False
+        if not self.index_file.exists() or not self.bloom_file.exists():
+            return True
+        return self.entries_file.stat().st_mtime_ns > self.index_file.stat().st_mtime_ns
+
+    def _load(self) -> None:
+        # Never fail open: if entries.tsv was edited or the built files are missing,
+        # rebuild them (or raise trying) rather than serve an incomplete list
+        if self._needs_rebuild():
+            self.rebuild()
+            return
+        self._open()
+
+    def _open(self) -> None:
+        self.close()
+        if not self.index_file.exists() or not self.bloom_file.exists():
+            self.loaded_mtime = None
+            return
+        self.loaded_mtime = self.index_file.stat().st_mtime_ns
+        with open(self.bloom_file, "rb") as f:
+            self._bloom_bits, self._bloom_hashes = BLOOM_HEADER.unpack(f.read(BLOOM_HEADER.size))
+            self._bloom = f.read()
+        size = self.index_file.stat().st_size
+        self._count = size // DIGEST_SIZE
+        if self._count:
+            self._index_handle = open(self.index_file, "rb")
+            self._index = mmap.mmap(self._index_handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index_handle.close()
+        self._index = None
+        self._index_handle = None
+        self._count = 0
+        self._bloom = b""
+
+    def __len__(self) -> int:
+        return self._count
+
+    def is_stale(self) -> bool:
+        """True if the files were rebuilt (e.g. by another process) or entries.tsv changed since this list was loaded."""
+        mtime = self.index_file.stat().st_mtime_ns if self.index_file.exists() else None
+        return mtime != self.loaded_mtime or self._needs_rebuild()
+
+    def _might_contain(self, digest: bytes) -> bool:
+        bloom = self._bloom
+        for pos in _bloom_positions(digest, self._bloom_bits, self._bloom_hashes):
+            if not bloom[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def _index_contains(self, digest: bytes) -> bool:
+        index = self._index
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mid * DIGEST_SIZE
+            probe = index[start:start + DIGEST_SIZE]
+            if probe == digest:
+                return True
+            if probe < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        return False
+
+    def contains_key(self, key: str) -> bool:
+        if not self._count or not key:
+            return False
+        digest = _digest(key)
+        return self._might_contain(digest) and self._index_contains(digest)
+
+    def is_suppressed(self, email: str = "", domain: str = "") -> bool:
+        """True if the address, its domain or the given company domain is suppressed."""
+        if not self._count:
+            return False
+        keys = []
+        if email:
+            keys.append(entry_key(email))
+            keys.append(f"d:{normalize_domain(email)}")
+        if domain:
+            keys.append(f"d:{normalize_domain(domain)}")
+        if any(self.contains_key(key) for key in keys):
+            with self._lock:
+                self.hits += 1
+            return True
+        return False
+
+    def check_row(self, row: dict, email_columns: list[str], domain_columns: tuple[str, ...] = ("Domain",)) -> bool:
+        """is_suppressed() for a contact row, looking up the first non-empty email and domain columns."""
+        email = next((row[c] for c in email_columns if row.get(c)), "")
+        domain = next((row[c] for c in domain_columns if row.get(c)), "")
+        return self.is_suppressed(email, domain)
+
+    def add(self, values, reason: str = "") -> int:
+        """
+        Append emails/domains to entries.tsv and rebuild the index and bloom filter.
+        Returns how many valid entries were given.
+        """
+        keys = [key for key in (entry_key(v) for v in values) if key]
+        if not keys:
+            return 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        added_at = datetime.now().isoformat(timespec="seconds")
+        reason = reason.replace("\t", " ").replace("\n", " ")
+        with open(self.entries_file, "a", encoding="utf-8") as f:
+            for key in keys:
+                f.write(f"{key}\t{reason}\t{added_at}\n")
+        self.rebuild()
+        return len(keys)
+
+    def rebuild(self) -> int:
+        """Rebuild index.bin and bloom.bin from entries.tsv. Returns the distinct key count."""
+        digests = set()
+        if self.entries_file.exists():
+            with open(self.entries_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    key = line.split("\t", 1)[0].strip()
+                    if key:
+                        digests.add(_digest(key))
+        ordered = sorted(digests)
+
+        bits = max(64, len(ordered) * BLOOM_BITS_PER_KEY)
+        hashes = max(1, min(BLOOM_HASHES, round(BLOOM_BITS_PER_KEY * math.log(2))))
+        bloom = bytearray((bits + 7) // 8)
+        for digest in ordered:
+            for pos in _bloom_positions(digest, bits, hashes):
+                bloom[pos >> 3] |= 1 << (pos & 7)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so readers never see a half-written file; index last, since
+        # its mtime is what tells other processes to reload
+        tmp_bloom = self.bloom_file.with_suffix(".tmp")
+        with open(tmp_bloom, "wb") as f:
+            f.write(BLOOM_HEADER.pack(bits, hashes))
+            f.write(bloom)
+        tmp_index = self.index_file.with_suffix(".tmp")
+        with open(tmp_index, "wb") as f:
+            f.write(b"".join(ordered))
+        os.replace(tmp_bloom, self.bloom_file)
+        os.replace(tmp_index, self.index_file)
+        self._open()
+        return len(ordered)
+
+
+def read_entries_file(path: str, domains: bool = False) -> list[str]:
+    """
+    Emails from a file: a CSV with an email column (e.g. a mail merge output
+    or bounce report), or one entry per line. Whole domains - a CSV row's
+    domain column when it has no email, or a line without "@" - are only
+    returned with domains=True, since one of them suppresses a whole company.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        sample = f.readline()
+        f.seek(0)
+        if "," in sample:
+            reader = csv.DictReader(f)
+            fields = reader.fieldnames or []
+            email_columns = [c for c in fields if "email" in c.lower()]
+            domain_columns = [c for c in fields if "domain" in c.lower()] if domains else []
+            values = []
+            for row in reader:
+                emails = [row[c] for c in email_columns if row.get(c)]
+                values.extend(emails or [row[c] for c in domain_columns if row.get(c)])
+            return values
+        lines = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        return [line for line in lines if domains or "@" in line]
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_suppression_list() -> SuppressionList:
+    """Process-wide list for SUPPRESSION_DIR, reloaded when another process rebuilds it."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = SuppressionList()
+        elif _default.is_stale():
+            # A fresh instance rather than an in-place reload, so readers on other threads keep a valid mmap
+            _default = SuppressionList()
+        return _default
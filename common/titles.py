@@ -0,0 +1,161 @@
+"""
+Local job-title classifier for outreach targeting.
+
+Titles are normalized to lowercase word tokens and scanned once against a
+token trie built from the target roles and their synonyms, so matching a
+title costs O(tokens x longest pattern) no matter how many patterns exist.
+"""
+
+import re
+
+# Titles we want to email, most valuable first
+TARGET_TITLES = [
+    "Developer Relations", "DevRel", "University Recruiter",
+    "Campus Recruiter", "Head of Engineering", "Founder", "CTO",
+    "Developer Advocate", "Partnerships", "Sponsorships"
+]
+
+# Synonyms for each canonical target role. Keys are matched case-insensitively
+# against the target titles passed to TitleMatcher.
+ROLE_SYNONYMS = {
+    "developer relations": [
+        "developer relations", "devrel", "dev rel", "developer experience", "dx lead",
+        "head of developer relations", "developer community",
+    ],
+    "developer advocate": [
+        "developer advocate", "developer evangelist", "dev advocate", "technical evangelist",
+        "technology evangelist", "developer advocacy",
+    ],
+    "university recruiter": [
+        "university recruiter", "university recruiting", "university relations",
+        "early career recruiter", "early careers", "early talent", "emerging talent",
+        "student programs",
+    ],
+    "campus recruiter": ["campus recruiter", "campus recruiting", "campus relations"],
+    "head of engineering": [
+        "head of engineering", "vp engineering", "vp of engineering", "vice president of engineering",
+        "svp engineering", "director of engineering", "engineering director",
+    ],
+    "founder": ["founder", "co founder", "cofounder", "founding engineer"],
+    "cto": ["cto", "chief technology officer", "chief technical officer"],
+    "partnerships": [
+        "partnerships", "partnership", "partner manager", "strategic alliances", "alliances", "bd lead",
+    ],
+    "sponsorships": ["sponsorships", "sponsorship"],
+}
+
+# Roles that sometimes own sponsorships but are usually staff without budget
+# (and "business development" is often entry-level sales): they still match,
+# at a fraction of the target's weight, so --min-title-score can drop them
+WEAK_SYNONYMS = {
+    "partnerships": {"business development": 0.5},
+    "sponsorships": {"events manager": 0.5, "community manager": 0.5},
+}
+
+# Words that, right before a role, mean the person no longer holds it ("Former CTO")
+DISQUALIFIERS = {"former", "ex", "previously", "retired", "aspiring"}
+# Words that make a match much less useful for sponsorship outreach
+DOWNWEIGHTS = {"intern": 0.3, "student": 0.3, "assistant": 0.6, "associate": 0.8, "contractor": 0.7}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# "Name - Role - Employer | LinkedIn": separators between a headline's parts
+_HEADLINE_SEPARATOR = re.compile(r"\s+[-–—|·•]\s+")
+# "Role at Employer" / "Role @ Employer"
+_EMPLOYER = re.compile(r"\s+(?:at|@)\s+|\s*@", re.IGNORECASE)
+
+
+def normalize(text: str) -> list[str]:
+    """Lowercase word tokens; punctuation and separators are dropped ("Co-Founder" -> co, founder)."""
+    return _TOKEN.findall(text.lower())
+
+
+def strip_employer(title: str) -> str:
+    """The role without its employer: "Software Engineer at Partnership on AI" -> "Software Engineer"."""
+    return _EMPLOYER.split(title or "", maxsplit=1)[0].strip()
+
+
+def role_text(headline: str) -> str:
+    """
+    The role in a LinkedIn search result title, so words in the employer's
+    name aren't matched as roles: "Ada L - CTO at Acme | LinkedIn" -> "CTO",
+    "Ada L - Head of DevRel - Acme" -> "Head of DevRel". Without separators
+    the whole text is taken as the title.
+    """
+    parts = [p.strip() for p in _HEADLINE_SEPARATOR.split(headline or "") if p.strip()]
+    if not parts:
+        return ""
+    # The first part is the person's name, the second their role
+    return strip_employer(parts[1] if len(parts) > 1 else parts[0])
+
+
+class TitleMatcher:
+    """
+    Precompiled multi-pattern matcher for a list of target titles.
+    Earlier targets are considered more valuable and score higher.
+    """
+
+    def __init__(self, target_titles: list[str]):
+        self.target_titles = list(target_titles)
+        self._trie = {}
+        count = len(self.target_titles)
+        for priority, target in enumerate(self.target_titles):
+            weight = 1.0 - 0.5 * priority / max(1, count - 1)
+            patterns = ROLE_SYNONYMS.get(target.lower(), []) + [target]
+            for pattern in patterns:
+                self._add(normalize(pattern), target, weight)
+            for pattern, factor in WEAK_SYNONYMS.get(target.lower(), {}).items():
+                self._add(normalize(pattern), target, weight * factor)
+
+    def _add(self, tokens: list[str], target: str, weight: float) -> None:
+        if not tokens:
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        # Keep the best-weighted target if two targets share a synonym
+        existing = node.get(None)
+        if existing is None or existing[1] < weight:
+            node[None] = (target, weight)
+
+    def matches(self, title: str) -> list[tuple[str, float]]:
+        """Every (target, weight) whose pattern occurs in the title and isn't disqualified."""
+        return self._match_tokens(normalize(title))
+
+    def _match_tokens(self, tokens: list[str]) -> list[tuple[str, float]]:
+        found = []
+        for start in range(len(tokens)):
+            if start > 0 and tokens[start - 1] in DISQUALIFIERS:
+                continue
+            node = self._trie
+            for token in tokens[start:]:
+                node = node.get(token)
+                if node is None:
+                    break
+                if None in node:
+                    found.append(node[None])
+        return found
+
+    def score(self, title: str) -> tuple[str, float]:
+        """
+        Best matching target title and a relevance score in [0, 1].
+        Returns ("", 0.0) for titles that match no target.
+        """
+        if not title:
+            return "", 0.0
+        tokens = normalize(title)
+        found = self._match_tokens(tokens)
+        if not found:
+            return "", 0.0
+        target, weight = max(found, key=lambda m: m[1])
+        # Small bonus for profiles that cover several target roles (e.g. "Founder & CTO")
+        weight = min(1.0, weight + 0.05 * (len({t for t, _ in found}) - 1))
+        present = set(tokens)
+        for word, factor in DOWNWEIGHTS.items():
+            if word in present:
+                weight *= factor
+        return target, round(weight, 3)
+
+    def score_many(self, titles) -> list[tuple[str, float]]:
+        """Score an iterable of titles in bulk."""
+        score = self.score
+        return [score(title) for title in titles]
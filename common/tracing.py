@@ -0,0 +1,198 @@
+"""
+Lightweight tracing for external API calls.
+
+Every LLM or Exa call is wrapped in a span that records its stage, latency,
+token usage and estimated cost. Spans are appended to a per-run JSONL file
+under .cache/traces/ and summarized when the process exits.
+
+Usage:
+    with trace_span("evaluation", "chat.completions.create", model=model) as span:
+        response = client.chat.completions.create(...)
+        span.record(response)
+"""
+
+import os
+import json
+import math
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+TRACE_DIR = Path(os.getenv("MONEYPRINTER_TRACE_DIR", PROJECT_ROOT / ".cache" / "traces"))
+
+# Child processes (sharded emailer workers) inherit the run id, so their
+# spans land in the same file as the parent's.
+RUN_ID = os.environ.setdefault("MONEYPRINTER_RUN_ID", f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}")
+TRACE_FILE = TRACE_DIR / f"{RUN_ID}.jsonl"
+
+# Estimated USD per 1M tokens (input, output) - update when OpenRouter pricing changes
+MODEL_PRICES = {
+    "google/gemini-2.0-flash-001": (0.10, 0.40),
+    "openai/gpt-4o-mini": (0.15, 0.60),
+}
+# Estimated USD per Exa request when the response doesn't report its own cost
+EXA_COST_PER_CALL = 0.005
+
+_lock = threading.Lock()
+_summary_registered = False
+
+
+class Span:
+    """One traced external call. Fill in usage with record() before the block exits."""
+
+    def __init__(self, stage: str, operation: str, model: str | None = None, **attrs):
+        self.stage = stage
+        self.operation = operation
+        self.model = model
+        self.attrs = attrs
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost = None
+        self.status = "ok"
+        self.error = None
+
+    def record(self, response) -> None:
+        """Pull token usage (OpenAI) or result count and cost (Exa) from a response."""
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self.record_usage(usage)
+        results = getattr(response, "results", None)
+        if results is not None:
+            self.attrs["results"] = len(results)
+        cost = getattr(response, "cost_dollars", None)
+        total = getattr(cost, "total", None) if cost is not None else None
+        if total is not None:
+            self.cost = float(total)
+
+    def record_usage(self, usage) -> None:
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+    def estimated_cost(self) -> float:
+        if self.cost is not None:
+            return self.cost
+        if self.operation.startswith("exa."):
+            return EXA_COST_PER_CALL
+        price_in, price_out = MODEL_PRICES.get(self.model, (0.0, 0.0))
+        return (self.prompt_tokens * price_in + self.completion_tokens * price_out) / 1_000_000
+
+
+@contextmanager
+def trace_span(stage: str, operation: str, model: str | None = None, **attrs):
+    """Time an external call and append it to the trace file, even if it raises."""
+    span = Span(stage, operation, model, **attrs)
+    started = time.time()
+    t0 = time.perf_counter()
+    try:
+        yield span
+    except BaseException as e:
+        span.status = "error"
+        span.error = f"{type(e).__name__}: {e}"[:300]
+        raise
+    finally:
+        write_span(span, started, (time.perf_counter() - t0) * 1000)
+
+
+def write_span(span: Span, started: float, duration_ms: float) -> None:
+    """Append a finished span; for calls that can't be wrapped in trace_span (e.g. a hedge still running after its caller returned)."""
+    global _summary_registered
+    entry = {
+        "run_id": RUN_ID,
+        "pid": os.getpid(),
+        "ts": started,
+        "stage": span.stage,
+        "operation": span.operation,
+        "model": span.model,
+        "duration_ms": round(duration_ms, 2),
+        "prompt_tokens": span.prompt_tokens,
+        "completion_tokens": span.completion_tokens,
+        "cost_usd": round(span.estimated_cost(), 6),
+        "status": span.status,
+    }
+    if span.error:
+        entry["error"] = span.error
+    if span.attrs:
+        entry["attrs"] = span.attrs
+
+    line = json.dumps(entry, default=str) + "\n"
+    with _lock:
+        TRACE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(line)
+        if not _summary_registered:
+            _summary_registered = True
+            atexit.register(print_summary)
+
+
+def load_spans(trace_file: str | Path | None = None) -> list[dict]:
+    """Read spans from a trace file (defaults to this run's)."""
+    path = Path(trace_file) if trace_file else TRACE_FILE
+    if not path.exists():
+        return []
+    spans = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(spans: list[dict]) -> dict[str, dict]:
+    """Aggregate spans per stage: calls, errors, p50/p95 latency, tokens, unusable tokens, cost."""
+    stages = {}
+    for span in spans:
+        stage = stages.setdefault(span["stage"], {
+            "calls": 0, "errors": 0, "latencies": [], "tokens": 0, "wasted_tokens": 0, "cost_usd": 0.0
+        })
+        stage["calls"] += 1
+        stage["errors"] += span["status"] != "ok"
+        if not (span.get("attrs") or {}).get("hedge_loser"):
+            # A losing hedge is paid for, but nobody waited on it
+            stage["latencies"].append(span["duration_ms"])
+        stage["tokens"] += span["prompt_tokens"] + span["completion_tokens"]
+        stage["wasted_tokens"] += (span.get("attrs") or {}).get("wasted_tokens", 0)
+        stage["cost_usd"] += span["cost_usd"]
+
+    for stage in stages.values():
+        latencies = stage.pop("latencies")
+        stage["p50_ms"] = percentile(latencies, 50)
+        stage["p95_ms"] = percentile(latencies, 95)
+    return stages
+
+
+def print_summary(trace_file: str | Path | None = None) -> None:
+    """Print the per-stage call summary for a run."""
+    stages = summarize(load_spans(trace_file))
+    if not stages:
+        return
+
+    print("\n" + "=" * 70)
+    print("⏱️  API CALL SUMMARY")
+    print("=" * 70)
+    print(f"   {'Stage':<14}{'Calls':>7}{'Errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'Tokens':>10}{'Wasted':>8}{'Est. $':>10}")
+    for name, stage in sorted(stages.items()):
+        print(
+            f"   {name:<14}{stage['calls']:>7}{stage['errors']:>8}{stage['p50_ms']:>10.0f}"
+            f"{stage['p95_ms']:>10.0f}{stage['tokens']:>10}{stage['wasted_tokens']:>8}{stage['cost_usd']:>10.4f}"
+        )
+    total_calls = sum(s["calls"] for s in stages.values())
+    total_tokens = sum(s["tokens"] for s in stages.values())
+    total_wasted = sum(s["wasted_tokens"] for s in stages.values())
+    total_cost = sum(s["cost_usd"] for s in stages.values())
+    print(f"   {'Total':<14}{total_calls:>7}{'':>28}{total_tokens:>10}{total_wasted:>8}{total_cost:>10.4f}")
+    print(f"   Trace: {trace_file or TRACE_FILE}")
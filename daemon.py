@@ -0,0 +1,257 @@
+"""
+Warm daemon: keeps API clients, caches and the saved-search index in memory.
+
+Scripted runs pay for imports, .env loading, client setup and cache warm-up on
+every start. The daemon pays once and serves commands over a Unix socket,
+one JSON request and one JSON response per connection:
+
+    {"command": "contacts", "args": {"company": "Vercel", "domain": "vercel.com"}}
+    {"ok": true, "result": [...], "seconds": 1.42}
+
+    python daemon.py start            # background; logs to .cache/daemon.log
+    python daemon.py serve            # foreground
+    python daemon.py call searches
+    python daemon.py call draft --args '{"template": "...", "row": {...}}'
+    python daemon.py status | stop
+
+The client half of this module only uses the standard library, so it starts
+fast; headhunter and emailer are imported by the server alone.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import subprocess
+import socketserver
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+SOCKET_PATH = Path(os.getenv("MONEYPRINTER_SOCKET", PROJECT_ROOT / ".cache" / "moneyprinter.sock"))
+LOG_PATH = PROJECT_ROOT / ".cache" / "daemon.log"
+START_TIMEOUT = 30.0
+
+
+# --- CLIENT ---
+
+class DaemonError(RuntimeError):
+    """The daemon isn't running or the command failed on its side."""
+
+
+def call(command: str, timeout: float | None = None, **args):
+    """Send one command to the daemon and return its result."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(SOCKET_PATH))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonError(f"daemon not running at {SOCKET_PATH} (start it with `python daemon.py start`)") from e
+        sock.sendall(json.dumps({"command": command, "args": args}).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        data = b"".join(iter(lambda: sock.recv(65536), b""))
+    response = json.loads(data)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "unknown error"))
+    return response["result"]
+
+
+def is_running() -> bool:
+    try:
+        return call("ping", timeout=2) == "pong"
+    except (DaemonError, OSError, ValueError):
+        return False
+
+
+def start_background() -> None:
+    """Start the daemon in a detached process and wait until it answers."""
+    if is_running():
+        print(f"✅ Daemon already running at {SOCKET_PATH}")
+        return
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOG_PATH, "a") as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve"],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+            start_new_session=True, cwd=str(PROJECT_ROOT)
+        )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_running():
+            print(f"✅ Daemon started at {SOCKET_PATH} (log: {LOG_PATH})")
+            return
+        time.sleep(0.2)
+    print(f"❌ Daemon didn't come up within {START_TIMEOUT:.0f}s - see {LOG_PATH}")
+
+
+# --- SERVER ---
+
+class Daemon:
+    """Resident state plus the command table the socket handler dispatches to."""
+
+    def __init__(self):
+        sys.path.insert(0, str(PROJECT_ROOT))
+        sys.path.insert(0, str(PROJECT_ROOT / "find-companies"))
+        sys.path.insert(0, str(PROJECT_ROOT / "request-sponsorship"))
+        import headhunter
+        import emailer
+        self.headhunter = headhunter
+        self.emailer = emailer
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.server = None
+
+        # Pay the warm-up costs now rather than on the first request
+        headhunter.get_openai_client()
+        headhunter.get_exa_client()
+        emailer.get_openai_client()
+        emailer.get_llm_cache()
+        headhunter.list_saved_searches()
+
+        self.commands = {
+            "ping": lambda: "pong",
+            "stats": self.stats,
+            "searches": headhunter.list_saved_searches,
+            "load_search": self.load_search,
+            "discover": self.discover,
+            "search": lambda query, num_results=15: [
+                c.to_dict() for c in headhunter.search_companies_by_query(query, num_results)
+            ],
+            "similar": lambda seed_url, num_results=15: [
+                c.to_dict() for c in headhunter.search_similar_companies(seed_url, num_results)
+            ],
+            "contacts": self.contacts,
+            "draft": self.draft,
+            "shutdown": self.shutdown,
+        }
+
+    def stats(self) -> dict:
+        from common.resilience import host_stats
+        from common.negative_cache import get_negative_cache
+        cache = self.emailer.get_llm_cache()
+        negative = get_negative_cache()
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "saved_searches": len(self.headhunter.list_saved_searches()),
+            "llm_cache": {"entries": len(cache), "hits": cache.hits, "misses": cache.misses} if cache else None,
+            "negative_cache": {"entries": len(negative.cache), "saved_calls": dict(negative.saved)},
+            "hosts": host_stats(),
+        }
+
+    def load_search(self, filepath: str) -> dict:
+        prompt, companies, conversation, _ = self.headhunter.load_search(filepath)
+        return {"prompt": prompt, "companies": companies, "conversation": conversation}
+
+    def discover(self, prompt: str, mode: str = None) -> list[dict]:
+        return self.headhunter.discover_companies(prompt, mode or self.headhunter.AGENT_MODE)
+
+    def contacts(self, company: str, domain: str, strategy: str = None) -> list[dict]:
+        strategy = strategy or self.headhunter.ENRICHMENT_STRATEGY
+        return self.headhunter.find_linkedin_contacts(company, domain, strategy, verbose=False)
+
+    def draft(self, template: str, row: dict, refresh: bool = False) -> dict:
+        subject, body = self.emailer.generate_email(template, row, refresh=refresh)
+        return {"subject": subject, "body": body}
+
+    def shutdown(self) -> str:
+        # shutdown() blocks until serve_forever returns, so it can't run on a handler thread
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+        return "stopping"
+
+    def handle(self, request: dict) -> dict:
+        with self._lock:
+            self.requests += 1
+        command = request.get("command")
+        handler = self.commands.get(command)
+        if handler is None:
+            return {"ok": False, "error": f"unknown command {command!r}; known: {', '.join(sorted(self.commands))}"}
+        started = time.perf_counter()
+        try:
+            result = handler(**(request.get("args") or {}))
+        except Exception as e:
+            print(f"   ⚠️ {command} failed: {type(e).__name__}: {e}", flush=True)
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "result": result, "seconds": round(time.perf_counter() - started, 3)}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.read())
+        except ValueError as e:
+            response = {"ok": False, "error": f"bad request: {e}"}
+        else:
+            response = self.server.daemon.handle(request)
+        self.wfile.write(json.dumps(response, default=str).encode("utf-8"))
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve() -> None:
+    if is_running():
+        print(f"❌ A daemon is already listening on {SOCKET_PATH}")
+        return
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()  # stale socket from a daemon that didn't exit cleanly
+
+    print("🔥 Warming up...", flush=True)
+    daemon = Daemon()
+    with _Server(str(SOCKET_PATH), _Handler) as server:
+        server.daemon = daemon
+        daemon.server = server
+        os.chmod(SOCKET_PATH, 0o600)
+        print(f"✅ Listening on {SOCKET_PATH} (pid {os.getpid()})", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            SOCKET_PATH.unlink(missing_ok=True)
+    print("👋 Daemon stopped", flush=True)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Warm moneyprinter daemon")
+    sub = parser.add_subparsers(dest="action", required=True)
+    sub.add_parser("start", help="Start the daemon in the background")
+    sub.add_parser("serve", help="Run the daemon in the foreground")
+    sub.add_parser("stop", help="Stop a running daemon")
+    sub.add_parser("status", help="Show daemon stats")
+    call_parser = sub.add_parser("call", help="Send a command and print its JSON result")
+    call_parser.add_argument("command", help="Command name, e.g. searches, contacts, draft")
+    call_parser.add_argument("--args", default="{}", help="JSON object of keyword arguments")
+    args = parser.parse_args(argv)
+
+    if args.action == "start":
+        start_background()
+    elif args.action == "serve":
+        serve()
+    elif args.action == "stop":
+        if is_running():
+            call("shutdown")
+            print("👋 Daemon stopping")
+        else:
+            print("Daemon is not running.")
+    elif args.action == "status":
+        if is_running():
+            print(json.dumps(call("stats"), indent=2))
+        else:
+            print("Daemon is not running.")
+    elif args.action == "call":
+        try:
+            print(json.dumps(call(args.command, **json.loads(args.args)), indent=2, default=str))
+        except DaemonError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,29 @@
 import os
-import time
+import sys
 import json
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from exa_py import Exa
 from openai import OpenAI
-from urllib.parse import urlparse
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.tracing import trace_span
+from common.resilience import call_with_retry, CircuitOpenError
+from common.routing import routed_completion
+from common.structured import structured_completion, EVALUATION_SCHEMA, PLAN_SCHEMA, REFINE_SCHEMA
+from common.progress import Progress, emit
+from common.contacts import CONTACT_FIELDS
+from common.records import Company, Evaluation, to_json
+from common.suppression import get_suppression_list
+from common.apollo import get_enricher
+from common.negative_cache import get_negative_cache
+from common.company_identity import get_company_index, company_name as name_from_title, normalize_name, domain_stem
+from common.history_index import get_history_index, print_hits
+from common.titles import TARGET_TITLES, TitleMatcher, role_text
+
 # --- CONFIGURATION ---
 load_dotenv()
 
@@ -16,69 +31,97 @@ EXA_API_KEY = os.getenv("EXA_API_KEY", "YOUR_EXA_KEY")
 APOLLO_API_KEY = os.getenv("APOLLO_API_KEY", "YOUR_APOLLO_KEY")
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "YOUR_OPENROUTER_KEY")
 
-# Titles we want to email
-TARGET_TITLES = [
-    "Developer Relations", "DevRel", "University Recruiter", 
-    "Campus Recruiter", "Head of Engineering", "Founder", "CTO",
-    "Developer Advocate", "Partnerships", "Sponsorships"
-]
+# Titles we want to email (edit the list in common/titles.py)
+TITLE_MATCHER = TitleMatcher(TARGET_TITLES)
+
+# API clients are created once and shared, so their connection pools are reused
+_openai_client = None
+_exa_client = None
+
+
+def get_openai_client() -> OpenAI:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI(
+            api_key=OPENROUTER_API_KEY,
+            base_url="https://openrouter.ai/api/v1",
+            max_retries=0  # call_with_retry owns retries, backoff and throttling
+        )
+    return _openai_client
+
+
+def get_exa_client() -> Exa:
+    global _exa_client
+    if _exa_client is None:
+        _exa_client = Exa(EXA_API_KEY)
+    return _exa_client
 
 # --- EXA TOOLS (callable by the LLM) ---
 
-def search_similar_companies(seed_url: str, num_results: int = 15) -> list[dict]:
+def search_similar_companies(seed_url: str, num_results: int = 15) -> list[Company]:
     """
     Uses Exa's Neural Search to find companies similar to a seed URL.
-    Returns a list of company domains with their titles and descriptions.
+    Returns a Company (domain, title, URL) per result.
     """
-    print(f"\n🤖 [Exa Tool] Searching for companies similar to {seed_url}...")
+    negative = get_negative_cache()
+    if negative.is_known_empty("exa_similar", seed_url):
+        emit(f"\n💾 [Exa Tool] Skipping {seed_url}: no similar companies found recently")
+        return []
     
-    exa = Exa(EXA_API_KEY)
+    emit(f"\n🤖 [Exa Tool] Searching for companies similar to {seed_url}...")
     
-    response = exa.find_similar(
-        url=seed_url,
-        num_results=num_results,
-        exclude_source_domain=True,
-        category="company"
-    )
+    exa = get_exa_client()
+    
+    with trace_span("search", "exa.find_similar") as span:
+        response = call_with_retry(
+            "exa", exa.find_similar, span=span,
+            url=seed_url,
+            num_results=num_results,
+            exclude_source_domain=True,
+            category="company"
+        )
+        span.record(response)
     
-    companies = []
-    for result in response.results:
-        domain = urlparse(result.url).netloc.replace("www.", "")
-        companies.append({
-            "domain": domain,
-            "title": result.title,
-            "url": result.url
-        })
-        print(f"   Found: {domain} - {result.title}")
+    companies = [Company.from_result(result) for result in response.results]
+    found = [f"   Found: {c.domain} - {c.title}" for c in companies]
+    if not companies:
+        negative.record_empty("exa_similar", seed_url)
+    # Print the hits together as soon as this search is done
+    emit(f"\n🔹 {len(companies)} results for {seed_url}:", *found)
     
     return companies
 
 
-def search_companies_by_query(query: str, num_results: int = 15) -> list[dict]:
+def search_companies_by_query(query: str, num_results: int = 15) -> list[Company]:
     """
     Uses Exa's Neural Search to find companies matching a text query.
-    Returns a list of company domains with their titles and descriptions.
+    Returns a Company (domain, title, URL) per result.
     """
-    print(f"\n🤖 [Exa Tool] Searching for: {query}...")
+    negative = get_negative_cache()
+    if negative.is_known_empty("exa_query", query.strip().lower()):
+        emit(f"\n💾 [Exa Tool] Skipping '{query}': no companies found recently")
+        return []
     
-    exa = Exa(EXA_API_KEY)
+    emit(f"\n🤖 [Exa Tool] Searching for: {query}...")
     
-    response = exa.search(
-        query=query,
-        num_results=num_results,
-        type="neural",
-        category="company",
-    )
+    exa = get_exa_client()
+    
+    with trace_span("search", "exa.search") as span:
+        response = call_with_retry(
+            "exa", exa.search, span=span,
+            query=query,
+            num_results=num_results,
+            type="neural",
+            category="company",
+        )
+        span.record(response)
     
-    companies = []
-    for result in response.results:
-        domain = urlparse(result.url).netloc.replace("www.", "")
-        companies.append({
-            "domain": domain,
-            "title": result.title,
-            "url": result.url
-        })
-        print(f"   Found: {domain} - {result.title}")
+    companies = [Company.from_result(result) for result in response.results]
+    found = [f"   Found: {c.domain} - {c.title}" for c in companies]
+    if not companies:
+        negative.record_empty("exa_query", query.strip().lower())
+    # Print the hits together as soon as this search is done
+    emit(f"\n🔹 {len(companies)} results for '{query}':", *found)
     
     return companies
 
@@ -187,7 +230,7 @@ Think strategically about good search queries. For hackathon sponsors, consider:
 Always aim for QUALITY over quantity - it's better to have 10 well-vetted companies than 50 unknown ones."""
 
 
-def execute_tool_call(tool_name: str, arguments: dict, user_prompt: str = "") -> dict | list[dict]:
+def execute_tool_call(tool_name: str, arguments: dict, user_prompt: str = "") -> dict | list[Company]:
     """Execute a tool call and return results."""
     if tool_name == "search_similar_companies":
         return search_similar_companies(
@@ -202,41 +245,41 @@ def execute_tool_call(tool_name: str, arguments: dict, user_prompt: str = "") ->
     elif tool_name == "evaluate_companies":
         return evaluate_companies_tool(
             user_prompt=user_prompt,
-            companies=arguments["companies"]
+            companies=dedupe_companies([Company.from_dict(c) for c in arguments["companies"] if isinstance(c, dict)])
         )
     else:
         return []
 
 
-def run_agent(user_prompt: str) -> list[dict]:
+def run_agent(user_prompt: str, on_approved=None) -> list[dict]:
     """
     Run the LLM agent with the user's prompt.
     Returns a list of evaluated companies (with rationale).
+    on_approved(evaluations), if given, receives each evaluation's approved
+    Evaluations as soon as it finishes (they may repeat across calls).
     """
-    client = OpenAI(
-        api_key=OPENROUTER_API_KEY,
-        base_url="https://openrouter.ai/api/v1"
-    )
+    client = get_openai_client()
     
     messages = [
         {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user", "content": user_prompt}
     ]
     
-    all_companies = []  # Raw discovered companies
-    evaluated_companies = []  # Companies that passed evaluation
+    evaluated_companies = []  # Evaluations of the companies that passed
     
     print("\n" + "="*60)
     print("🧠 Agent is thinking...")
     print("="*60)
     
     while True:
-        response = client.chat.completions.create(
-            model="google/gemini-2.0-flash-001",
-            messages=messages,
-            tools=TOOLS,
-            tool_choice="auto"
-        )
+        with trace_span("agent", "chat.completions.create") as span:
+            response = routed_completion(
+                client, "agent", span=span,
+                messages=messages,
+                tools=TOOLS,
+                tool_choice="auto"
+            )
+            span.record(response)
         
         message = response.choices[0].message
         
@@ -244,6 +287,7 @@ def run_agent(user_prompt: str) -> list[dict]:
         if message.tool_calls:
             messages.append(message)
             
+            calls = []
             for tool_call in message.tool_calls:
                 tool_name = tool_call.function.name
                 arguments = json.loads(tool_call.function.arguments)
@@ -253,24 +297,36 @@ def run_agent(user_prompt: str) -> list[dict]:
                     print(f"   Arguments: {json.dumps(arguments, indent=2)}")
                 else:
                     print(f"   Evaluating {len(arguments.get('companies', []))} companies...")
+                calls.append((tool_call, tool_name, arguments))
+            
+            # Run this turn's tool calls concurrently; each prints its results as it finishes
+            outcomes = {}
+            with ThreadPoolExecutor(max_workers=min(SEARCH_WORKERS, len(calls))) as pool:
+                futures = {
+                    pool.submit(execute_tool_call, tool_name, arguments, user_prompt): tool_call.id
+                    for tool_call, tool_name, arguments in calls
+                }
+                for future in as_completed(futures):
+                    try:
+                        outcomes[futures[future]] = future.result()
+                    except Exception as e:
+                        emit(f"   ⚠️ Tool call failed: {e}")
+                        outcomes[futures[future]] = {"error": str(e)}
+            
+            for tool_call, tool_name, arguments in calls:
+                results = outcomes[tool_call.id]
                 
-                results = execute_tool_call(tool_name, arguments, user_prompt)
-                
-                # Track results based on tool type
-                if tool_name == "evaluate_companies":
-                    # Store the approved companies
-                    if isinstance(results, dict) and "approved" in results:
-                        evaluated_companies.extend(results["approved"])
-                else:
-                    # Search tools return list of companies
-                    if isinstance(results, list):
-                        all_companies.extend(results)
+                # Store the approved companies; search results only need to reach the agent
+                if tool_name == "evaluate_companies" and isinstance(results, dict) and "approved" in results:
+                    evaluated_companies.extend(results["approved"])
+                    if on_approved is not None and results["approved"]:
+                        on_approved(results["approved"])
                 
                 # Add tool result to conversation
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
-                    "content": json.dumps(results) if isinstance(results, (dict, list)) else str(results)
+                    "content": json.dumps(results, default=to_json) if isinstance(results, (dict, list)) else str(results)
                 })
         else:
             # Agent is done, print final message
@@ -281,46 +337,15 @@ def run_agent(user_prompt: str) -> list[dict]:
                 print(message.content)
             break
     
-    # Deduplicate evaluated companies by domain
-    seen = set()
-    unique_evaluated = []
-    for company in evaluated_companies:
-        domain = company.get("domain", "")
-        if domain and domain not in seen:
-            seen.add(domain)
-            unique_evaluated.append(company)
-    
-    return unique_evaluated
+    # Deduplicate evaluated companies by identity
+    return [evaluation.to_dict() for evaluation in dedupe_companies(evaluated_companies)]
 
 
-def evaluate_companies_tool(user_prompt: str, companies: list[dict]) -> dict:
-    """
-    Tool version of evaluate_companies that returns structured feedback
-    including rejected companies with reasons.
-    """
-    print("\n" + "="*60)
-    print("🔍 Evaluating companies...")
-    print("="*60)
-    
-    if not companies:
-        return {
-            "approved": [],
-            "rejected": [],
-            "feedback": "No companies to evaluate."
-        }
+def tool_evaluation_prompt(user_prompt: str, companies: list[Company]) -> str:
+    """The evaluate_companies tool's prompt for a list of companies."""
+    company_list = "\n".join(c.prompt_line() for c in companies)
     
-    client = OpenAI(
-        api_key=OPENROUTER_API_KEY,
-        base_url="https://openrouter.ai/api/v1"
-    )
-    
-    # Build the company list for evaluation
-    company_list = "\n".join([
-        f"- {c.get('domain', 'unknown')}: {c.get('title', 'Unknown')} ({c.get('url', '')})"
-        for c in companies
-    ])
-    
-    eval_prompt = f"""The user is looking for: {user_prompt}
+    return f"""The user is looking for: {user_prompt}
 
 Here is a list of companies that were found:
 {company_list}
@@ -354,72 +379,136 @@ Respond with a JSON object with two arrays:
 
 Respond with ONLY the JSON object, no other text."""
 
-    response = client.chat.completions.create(
-        model="google/gemini-2.0-flash-001",
-        messages=[
-            {"role": "user", "content": eval_prompt}
-        ],
-        max_tokens=4000
-    )
+
+def request_evaluation(user_prompt: str, companies: list[Company], build_prompt) -> tuple[list[Evaluation] | None, bool]:
+    """
+    Schema-constrained evaluation of companies with build_prompt(user_prompt, companies).
+    If the answer is cut off, the companies it didn't cover are sent again on their own.
+    Returns (an Evaluation per verdict or None, whether every company was covered).
+    """
+    def continue_with(partial: dict) -> list[dict] | None:
+        covered = {c.get("domain") for c in partial.get("approved", []) + partial.get("rejected", []) if isinstance(c, dict)}
+        missing = [c for c in companies if c.domain not in covered]
+        if not missing:
+            return None
+        emit(f"   ↪️ Evaluation was cut off, asking again for the {len(missing)} companies it didn't cover")
+        return [{"role": "user", "content": build_prompt(user_prompt, missing)}]
     
-    response_text = response.choices[0].message.content.strip()
+    def merge(partial: dict, more: dict) -> dict:
+        return {key: partial.get(key, []) + more.get(key, []) for key in ("approved", "rejected")}
     
-    try:
-        # Handle markdown code blocks if present
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-        
-        result = json.loads(response_text)
-        approved = result.get("approved", [])
-        rejected = result.get("rejected", [])
-        
-        print(f"\n✅ Approved {len(approved)} companies:")
-        for company in approved:
-            confidence_emoji = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(company.get("confidence", "medium"), "⚪")
-            print(f"   {confidence_emoji} {company.get('domain', 'unknown')}: {company.get('rationale', 'No rationale')[:50]}...")
-        
-        if rejected:
-            print(f"\n❌ Rejected {len(rejected)} companies:")
-            # Group rejections by reason
-            rejection_reasons = {}
-            for r in rejected:
-                reason = r.get("reason", "Unknown reason")
-                if reason not in rejection_reasons:
-                    rejection_reasons[reason] = []
-                rejection_reasons[reason].append(r.get("domain", "unknown"))
-            
-            for reason, domains in rejection_reasons.items():
-                print(f"   • {reason}: {', '.join(domains[:3])}{'...' if len(domains) > 3 else ''}")
-        
-        # Add feedback summary for the agent
-        feedback = f"Approved {len(approved)} companies, rejected {len(rejected)}."
-        if rejected:
-            # Summarize rejection patterns
-            unknown_count = sum(1 for r in rejected if "unknown" in r.get("reason", "").lower() or "recognize" in r.get("reason", "").lower())
-            platform_count = sum(1 for r in rejected if "platform" in r.get("reason", "").lower() or "hackathon" in r.get("reason", "").lower())
-            if unknown_count > 0:
-                feedback += f" {unknown_count} were unknown companies - try searching for more well-known companies."
-            if platform_count > 0:
-                feedback += f" {platform_count} were hackathon platforms/events - we want sponsors, not platforms."
-        
+    result, complete = structured_completion(
+        get_openai_client(), "evaluation",
+        [{"role": "user", "content": build_prompt(user_prompt, companies)}],
+        "company_evaluation", EVALUATION_SCHEMA,
+        max_tokens=4000,
+        continue_with=continue_with,
+        merge=merge,
+        companies=len(companies)
+    )
+    if not isinstance(result, dict):
+        return None, False
+    return Evaluation.from_verdicts(result, {c.domain: c for c in companies}), complete
+
+
+def evaluate_companies_tool(user_prompt: str, companies: list[Company]) -> dict:
+    """
+    Tool version of evaluate_companies that returns structured feedback
+    including rejected companies with reasons. "approved" and "rejected"
+    hold Evaluations; json.dumps(..., default=to_json) gives the agent dicts.
+    """
+    emit("\n" + "="*60, f"🔍 Evaluating {len(companies)} companies...", "="*60)
+    
+    if not companies:
         return {
-            "approved": approved,
-            "rejected": rejected,
-            "feedback": feedback
+            "approved": [],
+            "rejected": [],
+            "feedback": "No companies to evaluate."
         }
-        
-    except json.JSONDecodeError as e:
-        print(f"❌ Error parsing evaluation response: {e}")
+    
+    evaluations, complete = request_evaluation(user_prompt, companies, tool_evaluation_prompt)
+    if evaluations is None:
+        emit("❌ Error parsing evaluation response: no usable JSON in the model's answer")
         return {
             "approved": [],
             "rejected": [],
-            "feedback": f"Error evaluating companies: {e}"
+            "feedback": "Error evaluating companies: the evaluation response could not be parsed"
         }
+    
+    approved = [e for e in evaluations if e.approved]
+    rejected = [e for e in evaluations if not e.approved]
+    
+    # Collect the verdicts and print them as one block, so concurrent batches don't interleave
+    lines = [f"\n✅ Approved {len(approved)} companies:"]
+    for evaluation in approved:
+        confidence_emoji = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(evaluation.confidence or "medium", "⚪")
+        lines.append(f"   {confidence_emoji} {evaluation.domain or 'unknown'}: {(evaluation.rationale or 'No rationale')[:50]}...")
+    
+    if rejected:
+        lines.append(f"\n❌ Rejected {len(rejected)} companies:")
+        # Group rejections by reason
+        rejection_reasons = {}
+        for r in rejected:
+            reason = r.reason or "Unknown reason"
+            if reason not in rejection_reasons:
+                rejection_reasons[reason] = []
+            rejection_reasons[reason].append(r.domain or "unknown")
+        
+        for reason, domains in rejection_reasons.items():
+            lines.append(f"   • {reason}: {', '.join(domains[:3])}{'...' if len(domains) > 3 else ''}")
+    if not complete:
+        lines.append(f"\n⚠️ {len(companies) - len(approved) - len(rejected)} companies were left unevaluated (response cut off)")
+    emit(*lines)
+    
+    # Add feedback summary for the agent
+    feedback = f"Approved {len(approved)} companies, rejected {len(rejected)}."
+    if rejected:
+        # Summarize rejection patterns
+        unknown_count = sum(1 for r in rejected if "unknown" in r.reason.lower() or "recognize" in r.reason.lower())
+        platform_count = sum(1 for r in rejected if "platform" in r.reason.lower() or "hackathon" in r.reason.lower())
+        if unknown_count > 0:
+            feedback += f" {unknown_count} were unknown companies - try searching for more well-known companies."
+        if platform_count > 0:
+            feedback += f" {platform_count} were hackathon platforms/events - we want sponsors, not platforms."
+    
+    return {
+        "approved": approved,
+        "rejected": rejected,
+        "feedback": feedback
+    }
+
+
+def evaluation_prompt(user_prompt: str, companies: list[Company]) -> str:
+    """evaluate_companies' (stricter) prompt for a list of companies."""
+    company_list = "\n".join(c.prompt_line() for c in companies)
+    
+    return f"""The user is looking for: {user_prompt}
+
+Here is a list of companies that were found:
+{company_list}
+
+For each company, evaluate whether it's a good fit for the user's request.
+
+IMPORTANT RULES:
+1. EXCLUDE any company you don't recognize or haven't heard of - only include companies you have actual knowledge about
+2. EXCLUDE hackathon websites/platforms (like devpost, hackathon.io, mlh.io) - we want sponsors, not hackathon platforms
+3. EXCLUDE other hackathons (like VTHacks, HackPSU, etc.)
+4. For each company you KEEP, provide a short rationale (1-2 sentences) explaining why they're a good fit
+
+Respond with a JSON object with two arrays:
+- "approved": the companies you keep, each with these fields:
+  - "domain": the company domain
+  - "title": the company name
+  - "url": the company URL
+  - "rationale": why this company is a good fit (1-2 sentences)
+  - "confidence": "high", "medium", or "low" based on how confident you are they'd be interested
+- "rejected": every other company, each with "domain" and a short "reason"
+
+Only approve companies you genuinely recognize and believe would be good sponsorship targets.
+Respond with ONLY the JSON object, no other text."""
 
 
-def evaluate_companies(user_prompt: str, companies: list[dict]) -> list[dict]:
+def evaluate_companies(user_prompt: str, companies: list[Company]) -> list[dict]:
     """
     Use the LLM to evaluate each company, filtering out unknown ones
     and providing a rationale for why each remaining company is a good fit.
@@ -428,72 +517,220 @@ def evaluate_companies(user_prompt: str, companies: list[dict]) -> list[dict]:
     print("🔍 Evaluating companies...")
     print("="*60)
     
-    client = OpenAI(
-        api_key=OPENROUTER_API_KEY,
-        base_url="https://openrouter.ai/api/v1"
-    )
+    evaluations, complete = request_evaluation(user_prompt, companies, evaluation_prompt)
+    if evaluations is None:
+        print("❌ Error parsing LLM response: no usable JSON in the model's answer")
+        # Fall back to original list without rationale
+        return [c.to_dict() for c in companies]
     
-    # Build the company list for evaluation
-    company_list = "\n".join([
-        f"- {c['domain']}: {c['title']} ({c['url']})"
-        for c in companies
-    ])
+    evaluated = [e for e in evaluations if e.approved]
+    print(f"\n✅ Kept {len(evaluated)} companies after evaluation")
+    for evaluation in evaluated:
+        confidence_emoji = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(evaluation.confidence or "medium", "⚪")
+        print(f"   {confidence_emoji} {evaluation.domain}: {(evaluation.rationale or 'No rationale')[:60]}...")
+    if not complete:
+        print("⚠️ The evaluation was cut off; some companies were not evaluated")
     
-    eval_prompt = f"""The user is looking for: {user_prompt}
+    return [e.to_dict() for e in evaluated]
 
-Here is a list of companies that were found:
-{company_list}
 
-For each company, evaluate whether it's a good fit for the user's request.
+# --- PLAN-THEN-FAN-OUT AGENT ---
 
-IMPORTANT RULES:
-1. EXCLUDE any company you don't recognize or haven't heard of - only include companies you have actual knowledge about
-2. EXCLUDE hackathon websites/platforms (like devpost, hackathon.io, mlh.io) - we want sponsors, not hackathon platforms
-3. EXCLUDE other hackathons (like VTHacks, HackPSU, etc.)
-4. For each company you KEEP, provide a short rationale (1-2 sentences) explaining why they're a good fit
+# "loop" lets the model interleave tool calls turn by turn (run_agent);
+# "plan" asks for every search up front and runs them in parallel (run_planned_agent).
+AGENT_MODE = os.getenv("AGENT_MODE", "loop")
+SEARCH_WORKERS = 6
+EVAL_BATCH_SIZE = 25
+MIN_APPROVED = 10  # below this, the planned agent does one refinement round
 
-Respond with a JSON array of objects, each with these fields:
-- "domain": the company domain
-- "title": the company name
-- "url": the company URL
-- "rationale": why this company is a good fit (1-2 sentences)
-- "confidence": "high", "medium", or "low" based on how confident you are they'd be interested
+PLANNER_PROMPT = """You plan web searches that find potential sponsor companies for hackathons and tech events.
 
-Only include companies you genuinely recognize and believe would be good sponsorship targets.
-Respond with ONLY the JSON array, no other text."""
+Given the user's request, produce ALL the searches needed in one go:
+- "queries": 3-6 text descriptions of the kinds of companies to find (e.g. 'developer tools startups that offer free credits')
+- "seed_urls": 0-4 URLs of well-known companies whose lookalikes would be good sponsors (e.g. 'https://vercel.com')
 
-    response = client.chat.completions.create(
-        model="google/gemini-2.0-flash-001",
-        messages=[
-            {"role": "user", "content": eval_prompt}
+Think about developer tools and API companies, cloud infrastructure providers, DevOps and monitoring
+tools, and companies known for university/developer programs. Prefer well-known companies.
+
+Respond with ONLY a JSON object: {"queries": [...], "seed_urls": [...]}"""
+
+
+def plan_searches(user_prompt: str, feedback: str = "", already_searched: list[str] | None = None) -> dict:
+    """
+    One LLM call that returns {"queries": [...], "seed_urls": [...]} for the request.
+    feedback and already_searched steer a refinement round away from repeats.
+    """
+    client = get_openai_client()
+    
+    request = f"User request: {user_prompt}"
+    if already_searched:
+        request += "\n\nAlready searched (do not repeat):\n" + "\n".join(f"- {q}" for q in already_searched)
+    if feedback:
+        request += f"\n\nEvaluation feedback from the last round: {feedback}"
+    
+    plan, _ = structured_completion(
+        client, "plan",
+        [
+            {"role": "system", "content": PLANNER_PROMPT},
+            {"role": "user", "content": request}
         ],
-        max_tokens=4000
+        "search_plan", PLAN_SCHEMA,
+        max_tokens=1000
     )
+    if not isinstance(plan, dict):
+        print("❌ Error parsing search plan: no usable JSON in the model's answer")
+        # Fall back to searching for the request itself
+        plan = {"queries": [user_prompt], "seed_urls": []}
     
-    response_text = response.choices[0].message.content.strip()
+    return {
+        "queries": [q for q in plan.get("queries", []) if isinstance(q, str) and q.strip()],
+        "seed_urls": [u for u in plan.get("seed_urls", []) if isinstance(u, str) and u.strip()],
+    }
+
+
+def run_searches_parallel(plan: dict) -> list[Company]:
+    """Run every query and seed URL in the plan concurrently. Failed searches are skipped."""
+    jobs = [(search_companies_by_query, q) for q in plan["queries"]]
+    jobs += [(search_similar_companies, u) for u in plan["seed_urls"]]
+    if not jobs:
+        return []
     
-    # Parse the JSON response
-    try:
-        # Handle markdown code blocks if present
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-        
-        evaluated = json.loads(response_text)
-        
-        print(f"\n✅ Kept {len(evaluated)} companies after evaluation")
-        for company in evaluated:
-            confidence_emoji = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(company.get("confidence", "medium"), "⚪")
-            print(f"   {confidence_emoji} {company['domain']}: {company.get('rationale', 'No rationale')[:60]}...")
-        
-        return evaluated
-        
-    except json.JSONDecodeError as e:
-        print(f"❌ Error parsing LLM response: {e}")
-        print("Raw response:", response_text[:500])
-        # Fall back to original list without rationale
-        return companies
+    results = [[] for _ in jobs]
+    progress = Progress(len(jobs), "searches")
+    with ThreadPoolExecutor(max_workers=min(SEARCH_WORKERS, len(jobs))) as pool:
+        futures = {pool.submit(fn, arg): i for i, (fn, arg) in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            arg = jobs[i][1]
+            try:
+                results[i] = future.result()
+                progress.advance(f"🔎 {len(results[i])} hits for {arg}")
+            except Exception as e:
+                progress.advance(f"⚠️ Search failed for {arg}: {e}")
+    progress.finish()
+    # Keep plan order so dedupe keeps the same first occurrence as a sequential run
+    return [company for batch in results for company in batch]
+
+
+def dedupe_companies(companies: list, exclude: set[str] | None = None) -> list:
+    """
+    Keep the first Company (or Evaluation) per identity, skipping any in exclude
+    (a set of domains). Domains the company index resolves to the same company
+    (vercel.com / vercel.io, "Vercel" / "Vercel Inc.") count as one; the others
+    are listed in the kept company's aliases.
+    """
+    index = get_company_index()
+    seen = {index.resolve(domain) for domain in exclude or ()}
+    kept = {}  # canonical domain -> company
+    unique = []
+    merged = []
+    for company in companies:
+        domain = company.domain
+        if not domain:
+            continue
+        identity = index.resolve(domain, company.title)
+        if identity in kept:
+            first = kept[identity]
+            if domain != first.domain and domain not in first.aliases:
+                first.aliases.append(domain)
+                merged.append(f"{domain} → {first.domain}")
+        elif identity not in seen:
+            seen.add(identity)
+            kept[identity] = company
+            unique.append(company)
+    if merged:
+        emit(f"🔗 Merged {len(merged)} duplicate companies: {', '.join(merged[:5])}{'...' if len(merged) > 5 else ''}"
+             " (undo with `python main.py companies split DOMAIN`)")
+    return unique
+
+
+UNEVALUATED_REASON = "Not evaluated: the evaluation request failed"
+
+
+def evaluate_in_batches(user_prompt: str, companies: list[Company], on_approved=None) -> dict:
+    """
+    Evaluate Companies in concurrent batches of EVAL_BATCH_SIZE and merge the Evaluations.
+    A batch whose request fails is listed under "rejected" with UNEVALUATED_REASON.
+    on_approved(evaluations), if given, receives each batch's approved Evaluations as it finishes.
+    """
+    batches = [companies[i:i + EVAL_BATCH_SIZE] for i in range(0, len(companies), EVAL_BATCH_SIZE)]
+    merged = {"approved": [], "rejected": [], "feedback": ""}
+    if not batches:
+        return merged
+    unevaluated = []
+    
+    progress = Progress(len(batches), "evaluation batches")
+    with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+        futures = {pool.submit(evaluate_companies_tool, user_prompt, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # Keep the other batches' verdicts; these companies just go unevaluated
+                batch = futures[future]
+                unevaluated.extend(batch)
+                merged["rejected"].extend(Evaluation(c, False, reason=UNEVALUATED_REASON) for c in batch)
+                progress.advance(f"⚠️ Evaluation failed for a batch of {len(batch)} companies: {e}")
+                continue
+            if on_approved is not None and result.get("approved"):
+                on_approved(result["approved"])
+            merged["approved"].extend(result.get("approved", []))
+            merged["rejected"].extend(result.get("rejected", []))
+            progress.advance(
+                f"🧮 Batch evaluated: {len(result.get('approved', []))} approved, "
+                f"{len(result.get('rejected', []))} rejected ({len(merged['approved'])} approved so far)"
+            )
+    progress.finish()
+    merged["feedback"] = f"Approved {len(merged['approved'])} companies, rejected {len(merged['rejected']) - len(unevaluated)}."
+    if unevaluated:
+        merged["feedback"] += f" {len(unevaluated)} could not be evaluated (the request failed): {', '.join(c.domain for c in unevaluated[:10])}."
+    reasons = {}
+    for r in merged["rejected"]:
+        if r.reason == UNEVALUATED_REASON:
+            continue
+        reason = r.reason or "Unknown reason"
+        reasons[reason] = reasons.get(reason, 0) + 1
+    if reasons:
+        top = sorted(reasons.items(), key=lambda item: -item[1])[:3]
+        merged["feedback"] += " Most common rejection reasons: " + "; ".join(f"{r} ({n})" for r, n in top)
+    return merged
+
+
+def run_planned_agent(user_prompt: str, refine: bool = True, on_approved=None) -> list[dict]:
+    """
+    Alternative to run_agent with fewer LLM round trips: one planning call,
+    all searches in parallel, one batched evaluation, and at most one
+    refinement round if fewer than MIN_APPROVED companies were approved.
+    Returns a list of evaluated companies (with rationale); on_approved is
+    passed to evaluate_in_batches.
+    """
+    print("\n" + "="*60)
+    print("🧠 Planning searches...")
+    print("="*60)
+    
+    plan = plan_searches(user_prompt)
+    print(f"   {len(plan['queries'])} queries, {len(plan['seed_urls'])} seed URLs")
+    
+    candidates = dedupe_companies(run_searches_parallel(plan))
+    result = evaluate_in_batches(user_prompt, candidates, on_approved)
+    approved = result["approved"]
+    
+    if refine and len(approved) < MIN_APPROVED:
+        print(f"\n🔁 Only {len(approved)} approved - running one refinement round...")
+        searched = plan["queries"] + plan["seed_urls"]
+        extra_plan = plan_searches(user_prompt, feedback=result["feedback"], already_searched=searched)
+        seen = {c.domain for c in candidates}
+        extra = dedupe_companies(run_searches_parallel(extra_plan), exclude=seen)
+        approved.extend(evaluate_in_batches(user_prompt, extra, on_approved)["approved"])
+    
+    return [evaluation.to_dict() for evaluation in dedupe_companies(approved)]
+
+
+def discover_companies(user_prompt: str, mode: str = AGENT_MODE, on_approved=None) -> list[dict]:
+    """Run the configured discovery agent. on_approved streams approved Evaluations as they come."""
+    if mode == "plan":
+        return run_planned_agent(user_prompt, on_approved=on_approved)
+    return run_agent(user_prompt, on_approved=on_approved)
 
 
 def generate_filename(user_prompt: str) -> str:
@@ -501,19 +738,18 @@ def generate_filename(user_prompt: str) -> str:
     Use the LLM to generate a short filename summary of the user's prompt.
     Returns a sanitized filename string.
     """
-    client = OpenAI(
-        api_key=OPENROUTER_API_KEY,
-        base_url="https://openrouter.ai/api/v1"
-    )
+    client = get_openai_client()
     
-    response = client.chat.completions.create(
-        model="openai/gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": "Generate a very short (3-5 words max) filename-safe summary of the user's search query. Use lowercase with underscores. No file extension. Example: 'developer_tools_startups' or 'cloud_api_companies'. Respond with ONLY the filename, nothing else."},
-            {"role": "user", "content": user_prompt}
-        ],
-        max_tokens=50
-    )
+    with trace_span("filename", "chat.completions.create") as span:
+        response = routed_completion(
+            client, "filename", span=span,
+            messages=[
+                {"role": "system", "content": "Generate a very short (3-5 words max) filename-safe summary of the user's search query. Use lowercase with underscores. No file extension. Example: 'developer_tools_startups' or 'cloud_api_companies'. Respond with ONLY the filename, nothing else."},
+                {"role": "user", "content": user_prompt}
+            ],
+            max_tokens=50
+        )
+        span.record(response)
     
     filename = response.choices[0].message.content.strip()
     # Sanitize: remove any characters that aren't alphanumeric or underscore
@@ -552,6 +788,11 @@ def save_search_results(user_prompt: str, companies: list[dict], filename: str,
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
     
+    try:
+        get_history_index().update_file(filepath)
+    except Exception as e:
+        print(f"⚠️ Could not update the search history index: {e}")
+    
     print(f"\n💾 Saved to: {filepath}")
     return filepath
 
@@ -561,10 +802,7 @@ def refine_with_chat(companies: list[dict], user_prompt: str, conversation: list
     Allow user to refine the company list through natural language chat.
     Returns the refined list of companies.
     """
-    client = OpenAI(
-        api_key=OPENROUTER_API_KEY,
-        base_url="https://openrouter.ai/api/v1"
-    )
+    client = get_openai_client()
     
     print("\n" + "="*60)
     print("💬 REFINEMENT MODE")
@@ -606,9 +844,9 @@ User's modification request: {user_input}
 
 Apply the user's requested changes to the list. Return a JSON object with:
 {{
-  "companies": [... the modified list, each with domain, title, url, rationale, confidence ...],
   "changes_made": "Brief description of what you changed",
-  "should_search_more": true/false (if user asked to add more companies)
+  "should_search_more": true/false (if user asked to add more companies),
+  "companies": [... the modified list, each with domain, title, url, rationale, confidence ...]
 }}
 
 IMPORTANT:
@@ -618,107 +856,260 @@ IMPORTANT:
 - Preserve the original rationale/confidence for companies you keep
 - Return ONLY the JSON, no other text."""
 
-        response = client.chat.completions.create(
-            model="google/gemini-2.0-flash-001",
-            messages=[{"role": "user", "content": refine_prompt}],
-            max_tokens=4000
-        )
+        def continue_with(partial: dict) -> list[dict] | None:
+            kept = partial.get("companies", [])
+            if not kept:
+                return None
+            return [{"role": "user", "content": refine_prompt + f"""
+
+Your previous answer was cut off after {len(kept)} companies (the last was {kept[-1].get('domain', 'unknown')}).
+Answer again with the same changes_made and should_search_more, but put ONLY the companies
+that come after {kept[-1].get('domain', 'unknown')} in the modified list in "companies"."""}]
         
-        response_text = response.choices[0].message.content.strip()
+        def merge(partial: dict, more: dict) -> dict:
+            return {**partial, "companies": partial.get("companies", []) + more.get("companies", [])}
         
-        try:
-            # Handle markdown code blocks
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-            
-            result = json.loads(response_text)
-            new_companies = result.get("companies", companies)
-            changes = result.get("changes_made", "No changes")
-            should_search = result.get("should_search_more", False)
-            
-            # Update companies
-            companies = new_companies
-            
-            # Add to conversation
-            conversation.append({"role": "user", "content": user_input})
-            conversation.append({"role": "assistant", "content": changes})
-            
-            print(f"🤖 Assistant: {changes}")
-            print(f"   Current list: {len(companies)} companies")
-            
-            # Save updated results
-            save_search_results(user_prompt, companies, "", conversation, filepath)
-            
-            if should_search:
-                print("   (You can search for more companies by typing 'done' and starting a new search)")
+        result, complete = structured_completion(
+            client, "refine",
+            [{"role": "user", "content": refine_prompt}],
+            "refined_companies", REFINE_SCHEMA,
+            max_tokens=4000,
+            continue_with=continue_with,
+            merge=merge
+        )
         
-        except json.JSONDecodeError as e:
-            print(f"❌ Error processing request: {e}")
+        if not isinstance(result, dict):
+            print("❌ Error processing request: no usable JSON in the model's answer")
             print("Please try rephrasing your request.")
+            continue
+        if not complete:
+            # Applying half a list would silently drop companies
+            print("❌ The updated list was cut off, so it wasn't applied.")
+            print("Please try a smaller change, or 'show' the list and remove companies in steps.")
+            continue
+        
+        new_companies = result.get("companies", companies)
+        changes = result.get("changes_made", "No changes")
+        should_search = result.get("should_search_more", False)
+        
+        # Update companies
+        companies = new_companies
+        
+        # Add to conversation
+        conversation.append({"role": "user", "content": user_input})
+        conversation.append({"role": "assistant", "content": changes})
+        
+        print(f"🤖 Assistant: {changes}")
+        print(f"   Current list: {len(companies)} companies")
+        
+        # Save updated results
+        save_search_results(user_prompt, companies, "", conversation, filepath)
+        
+        if should_search:
+            print("   (You can search for more companies by typing 'done' and starting a new search)")
     
     return companies
 
 
 # --- CONTACT ENRICHMENT (Exa-based LinkedIn search) ---
 
-def find_linkedin_contacts(company_name: str, domain: str) -> list[dict]:
+# Enrichment strategy: "broad" runs one wide people search per company and
+# classifies roles locally; "per_role" is the original one-query-per-role mode.
+ENRICHMENT_STRATEGY = os.getenv("ENRICHMENT_STRATEGY", "broad")
+BROAD_RESULTS = 15
+
+# Speculative enrichment while the user reviews the list
+PREFETCH_CONFIDENCE = ("high",)
+PREFETCH_WORKERS = 3
+
+
+def enrichment_queries(company_name: str, strategy: str = ENRICHMENT_STRATEGY) -> list[tuple[str, int]]:
+    """Return the (query, num_results) people searches to run for a company."""
+    if strategy == "per_role":
+        return [
+            (f"{company_name} Developer Relations DevRel", 3),
+            (f"{company_name} Developer Advocate", 3),
+            (f"{company_name} University Recruiter Campus Recruiter", 3),
+            (f"{company_name} CTO CEO Founder", 3),
+            (f"{company_name} Partnerships Sponsorships", 3),
+        ]
+    return [
+        (f"People at {company_name} working in developer relations, developer advocacy, "
+         f"university recruiting, partnerships, or engineering leadership", BROAD_RESULTS),
+    ]
+
+
+def parse_contact(url: str, title: str, company_name: str, domain: str) -> dict:
+    """Build a contact row from a LinkedIn people search result."""
+    # Try to extract name and title from the result title
+    title_parts = title.split(" - ") if title else ["Unknown"]
+    name = title_parts[0].strip() if title_parts else "Unknown"
+    role = title_parts[1].strip() if len(title_parts) > 1 else "Unknown Role"
+    
+    return {
+        "Company": company_name,
+        "Domain": domain,
+        "Name": name,
+        "Title": role,
+        "LinkedIn": url,
+        "Email": ""  # Not available from LinkedIn search
+    }
+
+
+def company_keys(company_name: str, domain: str) -> set[str]:
+    """How a LinkedIn headline would name the company: its normalized name, with and without spaces, and domain stem."""
+    name = normalize_name(name_from_title(company_name, domain) or company_name)
+    return {key for key in (name, name.replace(" ", ""), domain_stem(domain)) if len(key) >= 3}
+
+
+def mentions_company(headline: str, keys: set[str]) -> bool:
+    """True if the headline names the company as whole words. With no usable keys, nothing can be ruled out."""
+    if not keys:
+        return True
+    text = f" {normalize_name(headline)} "
+    return any(f" {key} " in text for key in keys)
+
+
+def rank_contacts(contacts: list[dict], company_name: str, domain: str) -> list[dict]:
+    """
+    Score each contact's title against TARGET_TITLES and sort by relevance.
+    Profiles that match no target role are dropped, and so are headlines that
+    don't mention the company: a broad people search also returns people at
+    other companies, who must not be labelled as working here.
+    """
+    keys = company_keys(company_name, domain)
+    
+    scored = []
+    for contact in contacts:
+        headline = contact.pop("_headline", "") or contact["Title"]
+        if not mentions_company(headline, keys):
+            continue
+        role, score = TITLE_MATCHER.score(role_text(headline))
+        if score <= 0:
+            continue
+        contact["Role Match"] = role
+        contact["Role Score"] = score
+        scored.append((-score, contact))
+    
+    scored.sort(key=lambda item: item[0])
+    return [contact for _, contact in scored]
+
+
+def find_linkedin_contacts(company_name: str, domain: str, strategy: str = ENRICHMENT_STRATEGY, verbose: bool = True) -> list[dict]:
     """
     Uses Exa to search for LinkedIn profiles of relevant contacts at a company.
-    Targets DevRel, recruiters, and C-suite.
+    Targets DevRel, recruiters, and C-suite; profiles matching no target title are dropped.
     """
-    print(f"🔎 Searching LinkedIn for contacts at {company_name}...")
+    if get_suppression_list().is_suppressed(domain=domain):
+        if verbose:
+            print(f"🚫 {company_name} ({domain}) is on the suppression list, skipping")
+        return []
+    
+    queries = enrichment_queries(company_name, strategy)
+    negative = get_negative_cache()
+    negative_key = (domain or company_name.lower(), strategy)
+    if negative.is_known_empty("linkedin", *negative_key, calls=len(queries)):
+        if verbose:
+            print(f"💾 No LinkedIn profiles found for {company_name} recently, skipping")
+        return []
     
-    exa = Exa(EXA_API_KEY)
+    if verbose:
+        print(f"🔎 Searching LinkedIn for contacts at {company_name}...")
     
-    # Search queries targeting different roles
-    role_queries = [
-        f"{company_name} Developer Relations DevRel",
-        f"{company_name} Developer Advocate",
-        f"{company_name} University Recruiter Campus Recruiter",
-        f"{company_name} CTO CEO Founder",
-        f"{company_name} Partnerships Sponsorships",
-    ]
+    exa = get_exa_client()
     
     all_contacts = []
     seen_urls = set()
+    complete = True  # every query answered, so an empty result can be trusted
     
-    for query in role_queries:
+    for query, num_results in queries:
         try:
-            response = exa.search(
-                query=query,
-                num_results=3,
-                type="neural",
-                category="people"
-            )
+            with trace_span("enrichment", "exa.search", company=company_name) as span:
+                response = call_with_retry(
+                    "exa", exa.search, span=span,
+                    query=query,
+                    num_results=num_results,
+                    type="neural",
+                    category="people"
+                )
+                span.record(response)
             
             for result in response.results:
-                print(result)
                 # Only keep LinkedIn profile URLs
                 if "linkedin.com/in/" in result.url and result.url not in seen_urls:
                     seen_urls.add(result.url)
-                    
-                    # Try to extract name and title from the result title
-                    title_parts = result.title.split(" - ") if result.title else ["Unknown"]
-                    name = title_parts[0].strip() if title_parts else "Unknown"
-                    role = title_parts[1].strip() if len(title_parts) > 1 else "Unknown Role"
-                    
-                    all_contacts.append({
-                        "Company": company_name,
-                        "Domain": domain,
-                        "Name": name,
-                        "Title": role,
-                        "LinkedIn": result.url,
-                        "Email": ""  # Not available from LinkedIn search
-                    })
+                    contact = parse_contact(result.url, result.title, company_name, domain)
+                    contact["_headline"] = result.title or ""
+                    all_contacts.append(contact)
+        except CircuitOpenError as e:
+            if verbose:
+                print(f"   ⚠️ Exa unavailable, skipping remaining queries: {e}")
+            complete = False
+            break
         except Exception as e:
-            print(f"   ⚠️ Search error: {e}")
+            if verbose:
+                print(f"   ⚠️ Search failed after retries: {e}")
+            complete = False
             continue
-        
-        time.sleep(0.5)  # Rate limit between queries
     
-    return all_contacts
+    if complete and not all_contacts:
+        negative.record_empty("linkedin", *negative_key)
+    
+    return drop_suppressed(rank_contacts(all_contacts, company_name, domain))
+
+
+def drop_suppressed(contacts: list[dict]) -> list[dict]:
+    """Remove contacts whose email or company domain is on the suppression list."""
+    suppression = get_suppression_list()
+    return [c for c in contacts if not suppression.check_row(c, ["Email"])]
+
+
+class EnrichmentPrefetcher:
+    """
+    Speculatively runs find_linkedin_contacts in the background while the user
+    is still reviewing or refining the company list.
+    Only companies with a confidence in PREFETCH_CONFIDENCE are prefetched;
+    results for companies later removed from the list are discarded.
+    """
+
+    def __init__(self, max_workers: int = PREFETCH_WORKERS, confidences: tuple[str, ...] = PREFETCH_CONFIDENCE):
+        self.confidences = set(confidences)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {}  # domain -> Future
+
+    def sync(self, companies: list[dict]) -> None:
+        """Match in-flight work to the current list: cancel removed companies, start new ones."""
+        wanted = {c.get("domain", ""): c for c in companies if c.get("domain")}
+        for domain in list(self._futures):
+            if domain not in wanted:
+                self._futures.pop(domain).cancel()
+        for domain, company in wanted.items():
+            if domain in self._futures or company.get("confidence") not in self.confidences:
+                continue
+            company_name = company.get("title", domain)
+            self._futures[domain] = self._executor.submit(
+                find_linkedin_contacts, company_name, domain, verbose=False
+            )
+
+    def take(self, domain: str) -> list[dict] | None:
+        """
+        Prefetched contacts for a domain, waiting if the lookup is in flight.
+        Returns None if the domain wasn't prefetched or the lookup failed.
+        """
+        future = self._futures.pop(domain, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def shutdown(self) -> None:
+        """Cancel anything not yet started and drop the results."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 def display_companies(companies: list[dict]) -> None:
@@ -742,10 +1133,11 @@ def display_companies(companies: list[dict]) -> None:
     print("="*60)
 
 
-def get_user_approval(companies: list[dict]) -> list[dict]:
+def get_user_approval(companies: list[dict], prefetcher: EnrichmentPrefetcher | None = None) -> list[dict]:
     """
     Get user approval for the company list.
     Returns the approved list of companies.
+    Edits are passed on to the prefetcher so removed companies are dropped.
     """
     while True:
         print("\nOptions:")
@@ -770,6 +1162,8 @@ def get_user_approval(companies: list[dict]) -> list[dict]:
                 try:
                     indices = [int(x.strip()) - 1 for x in edit_input.split(",")]
                     companies = [c for i, c in enumerate(companies) if i not in indices]
+                    if prefetcher is not None:
+                        prefetcher.sync(companies)
                     display_companies(companies)
                 except ValueError:
                     print("Invalid input. Enter numbers separated by commas.")
@@ -780,6 +1174,10 @@ def get_user_approval(companies: list[dict]) -> list[dict]:
             print("Invalid choice. Please enter y, n, e, or r.")
 
 
+# filepath -> (mtime_ns, summary); only files that changed since the last scan are re-parsed
+_search_index = {}
+
+
 def list_saved_searches() -> list[dict]:
     """
     List all saved search files with their metadata.
@@ -790,22 +1188,33 @@ def list_saved_searches() -> list[dict]:
         return []
     
     searches = []
+    present = set()
     for filename in sorted(os.listdir(searches_dir), reverse=True):  # Most recent first
         if filename.endswith('.json'):
             filepath = os.path.join(searches_dir, filename)
+            present.add(filepath)
             try:
+                mtime = os.stat(filepath).st_mtime_ns
+                cached = _search_index.get(filepath)
+                if cached is not None and cached[0] == mtime:
+                    searches.append(cached[1])
+                    continue
                 with open(filepath, 'r') as f:
                     data = json.load(f)
-                searches.append({
+                summary = {
                     "filepath": filepath,
                     "filename": filename,
                     "prompt": data.get("initial_prompt", "Unknown")[:60],
                     "company_count": data.get("company_count", 0),
                     "timestamp": data.get("last_updated", data.get("timestamp", "Unknown"))
-                })
+                }
+                _search_index[filepath] = (mtime, summary)
+                searches.append(summary)
             except (json.JSONDecodeError, IOError):
                 continue
     
+    for filepath in set(_search_index) - present:
+        del _search_index[filepath]
     return searches
 
 
@@ -846,14 +1255,25 @@ def browse_searches() -> tuple[str, list[dict], list[dict], str] | None:
         print(f"   {search['prompt']}...")
     
     print("\n" + "-"*60)
-    print("Enter a number to resume, or 'back' to return to menu.")
+    print("Enter a number to resume, '/' and some words to search (e.g. /datadog), or 'back' to return to menu.")
     
     while True:
-        choice = input("\n> ").strip().lower()
+        choice = input("\n> ").strip()
         
-        if choice == 'back' or choice == 'b':
+        if choice.lower() == 'back' or choice.lower() == 'b':
             return None
         
+        if choice.startswith("/"):
+            hits = get_history_index().search(choice[1:])
+            if not hits:
+                print("No saved searches match.")
+                continue
+            print_hits(hits)
+            print("\n" + "-"*60)
+            print("Enter a number to resume one of these, '/' to search again, or 'back'.")
+            searches = hits
+            continue
+        
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(searches):
@@ -861,7 +1281,7 @@ def browse_searches() -> tuple[str, list[dict], list[dict], str] | None:
             else:
                 print(f"Please enter a number between 1 and {len(searches)}.")
         except ValueError:
-            print("Invalid input. Enter a number or 'back'.")
+            print("Invalid input. Enter a number, a /search or 'back'.")
 
 
 def main():
@@ -897,25 +1317,31 @@ def main():
             print(f"   Original prompt: {user_prompt[:60]}...")
             display_companies(companies)
             
-            # Go straight to refinement
-            print("\nOptions:")
-            print("  [c] Chat to refine the list")
-            print("  [y] Proceed to find emails")
-            print("  [n] Back to menu")
-            
-            choice = input("\nYour choice: ").strip().lower()
-            
-            if choice == 'c':
-                companies = refine_with_chat(companies, user_prompt, conversation, filepath)
-                display_companies(companies)
-                proceed = input("\nProceed to find emails? (y/n): ").strip().lower()
-                if proceed != 'y':
+            prefetcher = EnrichmentPrefetcher()
+            prefetcher.sync(companies)
+            try:
+                # Go straight to refinement
+                print("\nOptions:")
+                print("  [c] Chat to refine the list")
+                print("  [y] Proceed to find emails")
+                print("  [n] Back to menu")
+                
+                choice = input("\nYour choice: ").strip().lower()
+                
+                if choice == 'c':
+                    companies = refine_with_chat(companies, user_prompt, conversation, filepath)
+                    prefetcher.sync(companies)
+                    display_companies(companies)
+                    proceed = input("\nProceed to find emails? (y/n): ").strip().lower()
+                    if proceed != 'y':
+                        continue
+                elif choice == 'n' or choice != 'y':
                     continue
-            elif choice == 'n' or choice != 'y':
-                continue
-            
-            # Proceed to Apollo enrichment (same code as new search)
-            _run_contact_enrichment(companies)
+                
+                # Proceed to Apollo enrichment (same code as new search)
+                run_contact_enrichment(companies, prefetcher)
+            finally:
+                prefetcher.shutdown()
             continue
         
         if menu_choice != 'n' and menu_choice != 'new':
@@ -935,7 +1361,12 @@ def main():
             break
         
         # Run the LLM agent (now includes evaluation as a tool)
-        companies = run_agent(user_prompt)
+        try:
+            companies = discover_companies(user_prompt)
+        except Exception as e:
+            print(f"\n❌ Agent failed: {e}")
+            print("   Returning to menu - try again in a moment.")
+            continue
         
         if not companies:
             print("\n❌ No companies found or none passed evaluation. Try a different prompt.")
@@ -944,60 +1375,84 @@ def main():
         # Display results
         display_companies(companies)
         
-        # Save initial search results
-        print("\n📝 Generating filename for search results...")
-        filename = generate_filename(user_prompt)
-        conversation = [{"role": "user", "content": user_prompt}]
-        filepath = save_search_results(user_prompt, companies, filename, conversation)
-        
-        # Refinement options
-        print("\nOptions:")
-        print("  [c] Chat to refine the list")
-        print("  [y] Approve and proceed to find emails")
-        print("  [n] Cancel and start over")
-        
-        choice = input("\nYour choice: ").strip().lower()
-        
-        if choice == 'c':
-            companies = refine_with_chat(companies, user_prompt, conversation, filepath)
-            display_companies(companies)
+        # Start enriching high-confidence companies while the user decides
+        prefetcher = EnrichmentPrefetcher()
+        prefetcher.sync(companies)
+        try:
+            # Save initial search results
+            print("\n📝 Generating filename for search results...")
+            filename = generate_filename(user_prompt)
+            conversation = [{"role": "user", "content": user_prompt}]
+            filepath = save_search_results(user_prompt, companies, filename, conversation)
+            
+            # Refinement options
+            print("\nOptions:")
+            print("  [c] Chat to refine the list")
+            print("  [y] Approve and proceed to find emails")
+            print("  [n] Cancel and start over")
             
-            proceed = input("\nProceed to find emails? (y/n): ").strip().lower()
-            if proceed != 'y':
-                print("Saved. Returning to menu.")
+            choice = input("\nYour choice: ").strip().lower()
+            
+            if choice == 'c':
+                companies = refine_with_chat(companies, user_prompt, conversation, filepath)
+                prefetcher.sync(companies)
+                display_companies(companies)
+                
+                proceed = input("\nProceed to find emails? (y/n): ").strip().lower()
+                if proceed != 'y':
+                    print("Saved. Returning to menu.")
+                    continue
+            elif choice == 'n':
+                print("Cancelled.")
                 continue
-        elif choice == 'n':
-            print("Cancelled.")
-            continue
-        elif choice != 'y':
-            print("Invalid choice, returning to menu.")
-            continue
-        
-        _run_contact_enrichment(companies)
+            elif choice != 'y':
+                print("Invalid choice, returning to menu.")
+                continue
+            
+            run_contact_enrichment(companies, prefetcher)
+        finally:
+            prefetcher.shutdown()
 
 
-def _run_contact_enrichment(companies: list[dict]):
-    """Find LinkedIn contacts for a list of companies using Exa search."""
+def run_contact_enrichment(companies: list[dict], prefetcher: EnrichmentPrefetcher | None = None):
+    """
+    Find LinkedIn contacts for a list of companies using Exa search.
+    Companies already looked up by the prefetcher reuse those results.
+    """
     print("\n" + "="*60)
     print("📎 ENRICHMENT PHASE - Finding LinkedIn contacts...")
     print("="*60)
     print("Searching for DevRel, Recruiters, and C-Suite on LinkedIn...\n")
     
     all_contacts = []
-    for company in companies:
-        company_name = company.get("title", company.get("domain", ""))
-        domain = company.get("domain", "")
-        if not domain:
-            continue
+    prefetched = 0
+    targets = dedupe_companies([Company.from_dict(c) for c in companies])
+    progress = Progress(len(targets), "enrichment")
+    for company in targets:
+        company_name = company.title or company.domain
+        domain = company.domain
         
-        contacts = find_linkedin_contacts(company_name, domain)
+        contacts = prefetcher.take(domain) if prefetcher else None
+        if contacts is not None:
+            prefetched += 1
+        else:
+            contacts = find_linkedin_contacts(company_name, domain)
         if contacts:
-            print(f"   ✅ Found {len(contacts)} contacts at {company_name}")
+            progress.advance(f"✅ Found {len(contacts)} contacts at {company_name}")
             all_contacts.extend(contacts)
         else:
-            print(f"   ⚠️  No LinkedIn profiles found for {company_name}")
-        
-        time.sleep(1)  # Rate limit safety
+            progress.advance(f"⚠️  No LinkedIn profiles found for {company_name}")
+    progress.finish()
+    
+    enricher = get_enricher(APOLLO_API_KEY)
+    if all_contacts and enricher is not None:
+        print(f"\n📧 Looking up emails for {len(all_contacts)} contacts on Apollo...")
+        enricher.enrich(all_contacts)
+        all_contacts = drop_suppressed(all_contacts)
+        found = sum(1 for c in all_contacts if c.get("Email"))
+        print(f"   Found {found} emails ({enricher.stats['requests']} requests, {enricher.stats['cached']} from cache)")
+    elif all_contacts:
+        print("\n💡 Set APOLLO_API_KEY to look up email addresses for these contacts")
     
     # Output results
     print("\n" + "="*60)
@@ -1005,13 +1460,15 @@ def _run_contact_enrichment(companies: list[dict]):
     print("="*60)
     
     if all_contacts:
-        df = pd.DataFrame(all_contacts)
+        df = pd.DataFrame(all_contacts, columns=CONTACT_FIELDS)
         csv_filename = "sponsor_contacts.csv"
         df.to_csv(csv_filename, index=False)
         print(f"\n🎉 Success! Found {len(all_contacts)} contacts across {len(companies)} companies.")
+        if prefetched:
+            print(f"⚡ {prefetched} companies were already enriched in the background")
         print(f"📁 Saved to {csv_filename}")
         print("\nPreview:")
-        print(df[["Company", "Name", "Title", "LinkedIn"]].head(15).to_string(index=False))
+        print(df[["Company", "Name", "Title", "Role Match", "LinkedIn"]].head(15).to_string(index=False))
     else:
         print("\n⚠️  No LinkedIn contacts found.")
         print("   You may need to search manually for these companies.")
@@ -1,5 +1,258 @@
-def main():
-    print("Hello from moneyprinter!")
+"""
+moneyprinter - one entry point for every tool.
+
+    python main.py search                          # interactive company discovery
+    python main.py enrich [--search FILE]          # LinkedIn contacts for a saved search
+    python main.py email --template T [...]        # draft and review outreach emails
+    python main.py pipeline --prompt P --template T  # discovery -> contacts -> drafts
+    python main.py bench [NAME] [...]              # run a benchmark from bench/
+    python main.py daemon start|stop|status|call   # warm background process
+    python main.py export [--out DIR]              # history to Parquet (needs .[parquet])
+    python main.py suppress add|import|check|stats # do-not-contact list
+    python main.py history WORDS [--limit N]       # full-text search over saved searches
+    python main.py companies show|split DOMAIN...  # inspect or undo company merges
+
+After `uv sync` (or `pip install -e .`) the same commands run as
+`moneyprinter search`, `moneyprinter pipeline ...` and so on.
+
+Each subcommand imports its subsystem (OpenAI, Exa, pandas, ...) only when it
+runs, so `--help` and listing benchmarks don't pay for any of them.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+BENCH_DIR = PROJECT_ROOT / "bench"
+
+
+def _use_paths(*subdirs: str) -> None:
+    """Make the project root and the given script directories importable."""
+    for path in (PROJECT_ROOT, *(PROJECT_ROOT / d for d in subdirs)):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+
+def _run_script_main(module_name: str, prog: str, argv: list[str]) -> None:
+    """Call a script's own argparse main() with argv as its arguments."""
+    module = __import__(module_name)
+    saved = sys.argv
+    sys.argv = [prog, *argv]
+    try:
+        module.main()
+    finally:
+        sys.argv = saved
+
+
+def cmd_search(args, extra: list[str]) -> None:
+    _use_paths("find-companies")
+    import headhunter
+    headhunter.main()
+
+
+def cmd_enrich(args, extra: list[str]) -> None:
+    _use_paths("find-companies")
+    import headhunter
+    search_file = args.search
+    if not search_file:
+        searches = headhunter.list_saved_searches()
+        if not searches:
+            print("📂 No saved searches found. Run `main.py search` first.")
+            return
+        search_file = searches[0]["filepath"]
+    prompt, companies, _, _ = headhunter.load_search(search_file)
+    if args.strategy:
+        headhunter.ENRICHMENT_STRATEGY = args.strategy
+    print(f"📂 {len(companies)} companies from {search_file}")
+    print(f"   Prompt: {prompt[:60]}")
+    headhunter.run_contact_enrichment(companies)
+
+
+def cmd_email(args, extra: list[str]) -> None:
+    _use_paths("request-sponsorship")
+    _run_script_main("emailer", "moneyprinter email", extra)
+
+
+def cmd_pipeline(args, extra: list[str]) -> None:
+    _use_paths("find-companies", "request-sponsorship")
+    _run_script_main("pipeline", "moneyprinter pipeline", extra)
+
+
+def cmd_daemon(args, extra: list[str]) -> None:
+    _use_paths()
+    import daemon
+    daemon.main(extra)
+
+
+def cmd_export(args, extra: list[str]) -> None:
+    _use_paths()
+    from common.columnar import export_history
+    try:
+        counts = export_history(
+            out_dir=args.out,
+            contact_files=args.contacts,
+            journal_files=args.journals
+        )
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    for name, rows in counts.items():
+        print(f"   {name + '.parquet':<22}{rows:>8} rows")
+    print(f"📁 Exported to {args.out}")
+
+
+def cmd_companies(args, extra: list[str]) -> None:
+    _use_paths()
+    from common.company_identity import get_company_index
+    index = get_company_index()
+    for domain in args.domains:
+        if args.action == "split":
+            if index.split(domain):
+                print(f"✂️  {domain} is its own company again")
+            else:
+                print(f"   {domain} was not merged into another company")
+            continue
+        members = index.members(domain)
+        if not members:
+            print(f"   {domain} is not in the company index")
+        elif len(members) == 1:
+            print(f"   {domain}: no merged domains")
+        else:
+            print(f"🔗 {members[0]}: {', '.join(members[1:])}")
+
+
+def cmd_suppress(args, extra: list[str]) -> None:
+    _use_paths()
+    from common.suppression import SuppressionList, read_entries_file
+    suppression = SuppressionList()
+    if args.action == "add":
+        added = suppression.add(args.values, reason=args.reason)
+        print(f"🚫 Added {added} entries ({len(suppression)} distinct keys)")
+    elif args.action == "import":
+        values = []
+        for path in args.values:
+            values.extend(read_entries_file(path, domains=args.domains))
+        added = suppression.add(values, reason=args.reason)
+        print(f"🚫 Imported {added} entries from {len(args.values)} files ({len(suppression)} distinct keys)")
+    elif args.action == "check":
+        for value in args.values:
+            hit = suppression.is_suppressed(email=value) if "@" in value else suppression.is_suppressed(domain=value)
+            print(f"   {'🚫 suppressed' if hit else '✅ ok':<14} {value}")
+    elif args.action == "rebuild":
+        print(f"🔁 Rebuilt index with {suppression.rebuild()} distinct keys")
+    else:
+        size = sum(f.stat().st_size for f in (suppression.index_file, suppression.bloom_file) if f.exists())
+        print(f"   Keys: {len(suppression)}")
+        print(f"   Index + bloom: {size / 1024:.1f} KB in {suppression.directory}")
+
+
+def cmd_history(args, extra: list[str]) -> None:
+    _use_paths()
+    import time
+    from common.history_index import HistoryIndex, print_hits
+    index = HistoryIndex()
+    if args.rebuild:
+        for path in index.searches_dir.glob("*.json"):
+            index.update_file(str(path))
+    started = time.perf_counter()
+    hits = index.search(" ".join(args.words), limit=args.limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if not hits:
+        print(f"🔍 No saved searches match '{' '.join(args.words)}' ({len(index)} indexed)")
+        return
+    print(f"🔍 {len(hits)} saved searches match ({len(index)} indexed, {elapsed_ms:.1f} ms)")
+    print_hits(hits)
+    print(f"\nResume one with: python main.py enrich --search {hits[0]['filepath']}")
+
+
+def list_benchmarks() -> list[str]:
+    return sorted(p.stem.removeprefix("bench_") for p in BENCH_DIR.glob("bench_*.py"))
+
+
+def cmd_bench(args, extra: list[str]) -> None:
+    names = list_benchmarks()
+    if not args.name:
+        print("Benchmarks (python main.py bench NAME [args]):")
+        for name in names:
+            print(f"  {name}")
+        return
+    if args.name not in names:
+        print(f"❌ Unknown benchmark '{args.name}'. Available: {', '.join(names)}")
+        sys.exit(2)
+
+    import runpy
+    script = BENCH_DIR / f"bench_{args.name}.py"
+    saved = sys.argv
+    sys.argv = [str(script), *extra]
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    finally:
+        sys.argv = saved
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="moneyprinter", description="Find hackathon sponsors, their contacts, and draft outreach emails")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    search = commands.add_parser("search", help="Interactive company discovery and refinement")
+    search.set_defaults(handler=cmd_search)
+
+    enrich = commands.add_parser("enrich", help="Find LinkedIn contacts for a saved search")
+    enrich.add_argument("--search", help="Saved search JSON (default: the most recent one)")
+    enrich.add_argument("--strategy", choices=["broad", "per_role"], help="Enrichment query strategy")
+    enrich.set_defaults(handler=cmd_enrich)
+
+    # email and pipeline hand every remaining argument to their own parsers
+    email = commands.add_parser("email", help="Draft and review emails (see `email --help`)", add_help=False)
+    email.set_defaults(handler=cmd_email)
+
+    pipeline = commands.add_parser("pipeline", help="Discovery -> contacts -> drafts in one run (see `pipeline --help`)", add_help=False)
+    pipeline.set_defaults(handler=cmd_pipeline)
+
+    daemon = commands.add_parser("daemon", help="Warm background process holding clients and caches (see `daemon --help`)", add_help=False)
+    daemon.set_defaults(handler=cmd_daemon)
+
+    export = commands.add_parser("export", help="Export companies, evaluations, contacts and drafts to Parquet")
+    export.add_argument("--out", default=str(PROJECT_ROOT / "exports"), help="Output directory (default: exports/)")
+    export.add_argument("--contacts", nargs="*", help="Contact CSVs to include (default: ./sponsor_contacts.csv)")
+    export.add_argument("--journals", nargs="*", help="Emailer journals to include (default: all in request-sponsorship/)")
+    export.set_defaults(handler=cmd_export)
+
+    suppress = commands.add_parser("suppress", help="Manage the do-not-contact list (emails and domains)")
+    suppress.add_argument("action", choices=["add", "import", "check", "stats", "rebuild"])
+    suppress.add_argument("values", nargs="*", help="Emails/domains (add, check) or files (import)")
+    suppress.add_argument("--reason", default="", help="Why these entries are suppressed, e.g. unsubscribe, bounce")
+    suppress.add_argument("--domains", action="store_true",
+                          help="import: also suppress whole domains (rows without an email, lines without @)")
+    suppress.set_defaults(handler=cmd_suppress)
+
+    companies = commands.add_parser("companies", help="Show or undo domains merged as one company")
+    companies.add_argument("action", choices=["show", "split"])
+    companies.add_argument("domains", nargs="+", help="Domains, e.g. delta.io")
+    companies.set_defaults(handler=cmd_companies)
+
+    history = commands.add_parser("history", help="Search saved searches by prompt, company, rationale or conversation")
+    history.add_argument("words", nargs="+", help="Words to look for, e.g. observability or datadog")
+    history.add_argument("--limit", type=int, default=10, help="Max saved searches to show (default: 10)")
+    history.add_argument("--rebuild", action="store_true", help="Reindex every saved search first")
+    history.set_defaults(handler=cmd_history)
+
+    bench = commands.add_parser("bench", help="Run a benchmark from bench/ (no NAME lists them)", add_help=False)
+    bench.add_argument("name", nargs="?", help="Benchmark name, e.g. titles")
+    bench.set_defaults(handler=cmd_bench)
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return
+    if extra and args.command not in ("email", "pipeline", "daemon", "bench"):
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.handler(args, extra)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,280 @@
+"""
+Streaming pipeline: company discovery -> LinkedIn contacts (+ Apollo emails) -> email drafts.
+
+The stages run concurrently and hand work to each other through bounded
+queues: companies enter the pipeline as soon as an evaluation batch approves
+them, contacts found at the first company are being drafted while later
+companies are still being enriched. A full queue blocks the stage feeding it
+(backpressure), which keeps memory flat and stops enrichment racing ahead of
+the much slower drafting stage.
+
+Usage:
+    python pipeline.py --prompt "developer tools startups" --template template.txt
+    python pipeline.py --search find-companies/searches/<file>.json --template template.txt
+"""
+
+import sys
+import csv
+import time
+import queue
+import argparse
+import threading
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "find-companies"))
+sys.path.insert(0, str(PROJECT_ROOT / "request-sponsorship"))
+
+import headhunter
+import emailer
+from common.records import Company, Contact, CONTACT_FIELDS
+from common.progress import emit, format_duration
+from common.apollo import get_enricher
+from common.suppression import entry_key
+
+DRAFT_FIELDS = CONTACT_FIELDS + ["Subject", "Body", "Error"]
+
+# Tells a worker its upstream stage is finished
+_DONE = object()
+
+
+class Pipeline:
+    """
+    discovery (any iterable, e.g. discover()) -> [companies queue] -> enrichment
+    workers -> [contacts queue] -> drafting workers -> output CSV.
+    Only contacts with an email address are drafted unless require_email=False.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        output_file: str,
+        enrich_workers: int = 3,
+        draft_workers: int = 4,
+        queue_size: int = 8,
+        contacts_per_company: int = 3,
+        min_title_score: float = 0.0,
+        require_email: bool = True
+    ):
+        self.template = template
+        self.output_file = output_file
+        self.enrich_workers = enrich_workers
+        self.draft_workers = draft_workers
+        self.contacts_per_company = contacts_per_company
+        self.min_title_score = min_title_score
+        self.require_email = require_email
+        self.enricher = get_enricher(headhunter.APOLLO_API_KEY)
+        if self.require_email and self.enricher is None:
+            print("⚠️  APOLLO_API_KEY is not set, so no contact will have an email and nothing will be drafted."
+                  " Pass --no-require-email to draft anyway.")
+        self.companies = queue.Queue(maxsize=queue_size)
+        self.contacts = queue.Queue(maxsize=queue_size)
+        self.stats = {"companies": 0, "contacts": 0, "drafted": 0, "duplicates": 0, "errors": 0, "blocked_s": 0.0}
+        self._lock = threading.Lock()
+        self._drafted_emails = set()  # entry_key() of every address handed to a drafter
+        self._output = None
+        self._writer = None
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def _put(self, q: queue.Queue, item) -> None:
+        """Queue an item, recording how long backpressure held the producer."""
+        started = time.perf_counter()
+        q.put(item)
+        waited = time.perf_counter() - started
+        if waited > 0.001:
+            self._count("blocked_s", waited)
+
+    def _enrich_worker(self) -> None:
+        while True:
+            company = self.companies.get()
+            if company is _DONE:
+                return
+            name = company.title or company.domain
+            try:
+                contacts = self._enrich(company, name)
+            except Exception as e:
+                # Never let one company kill the thread: run() would block on a queue nobody drains
+                emit(f"   ⚠️ Enrichment failed for {name}: {e}")
+                self._count("errors")
+                continue
+            emit(f"   📎 {name}: {len(contacts)} contacts")
+            for contact in contacts:
+                self._count("contacts")
+                self._put(self.contacts, contact)
+
+    def _enrich(self, company: Company, name: str) -> list[Contact]:
+        """The best contacts at a company, with Apollo emails if there's an enricher."""
+        rows = headhunter.find_linkedin_contacts(name, company.domain, verbose=False)
+        rows = [row for row in rows if row.get("Role Score", 0) >= self.min_title_score]
+        if self.enricher is not None:
+            # Look up emails before trimming, so --require-email can fall back to the next-best contacts
+            limit = self.contacts_per_company * (3 if self.require_email else 1)
+            rows = headhunter.drop_suppressed(self.enricher.enrich(rows[:limit]))
+        contacts = [Contact.from_row(row) for row in rows]
+        if self.require_email:
+            contacts = [c for c in contacts if c.email]
+        return contacts[:self.contacts_per_company]
+
+    def _draft_worker(self) -> None:
+        while True:
+            contact = self.contacts.get()
+            if contact is _DONE:
+                return
+            if contact.email:
+                # The same person can come back for aliased or near-duplicate companies
+                key = entry_key(contact.email)
+                with self._lock:
+                    duplicate = key in self._drafted_emails
+                    self._drafted_emails.add(key)
+                if duplicate:
+                    self._count("duplicates")
+                    emit(f"   ⏭️  Already drafted for {contact.email}")
+                    continue
+            row = contact.to_row()
+            try:
+                row["Subject"], row["Body"] = emailer.generate_email(self.template, row)
+                row["Error"] = ""
+                self._count("drafted")
+                emit(f"   ✉️  Drafted for {contact.name} ({contact.company})")
+            except Exception as e:
+                row["Subject"], row["Body"], row["Error"] = "", "", str(e)
+                self._count("errors")
+                emit(f"   ⚠️ Draft failed for {contact.name}: {e}")
+            with self._lock:
+                self._writer.writerow(row)
+                self._output.flush()
+
+    def run(self, companies) -> dict:
+        """Feed an iterable of Company records through every stage; returns stats."""
+        started = time.monotonic()
+        enrichers = [threading.Thread(target=self._enrich_worker, daemon=True) for _ in range(self.enrich_workers)]
+        drafters = [threading.Thread(target=self._draft_worker, daemon=True) for _ in range(self.draft_workers)]
+
+        with open(self.output_file, "w", newline="", encoding="utf-8") as f:
+            self._output = f
+            self._writer = csv.DictWriter(f, fieldnames=DRAFT_FIELDS, extrasaction="ignore")
+            self._writer.writeheader()
+            for thread in enrichers + drafters:
+                thread.start()
+
+            try:
+                for company in companies:
+                    if not company.domain:
+                        continue
+                    self._count("companies")
+                    self._put(self.companies, company)
+            finally:
+                # Shut the stages down in order so nothing queued is dropped
+                for _ in enrichers:
+                    self.companies.put(_DONE)
+                for thread in enrichers:
+                    thread.join()
+                for _ in drafters:
+                    self.contacts.put(_DONE)
+                for thread in drafters:
+                    thread.join()
+
+        self.stats["seconds"] = time.monotonic() - started
+        return self.stats
+
+
+def discover(prompt: str = None, search_file: str = None):
+    """
+    Yield the Companies of a saved search file, or of a fresh discovery run
+    as each evaluation approves them, so enrichment starts while discovery
+    is still searching. Companies already yielded (by identity) are skipped.
+    """
+    if search_file:
+        _, companies, _, _ = headhunter.load_search(search_file)
+        print(f"📂 Loaded {len(companies)} companies from {search_file}")
+        yield from headhunter.dedupe_companies([Company.from_dict(c) for c in companies])
+        return
+
+    approved = queue.Queue()
+
+    def run_discovery() -> None:
+        try:
+            headhunter.discover_companies(prompt, on_approved=approved.put)
+        except Exception as e:
+            approved.put(e)
+        finally:
+            approved.put(_DONE)
+
+    threading.Thread(target=run_discovery, daemon=True).start()
+    seen = set()
+    while (batch := approved.get()) is not _DONE:
+        if isinstance(batch, Exception):
+            raise batch
+        for evaluation in headhunter.dedupe_companies(batch, exclude=seen):
+            seen.add(evaluation.domain)
+            yield evaluation.company
+
+
+def run_pipeline(
+    template_path: str,
+    prompt: str = None,
+    search_file: str = None,
+    output_path: str = None,
+    **options
+) -> dict:
+    with open(template_path, "r") as f:
+        template = f.read()
+    output_file = output_path or f"pipeline_drafts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    pipeline = Pipeline(template, output_file, **options)
+    print("\n" + "=" * 60)
+    print("🚰 PIPELINE - discovery → contacts → drafts")
+    print("=" * 60)
+    stats = pipeline.run(discover(prompt, search_file))
+
+    print("\n" + "=" * 60)
+    print("📊 PIPELINE RESULTS")
+    print("=" * 60)
+    print(f"   Companies: {stats['companies']}")
+    print(f"   Contacts:  {stats['contacts']}")
+    print(f"   Drafted:   {stats['drafted']}")
+    print(f"   Repeats:   {stats['duplicates']} (same email at another company, skipped)")
+    print(f"   Errors:    {stats['errors']}")
+    print(f"   Time:      {format_duration(stats['seconds'])} (producers blocked on full queues for {stats['blocked_s']:.1f}s)")
+    print(f"\n   Output: {output_file}")
+    print("\n⚠️  Drafts were not reviewed - read through the CSV before sending.")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discover companies, find contacts and draft emails in one streaming run")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--prompt", help="Describe the companies to discover")
+    source.add_argument("--search", help="Use the companies in a saved search JSON instead of discovering")
+    parser.add_argument("--template", required=True, help="Path to email template file")
+    parser.add_argument("--output", help="Output path for the drafts CSV")
+    parser.add_argument("--enrich-workers", type=int, default=3, help="Concurrent company lookups (default: 3)")
+    parser.add_argument("--draft-workers", type=int, default=4, help="Concurrent email drafts (default: 4)")
+    parser.add_argument("--queue-size", type=int, default=8, help="Items buffered between stages (default: 8)")
+    parser.add_argument("--contacts-per-company", type=int, default=3, help="Best-matching contacts drafted per company (default: 3)")
+    parser.add_argument("--min-title-score", type=float, default=0.0, help="Skip contacts whose title scores below this (0-1)")
+    parser.add_argument("--require-email", action=argparse.BooleanOptionalAction, default=True,
+                        help="Only draft for contacts that have an email address (default: on)")
+    args = parser.parse_args()
+
+    run_pipeline(
+        template_path=args.template,
+        prompt=args.prompt,
+        search_file=args.search,
+        output_path=args.output,
+        enrich_workers=args.enrich_workers,
+        draft_workers=args.draft_workers,
+        queue_size=args.queue_size,
+        contacts_per_company=args.contacts_per_company,
+        min_title_score=args.min_title_score,
+        require_email=args.require_email
+    )
+
+
+if __name__ == "__main__":
+    main()
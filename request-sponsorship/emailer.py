@@ -12,9 +12,15 @@ Template syntax:
 
 import os
 import re
+import sys
 import csv
 import json
+import hashlib
 import argparse
+import time
+import heapq
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from openai import OpenAI
@@ -30,6 +36,27 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 DEFAULT_CSV = PROJECT_ROOT / "searches" / "people" / "people_enriched.csv"
 
+sys.path.insert(0, str(PROJECT_ROOT))
+from common.cache import DiskCache, make_key
+from common.ratelimit import RateLimiter
+from common.tracing import trace_span, print_summary
+from common.titles import TARGET_TITLES, TitleMatcher, strip_employer
+from common.contacts import Contact, ENRICHED_EMAIL_COLUMN
+from common.columnar import is_parquet, iter_parquet_rows
+from common.suppression import SuppressedContactError, entry_key, get_suppression_list
+from common.routing import routed_completion, route_policy
+
+# Models of the email_slot routing policy. A cached slot is keyed by the model
+# that actually wrote it (hedging or health ranking may pick a backup)
+EMAIL_MODELS = route_policy("email_slot")["models"]
+
+# LLM generation cache - rerunning the same CSV + template reuses earlier slots
+CACHE_ENABLED = os.getenv("EMAIL_CACHE_DISABLED", "") == ""
+CACHE_MAX_ENTRIES = int(os.getenv("EMAIL_CACHE_MAX_ENTRIES", "20000"))
+_llm_cache = None
+_rate_limiter = None  # set per worker in sharded mode
+_openai_client = None
+
 # Column aliases - map simple names to actual CSV column names
 COLUMN_ALIASES = {
     "name": ["First Name (Linkedin)", "First Name", "Full Name (Linkedin)"],
@@ -38,7 +65,7 @@ COLUMN_ALIASES = {
     "full_name": ["Full Name (Linkedin)", "Name"],
     "company": ["Company"],
     "company_name": ["Company"],
-    "email": ["Email (FullEnrich)"],
+    "email": ["Email (FullEnrich)", "Email"],
     "title": ["Title", "Job Title (Linkedin)", "Headline (Linkedin)"],
     "linkedin": ["LinkedIn Profile Url", "LinkedIn", "Linkedin Url"],
     "location": ["Location (Linkedin)"],
@@ -65,26 +92,119 @@ def resolve_column(column_name: str, row: dict) -> str:
         if key.lower() == column_name.lower():
             return row[key] or ""
     
+    # headhunter and pipeline rows only have a full "Name"
+    if alias_key == "first_name":
+        full_name = resolve_column("full_name", row).split()
+        if full_name:
+            return full_name[0]
+    
     return ""
 
 
-def load_contacts(csv_path: str) -> list[dict]:
-    """Load contacts from CSV file."""
-    contacts = []
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
+EMAIL_COLUMN = ENRICHED_EMAIL_COLUMN
+# headhunter's sponsor_contacts.csv calls it plain "Email"; rows read from it are normalized to EMAIL_COLUMN
+FALLBACK_EMAIL_COLUMNS = ["Email"]
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+VARIABLE_PATTERN = re.compile(r'(?<!\{)\{([^{}]+)\}(?!\})')
+PROMPT_PATTERN = re.compile(r'\{\{(.+?)\}\}', re.DOTALL)
+
+# Columns read by build_profile_context, the review loop and the suppression check, regardless of template
+PROFILE_COLUMNS = [
+    "First Name (Linkedin)", "First Name", "Last Name (Linkedin)", "Last Name", "Full Name (Linkedin)", "Name",
+    "Company", "Title", "Job Title (Linkedin)", "Headline (Linkedin)",
+    "Company Description (Linkedin)", "Company Industry (Linkedin)", "summary (Linkedin)",
+    EMAIL_COLUMN, *FALLBACK_EMAIL_COLUMNS, "Domain",
+]
+
+# LinkedIn exports can have summary fields well past csv's default 128KB limit
+csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+
+
+def template_columns(template: str) -> set[str]:
+    """
+    Lowercased names of every CSV column the template and profile context can read.
+    Includes alias targets, so projection never drops a column resolve_column needs.
+    """
+    columns = {c.lower() for c in PROFILE_COLUMNS}
+    for match in VARIABLE_PATTERN.finditer(template):
+        name = match.group(1)
+        columns.add(name.lower())
+        alias_key = name.lower().replace(" ", "_")
+        for real_col in COLUMN_ALIASES.get(alias_key, []):
+            columns.add(real_col.lower())
+    return columns
+
+
+TITLE_COLUMNS = ["Title", "Job Title (Linkedin)", "Headline (Linkedin)"]
+
+
+def _read_rows(path: str, columns: set[str] | None = None):
+    """
+    Rows of a CSV or Parquet contact file as dicts.
+    If columns (lowercased names) is given, other columns are dropped; for
+    Parquet they are never read from disk at all.
+    """
+    if is_parquet(path):
+        yield from iter_parquet_rows(path, columns)
+        return
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
         reader = csv.DictReader(f)
+        keep = None
+        if columns is not None and reader.fieldnames:
+            keep = [name for name in reader.fieldnames if name and name.lower() in columns]
         for row in reader:
-            email = row.get("Email (FullEnrich)", "").strip()
-            if email and "@" in email:
-                contacts.append(row)
-    return contacts
+            if keep is not None:
+                row = {name: row.get(name) or "" for name in keep}
+            yield row
+
+
+def iter_contacts(csv_path: str, columns: set[str] | None = None, min_title_score: float = 0.0):
+    """
+    Stream contacts from a CSV (or .parquet) file one row at a time.
+    Skips rows without a valid email, suppressed addresses or domains, and
+    repeats of an address already seen.
+    If columns (lowercased names) is given, other columns are dropped from each row.
+    If min_title_score > 0, rows whose title scores below it against
+    TARGET_TITLES are skipped.
+    """
+    matcher = TitleMatcher(TARGET_TITLES) if min_title_score > 0 else None
+    suppression = get_suppression_list()
+    seen = set()  # 64-bit hashes of entry_key(email), not the strings themselves
+    for row in _read_rows(csv_path, columns):
+        email = (row.get(EMAIL_COLUMN) or "").strip()
+        if not email:
+            email = next((row[c].strip() for c in FALLBACK_EMAIL_COLUMNS if row.get(c)), "")
+        if not email or not EMAIL_PATTERN.match(email):
+            continue
+        
+        if suppression.is_suppressed(email, row.get("Domain", "")):
+            continue
+        
+        if matcher is not None:
+            title = " ".join(strip_employer(row.get(col) or "") for col in TITLE_COLUMNS)
+            if matcher.score(title)[1] < min_title_score:
+                continue
+        
+        # Same normalization as suppression: case, +tags and Gmail dots don't make a new address
+        digest = int.from_bytes(hashlib.blake2b(entry_key(email).encode("utf-8"), digest_size=8).digest())
+        if digest in seen:
+            continue
+        seen.add(digest)
+        
+        row[EMAIL_COLUMN] = email
+        yield row
+
+
+def load_contacts(csv_path: str) -> list[dict]:
+    """Load contacts from CSV file."""
+    return list(iter_contacts(csv_path))
 
 
 def build_profile_context(row: dict) -> str:
     """Build a rich context string from the contact's profile for LLM prompts."""
     parts = []
     
-    name = row.get("First Name (Linkedin)", row.get("First Name", ""))
+    name = row.get("First Name (Linkedin)", row.get("First Name", "")) or row.get("Name", "")
     company = row.get("Company", "")
     title = row.get("Title", row.get("Job Title (Linkedin)", ""))
     headline = row.get("Headline (Linkedin)", "")
@@ -106,14 +226,31 @@ def build_profile_context(row: dict) -> str:
     return "\n".join(parts)
 
 
-def process_llm_prompt(prompt: str, profile_context: str, email_context: str = "") -> str:
-    """Send a prompt to the LLM with the user's profile and email context."""
-    client = OpenAI(
-        api_key=OPENROUTER_API_KEY,
-        base_url="https://openrouter.ai/api/v1"
-    )
-    
-    system_prompt = f"""You are helping write personalized outreach emails for hackathon sponsorship.
+def get_openai_client() -> OpenAI:
+    """Shared OpenRouter client, so its connection pool is reused across requests."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI(
+            api_key=OPENROUTER_API_KEY,
+            base_url="https://openrouter.ai/api/v1",
+            max_retries=0  # call_with_retry owns retries, backoff and throttling
+        )
+    return _openai_client
+
+
+def get_llm_cache() -> DiskCache | None:
+    """Return the shared LLM generation cache, or None if caching is disabled."""
+    global _llm_cache
+    if not CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        _llm_cache = DiskCache("email_llm", max_entries=CACHE_MAX_ENTRIES)
+    return _llm_cache
+
+
+def build_system_prompt(profile_context: str, email_context: str) -> str:
+    """System prompt shared by every {{prompt}} slot for a contact."""
+    return f"""You are helping write personalized outreach emails for hackathon sponsorship.
 
 RECIPIENT PROFILE:
 {profile_context}
@@ -126,16 +263,108 @@ Do not use placeholder brackets or variables - write the actual content.
 Do not repeat information that's already in the email template.
 Do not be overly flattering or use excessive exclamation marks."""
 
-    response = client.chat.completions.create(
-        model="google/gemini-2.0-flash-001",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=500
-    )
+
+def request_completions(prompt: str, profile_context: str, email_context: str, n: int = 1) -> tuple[list[str], str]:
+    """
+    Ask the LLM for n alternative completions in one request.
+    Some upstream providers ignore n, so fewer than n results may come back.
+    Returns (completions, the model that wrote them).
+    """
+    if _rate_limiter is not None:
+        _rate_limiter.acquire()
+    
+    client = get_openai_client()
     
-    return response.choices[0].message.content.strip()
+    with trace_span("email_slot", "chat.completions.create", n=n) as span:
+        response = routed_completion(
+            client, "email_slot", span=span,
+            messages=[
+                {"role": "system", "content": build_system_prompt(profile_context, email_context)},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=500,
+            **({"n": n} if n > 1 else {})
+        )
+        span.record(response)
+    
+    return [choice.message.content.strip() for choice in response.choices if choice.message.content], span.model
+
+
+def slot_cache_key(prompt: str, profile_context: str, email_context: str, variant: int = 0, model: str | None = None) -> str:
+    """Cache key for one variant of one {{prompt}} slot as written by model (default: the primary)."""
+    model = model or EMAIL_MODELS[0]
+    if variant == 0:
+        return make_key(model, prompt, profile_context, email_context)
+    return make_key(model, prompt, profile_context, email_context, variant)
+
+
+def cached_slot(cache: DiskCache, prompt: str, profile_context: str, email_context: str, variant: int = 0) -> str | None:
+    """A cached variant written by any of the email_slot models, or None."""
+    for model in EMAIL_MODELS:
+        content = cache.get(slot_cache_key(prompt, profile_context, email_context, variant, model))
+        if content is not None:
+            return content
+    return None
+
+
+def store_slot(cache: DiskCache, content: str, model: str, prompt: str, profile_context: str, email_context: str, variant: int = 0) -> None:
+    """Cache a variant under the model that wrote it, replacing any other model's version."""
+    for other in EMAIL_MODELS:
+        if other != model:
+            cache.delete(slot_cache_key(prompt, profile_context, email_context, variant, other))
+    cache.set(slot_cache_key(prompt, profile_context, email_context, variant, model), content)
+
+
+def process_llm_prompt(prompt: str, profile_context: str, email_context: str = "", refresh: bool = False) -> str:
+    """
+    Send a prompt to the LLM with the user's profile and email context.
+    Results are cached by prompt, profile, template and model; refresh=True
+    skips the lookup and overwrites the cached value.
+    """
+    return process_llm_prompt_variants(prompt, profile_context, email_context, count=1, refresh=refresh)[0]
+
+
+def process_llm_prompt_variants(
+    prompt: str,
+    profile_context: str,
+    email_context: str = "",
+    start: int = 0,
+    count: int = 1,
+    refresh: bool = False
+) -> list[str]:
+    """
+    Return variants start..start+count-1 of a {{prompt}} slot.
+    Cached variants are reused; the rest are requested together through the
+    n parameter, topped up with concurrent single requests if the provider
+    returns fewer choices than asked for.
+    """
+    cache = get_llm_cache()
+    results = [None] * count
+    
+    if cache is not None and not refresh:
+        for i in range(count):
+            results[i] = cached_slot(cache, prompt, profile_context, email_context, start + i)
+    
+    missing = [i for i, r in enumerate(results) if r is None]
+    if missing:
+        contents, model = request_completions(prompt, profile_context, email_context, n=len(missing))
+        fresh = [(content, model) for content in contents]
+        shortfall = len(missing) - len(fresh)
+        if shortfall > 0:
+            with ThreadPoolExecutor(max_workers=shortfall) as pool:
+                futures = [pool.submit(request_completions, prompt, profile_context, email_context) for _ in range(shortfall)]
+                for future in futures:
+                    contents, model = future.result()
+                    fresh.extend((content, model) for content in contents[:1])
+        if len(fresh) < len(missing):
+            raise RuntimeError("LLM returned an empty completion")
+        
+        for i, (content, model) in zip(missing, fresh):
+            results[i] = content
+            if cache is not None:
+                store_slot(cache, content, model, prompt, profile_context, email_context, start + i)
+    
+    return results
 
 
 def substitute_variables(template: str, row: dict) -> str:
@@ -145,32 +374,49 @@ def substitute_variables(template: str, row: dict) -> str:
         value = resolve_column(column_name, row)
         return value if value else f"[Missing: {column_name}]"
     
-    pattern = r'(?<!\{)\{([^{}]+)\}(?!\})'
-    return re.sub(pattern, replace_match, template)
+    return VARIABLE_PATTERN.sub(replace_match, template)
 
 
-def process_llm_prompts(template: str, row: dict, original_template: str = "") -> str:
+def process_llm_prompts(template: str, row: dict, original_template: str = "", refresh: bool = False) -> str:
     """Process {{prompt}} variables by sending them to the LLM."""
+    return process_llm_prompts_variants(template, row, original_template, count=1, refresh=refresh)[0]
+
+
+def process_llm_prompts_variants(
+    template: str,
+    row: dict,
+    original_template: str = "",
+    start: int = 0,
+    count: int = 1,
+    refresh: bool = False,
+    verbose: bool = True
+) -> list[str]:
+    """
+    Fill every {{prompt}} slot in the template, producing count variants.
+    Variant i uses variant i of each slot.
+    """
     profile_context = build_profile_context(row)
     email_context = original_template or template
     
-    def replace_match(match):
+    slots = {}
+    for match in PROMPT_PATTERN.finditer(template):
         prompt = match.group(1).strip()
-        print(f"   🤖 Generating: {prompt[:50]}...")
-        return process_llm_prompt(prompt, profile_context, email_context)
+        if prompt not in slots:
+            if verbose:
+                print(f"   🤖 Generating: {prompt[:50]}...")
+            slots[prompt] = process_llm_prompt_variants(
+                prompt, profile_context, email_context, start=start, count=count, refresh=refresh
+            )
     
-    pattern = r'\{\{(.+?)\}\}'
-    return re.sub(pattern, replace_match, template, flags=re.DOTALL)
+    return [
+        PROMPT_PATTERN.sub(lambda m: slots[m.group(1).strip()][i], template)
+        for i in range(count)
+    ]
 
 
-def generate_email(template: str, row: dict) -> tuple[str, str]:
-    """Generate a personalized email. Returns (subject, body)."""
-    # First pass: substitute CSV variables
-    result = substitute_variables(template, row)
-    # Second pass: process LLM prompts with original template for context
-    result = process_llm_prompts(result, row, original_template=template)
-    
-    lines = result.strip().split('\n')
+def split_subject(text: str) -> tuple[str, str]:
+    """Split rendered email text into (subject, body) on its 'Subject:' line."""
+    lines = text.strip().split('\n')
     subject = ""
     body_start = 0
     
@@ -184,40 +430,420 @@ def generate_email(template: str, row: dict) -> tuple[str, str]:
     return subject, body
 
 
-def preview_email(contact: dict, subject: str, body: str) -> str:
-    """Display email preview and get user action."""
+def check_not_suppressed(row: dict) -> None:
+    """Last line of defence before any LLM call: refuse to draft for a suppressed contact."""
+    columns = [EMAIL_COLUMN, *FALLBACK_EMAIL_COLUMNS]
+    if get_suppression_list().check_row(row, columns):
+        who = next((row[c] for c in columns + ["Domain"] if row.get(c)), "contact")
+        raise SuppressedContactError(f"{who} is on the suppression list")
+
+
+def generate_email(template: str, row: dict, refresh: bool = False) -> tuple[str, str]:
+    """
+    Generate a personalized email. Returns (subject, body).
+    Pass refresh=True to bypass the LLM cache.
+    """
+    return generate_email_variants(template, row, count=1, refresh=refresh)[0]
+
+
+def generate_email_variants(
+    template: str,
+    row: dict,
+    start: int = 0,
+    count: int = 1,
+    refresh: bool = False,
+    verbose: bool = True
+) -> list[tuple[str, str]]:
+    """Generate count alternative emails (variants start..start+count-1). Returns [(subject, body)]."""
+    check_not_suppressed(row)
+    # First pass: substitute CSV variables
+    result = substitute_variables(template, row)
+    # Second pass: process LLM prompts with original template for context
+    rendered = process_llm_prompts_variants(
+        result, row, original_template=template, start=start, count=count, refresh=refresh, verbose=verbose
+    )
+    return [split_subject(text) for text in rendered]
+
+
+def stream_llm_prompt(prompt: str, profile_context: str, email_context: str, on_token, cancel: threading.Event | None = None) -> str | None:
+    """
+    Stream variant 0 of a {{prompt}} slot, passing each token to on_token.
+    A cached result is emitted in one piece. Returns None if cancel was set
+    before the completion finished; the HTTP stream is closed right away.
+    """
+    cache = get_llm_cache()
+    if cache is not None:
+        cached = cached_slot(cache, prompt, profile_context, email_context)
+        if cached is not None:
+            on_token(cached)
+            return cached
+    
+    if _rate_limiter is not None:
+        _rate_limiter.acquire()
+    
+    client = get_openai_client()
+    
+    started = time.perf_counter()
+    parts = []
+    with trace_span("email_slot", "chat.completions.create", stream=True) as span:
+        stream = routed_completion(
+            client, "email_slot", span=span,
+            messages=[
+                {"role": "system", "content": build_system_prompt(profile_context, email_context)},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=500,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        
+        try:
+            for chunk in stream:
+                if cancel is not None and cancel.is_set():
+                    span.attrs["cancelled"] = True
+                    return None
+                if getattr(chunk, "usage", None):
+                    span.record_usage(chunk.usage)
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    if not parts:
+                        span.attrs["first_token_ms"] = round((time.perf_counter() - started) * 1000, 2)
+                    parts.append(delta)
+                    on_token(delta)
+        finally:
+            stream.close()
+    
+    content = "".join(parts).strip()
+    if not content:
+        raise RuntimeError("LLM returned an empty completion")
+    if cache is not None:
+        store_slot(cache, content, span.model, prompt, profile_context, email_context)
+    return content
+
+
+def stream_email(template: str, row: dict, on_text, cancel: threading.Event | None = None) -> tuple[str, str] | None:
+    """
+    Render variant 0 of the email progressively: template text is emitted
+    as-is and each {{prompt}} slot is streamed token by token.
+    Returns (subject, body), or None if cancelled.
+    """
+    check_not_suppressed(row)
+    result = substitute_variables(template, row)
+    profile_context = build_profile_context(row)
+    
+    pieces = []
+    filled = {}
+    pos = 0
+    for match in PROMPT_PATTERN.finditer(result):
+        literal = result[pos:match.start()]
+        on_text(literal)
+        pieces.append(literal)
+        
+        prompt = match.group(1).strip()
+        if prompt in filled:
+            on_text(filled[prompt])
+        else:
+            text = stream_llm_prompt(prompt, profile_context, template, on_text, cancel)
+            if text is None:
+                return None
+            filled[prompt] = text
+        pieces.append(filled[prompt])
+        pos = match.end()
+    
+    on_text(result[pos:])
+    pieces.append(result[pos:])
+    return split_subject("".join(pieces))
+
+
+class StreamingDraft:
+    """
+    Streams the first draft for a contact to the terminal in a background
+    thread so the reviewer can read (and decide) while tokens arrive.
+    The finished draft is available through .future.
+    """
+
+    def __init__(self, template: str, row: dict):
+        self.template = template
+        self.row = row
+        self.future = Future()
+        self.cancel = threading.Event()
+        self.muted = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Cancel the in-flight stream and stop printing."""
+        self.muted = True
+        self.cancel.set()
+
+    def _write(self, text: str) -> None:
+        if not self.muted:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    def _run(self) -> None:
+        try:
+            result = stream_email(self.template, self.row, self._write, self.cancel)
+        except Exception as e:
+            self.future.set_exception(e)
+            if not self.muted:
+                print(f"\n❌ Error: {e}\nPress Enter to continue.")
+            return
+        
+        if result is None:
+            self.future.cancel()
+            return
+        self.future.set_result(result)
+        if not self.muted:
+            print("\n" + "=" * 70)
+            print("Choice: ", end="", flush=True)
+
+
+class VariantPool:
+    """
+    Alternative drafts for one contact, generated in the background.
+    The first batch is requested as soon as the pool is created; the next
+    batch is only requested once the reviewer reaches the last variant.
+    If first is given (e.g. a StreamingDraft future) it supplies variant 0
+    and the background batches start at variant 1.
+    Only the first batch may come from the cache: the reviewer asked for more
+    than those, so later batches bypass it (refresh=True) and overwrite it,
+    and regenerating on a rerun never just replays earlier drafts.
+    """
+
+    def __init__(self, template: str, row: dict, batch_size: int = 3, first: Future | None = None):
+        self.template = template
+        self.row = row
+        self.batch_size = max(1, batch_size)
+        self._first = first
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._batches = []  # (start, count, future)
+        self._request_batch(self.batch_size - (1 if first is not None else 0))
+
+    @property
+    def available(self) -> int:
+        """Number of variants fetched or in flight."""
+        if self._batches:
+            start, count, _ = self._batches[-1]
+            return start + count
+        return 1 if self._first is not None else 0
+
+    def get(self, index: int) -> tuple[str, str]:
+        """Return variant index, waiting for it if necessary. Triggers a refill on the last one."""
+        while index >= self.available:
+            self._request_batch()
+        if index == self.available - 1:
+            self._request_batch()
+        if index == 0 and self._first is not None:
+            return self._first.result()
+        for start, count, future in self._batches:
+            if start <= index < start + count:
+                return future.result()[index - start]
+
+    def get_ready(self, index: int) -> bool:
+        """True if variant index has already been generated."""
+        if index == 0 and self._first is not None:
+            return self._first.done()
+        return any(start <= index < start + count and future.done() for start, count, future in self._batches)
+
+    def close(self) -> None:
+        """Drop any batch that hasn't started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _request_batch(self, count: int | None = None) -> None:
+        count = self.batch_size if count is None else count
+        if count <= 0:
+            return
+        start = self.available
+        self._batches.append((start, count, self._executor.submit(
+            generate_email_variants, self.template, self.row,
+            start=start, count=count, refresh=start >= self.batch_size, verbose=start == 0
+        )))
+
+
+def print_preview_header(contact: dict, variant: int = 0, variant_count: int = 1) -> None:
     print("\n" + "=" * 70)
-    print("📧 EMAIL PREVIEW")
+    if variant_count > 1:
+        print(f"📧 EMAIL PREVIEW (variant {variant + 1}/{variant_count})")
+    else:
+        print("📧 EMAIL PREVIEW")
     print("=" * 70)
     
-    name = contact.get("Full Name (Linkedin)", contact.get("Name", "Unknown"))
-    company = contact.get("Company", "Unknown")
-    email = contact.get("Email (FullEnrich)", "")
+    person = Contact.from_row(contact, keep_extra=False)
     
-    print(f"To: {name} <{email}>")
-    print(f"Company: {company}")
+    print(f"To: {person.name or 'Unknown'} <{person.email}>")
+    print(f"Company: {person.company or 'Unknown'}")
     print("-" * 70)
+
+
+def preview_email(contact: dict, subject: str, body: str, variant: int = 0, variant_count: int = 1) -> str:
+    """Display email preview and get user action."""
+    print_preview_header(contact, variant, variant_count)
     print(f"Subject: {subject}")
     print("-" * 70)
     print(body)
     print("=" * 70)
     
-    print("\nOptions: [a]pprove  [s]kip  [r]egenerate  [q]uit")
+    print("\nOptions: [a]pprove  [s]kip  [r]egenerate (next variant)  [p]revious variant  [q]uit")
     
     while True:
         choice = input("Choice: ").strip().lower()
-        if choice in ['a', 's', 'r', 'q']:
+        if choice in ['a', 's', 'r', 'p', 'q']:
+            return choice
+        print("Enter a, s, r, p, or q.")
+
+
+def preview_streaming_email(contact: dict, draft: StreamingDraft, variant_count: int = 1) -> str | None:
+    """
+    Display the first draft as it streams in and get user action.
+    Skip and quit cancel the stream immediately; approve waits for the draft
+    to finish; regenerate lets it finish silently so it stays reachable with p.
+    Returns None if generation failed.
+    """
+    print("\nOptions: [a]pprove  [s]kip  [r]egenerate (next variant)  [q]uit - decide any time")
+    print_preview_header(contact, 0, variant_count)
+    draft.start()
+    
+    while True:
+        choice = input().strip().lower()
+        if draft.future.done() and not draft.future.cancelled() and draft.future.exception():
+            return None
+        if choice in ['s', 'q']:
+            draft.stop()
+            return choice
+        if choice == 'r':
+            draft.muted = True
+            return choice
+        if choice == 'a':
+            if not draft.future.done():
+                draft.muted = True
+                print("⏳ Finishing draft before approving...")
+            try:
+                draft.future.result()
+            except Exception as e:
+                print(f"❌ Error: {e}")
+                return None
             return choice
         print("Enter a, s, r, or q.")
 
 
+# --- PROGRESS JOURNAL ---
+
+OUTPUT_FIELDS = ["email", "name", "company", "subject", "body"]
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def journal_path_for(output_file: str) -> str:
+    """Journal file that sits next to a mail merge CSV."""
+    return output_file + JOURNAL_SUFFIX
+
+
+def find_latest_output() -> str | None:
+    """Most recent default mail merge CSV that has a journal, for --resume without --output."""
+    candidates = sorted(SCRIPT_DIR.glob(f"mail_merge_*.csv{JOURNAL_SUFFIX}"), reverse=True)
+    if not candidates:
+        return None
+    return str(candidates[0])[:-len(JOURNAL_SUFFIX)]
+
+
+def load_journal(journal_file: str) -> dict[str, dict]:
+    """
+    Read a decision journal. Returns {email (lowercased): last decision entry}.
+    A torn final line from a crash mid-write is ignored.
+    """
+    decisions = {}
+    if not os.path.exists(journal_file):
+        return decisions
+    with open(journal_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            email = entry.get("email", "").strip().lower()
+            if email:
+                decisions[email] = entry
+    return decisions
+
+
+class DecisionLog:
+    """
+    Append-only record of review decisions.
+    Every decision goes to the journal first, then approvals go to the mail
+    merge CSV. Both are flushed and fsynced before returning so a crash or
+    Ctrl-C never loses a reviewed contact.
+    """
+
+    def __init__(self, output_file: str, resume: bool = False):
+        self.output_file = output_file
+        self.journal_file = journal_path_for(output_file)
+        self.decisions = load_journal(self.journal_file) if resume else {}
+        self.approved_this_run = 0
+        self.skipped_this_run = 0
+        
+        self._journal = open(self.journal_file, 'a' if resume else 'w', encoding='utf-8')
+        
+        # The journal is the source of truth: rebuild the CSV from it so a
+        # crash between the two writes can't leave them out of sync.
+        self._output = open(output_file, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._output, fieldnames=OUTPUT_FIELDS)
+        self._writer.writeheader()
+        for entry in self.decisions.values():
+            if entry.get("action") == "approve":
+                self._writer.writerow({k: entry.get(k, "") for k in OUTPUT_FIELDS})
+        self._sync(self._output)
+
+    def has_decision(self, email: str) -> bool:
+        return email.strip().lower() in self.decisions
+
+    @property
+    def approved_total(self) -> int:
+        return sum(1 for e in self.decisions.values() if e.get("action") == "approve")
+
+    def approve(self, email: str, name: str, company: str, subject: str, body: str) -> None:
+        row = {"email": email, "name": name, "company": company, "subject": subject, "body": body}
+        self._record({"action": "approve", **row})
+        self._writer.writerow(row)
+        self._sync(self._output)
+        self.approved_this_run += 1
+
+    def skip(self, email: str, name: str = "", company: str = "") -> None:
+        self._record({"action": "skip", "email": email, "name": name, "company": company})
+        self.skipped_this_run += 1
+
+    def close(self) -> None:
+        self._journal.close()
+        self._output.close()
+
+    def _record(self, entry: dict) -> None:
+        entry["timestamp"] = datetime.now().isoformat()
+        self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._sync(self._journal)
+        self.decisions[entry["email"].strip().lower()] = entry
+
+    @staticmethod
+    def _sync(f) -> None:
+        f.flush()
+        os.fsync(f.fileno())
+
+
 def run_emailer(
     csv_path: str = None,
     template_path: str = None,
-    output_path: str = None
+    output_path: str = None,
+    resume: bool = False,
+    variants: int = 3,
+    stream: bool = True,
+    min_title_score: float = 0.0
 ):
     """
     Main workflow - generates personalized emails and outputs a mail merge CSV.
+    Decisions are written as they are made; with resume=True, contacts that
+    already have a decision in the output's journal are skipped. Each contact
+    gets `variants` alternative drafts up front that the reviewer can cycle through;
+    with stream=True the first one renders token by token as it is generated.
     """
     # Load template
     if not template_path:
@@ -227,96 +853,338 @@ def run_emailer(
     with open(template_path, 'r') as f:
         template = f.read()
     
-    # Load contacts
+    # Stream contacts - generation starts on the first row instead of after the whole file
     csv_file = csv_path or str(DEFAULT_CSV)
-    print(f"📂 Loading contacts from: {csv_file}")
-    contacts = load_contacts(csv_file)
-    print(f"   Found {len(contacts)} contacts with emails")
-    
-    if not contacts:
-        print("✅ No contacts to process!")
-        return
+    print(f"📂 Streaming contacts from: {csv_file}")
+    contacts = iter_contacts(csv_file, columns=template_columns(template), min_title_score=min_title_score)
     
     # Prepare output
+    if resume and not output_path:
+        output_path = find_latest_output()
+        if not output_path:
+            print("❌ Nothing to resume. Use --output to point at an existing mail merge CSV.")
+            return
     output_file = output_path or str(SCRIPT_DIR / f"mail_merge_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
     
-    approved_emails = []
+    log = DecisionLog(output_file, resume=resume)
+    if resume:
+        print(f"↩️  Resuming {output_file}: {len(log.decisions)} contacts already decided")
     
-    for i, contact in enumerate(contacts):
-        email = contact.get("Email (FullEnrich)", "")
-        name = contact.get("Full Name (Linkedin)", contact.get("Name", "Unknown"))
-        company = contact.get("Company", "Unknown")
-        
-        print(f"\n\n{'='*70}")
-        print(f"📋 Contact {i+1}/{len(contacts)}: {name} @ {company}")
-        print("=" * 70)
-        
-        print("\n🔄 Generating personalized email...")
-        
-        try:
-            subject, body = generate_email(template, contact)
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            continue
-        
-        action = preview_email(contact, subject, body)
-        
-        if action == 'q':
-            print("\n👋 Quitting...")
-            break
-        elif action == 's':
-            print("⏭️ Skipped")
-            continue
-        elif action == 'r':
-            print("🔄 Regenerating...")
-            try:
-                subject, body = generate_email(template, contact)
-                action = preview_email(contact, subject, body)
-                if action != 'a':
-                    continue
-            except Exception as e:
-                print(f"❌ Error: {e}")
+    processed = 0
+    try:
+        for i, contact in enumerate(contacts):
+            processed = i + 1
+            email = contact[EMAIL_COLUMN]
+            person = Contact.from_row(contact, keep_extra=False)
+            name = person.name or "Unknown"
+            company = person.company or "Unknown"
+            
+            if log.has_decision(email):
                 continue
-        
-        if action == 'a':
-            approved_emails.append({
-                "email": email,
-                "name": name,
-                "company": company,
-                "subject": subject,
-                "body": body
-            })
-            print("✅ Approved!")
-    
-    # Write output CSV
-    if approved_emails:
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=["email", "name", "company", "subject", "body"])
-            writer.writeheader()
-            writer.writerows(approved_emails)
-        
+            
+            print(f"\n\n{'='*70}")
+            print(f"📋 Contact {i+1}: {name} @ {company}")
+            print("=" * 70)
+            
+            print("\n🔄 Generating personalized email...")
+            
+            draft = StreamingDraft(template, contact) if stream else None
+            pool = VariantPool(template, contact, batch_size=variants, first=draft.future if draft else None)
+            variant = 0
+            action = None
+            try:
+                while True:
+                    if draft is not None and variant == 0 and not draft.future.done() and not draft.muted:
+                        action = preview_streaming_email(contact, draft, pool.available)
+                        if action is None:
+                            break
+                        if action == 'a':
+                            subject, body = draft.future.result()
+                    else:
+                        try:
+                            subject, body = pool.get(variant)
+                        except Exception as e:
+                            print(f"❌ Error: {e}")
+                            action = None
+                            break
+                        action = preview_email(contact, subject, body, variant, pool.available)
+                    
+                    if action == 'r':
+                        variant += 1
+                        if variant >= pool.available or not pool.get_ready(variant):
+                            print("🔄 Waiting for more variants...")
+                    elif action == 'p':
+                        variant = max(0, variant - 1)
+                    else:
+                        break
+            finally:
+                if draft is not None and action != 'a':
+                    draft.stop()
+                pool.close()
+            
+            if action == 'q':
+                print("\n👋 Quitting...")
+                break
+            elif action == 's':
+                log.skip(email, name, company)
+                print("⏭️ Skipped")
+            elif action == 'a':
+                log.approve(email, name, company, subject, body)
+                print("✅ Approved!")
+    except KeyboardInterrupt:
+        print("\n\n⏸️  Interrupted - progress is saved. Re-run with --resume to continue.")
+    finally:
+        log.close()
+    
+    if not processed:
+        print("✅ No contacts to process!")
+        return
+    
+    if log.approved_total:
         print(f"\n\n{'='*70}")
         print("📊 SUMMARY")
         print("=" * 70)
-        print(f"   Approved: {len(approved_emails)}")
+        print(f"   Approved: {log.approved_this_run} this session ({log.approved_total} total)")
+        print(f"   Skipped: {log.skipped_this_run} this session")
+        print(f"   Contacts read: {processed}")
+        if get_suppression_list().hits:
+            print(f"   Suppressed: {get_suppression_list().hits} (never sent to the LLM)")
         print(f"   Output: {output_file}")
+        print(f"   Journal: {log.journal_file}")
         print("\n💡 Import this CSV into your mail merge service (GMass, Mailchimp, etc.)")
     else:
         print("\n❌ No emails approved.")
 
 
+# --- SHARDED BATCH MODE ---
+
+SHARD_FIELDS = ["index", "status", "error"] + OUTPUT_FIELDS
+
+
+def shard_output_path(output_file: str, shard: int) -> str:
+    return f"{output_file}.shard{shard}.csv"
+
+
+def shard_input_path(output_file: str, shard: int) -> str:
+    return f"{output_file}.shard{shard}.in.csv"
+
+
+def split_contacts(contacts, output_file: str, shards: int) -> int:
+    """
+    Deal the contact stream round-robin into one input CSV per shard, each row
+    tagged with its global index, so workers never parse or check rows they
+    won't draft. Returns the number of contacts written.
+    """
+    handles = [open(shard_input_path(output_file, k), 'w', newline='', encoding='utf-8') for k in range(shards)]
+    writers = None
+    count = 0
+    try:
+        for index, contact in enumerate(contacts):
+            if writers is None:
+                fieldnames = ["index", *contact.keys()]
+                writers = [csv.DictWriter(h, fieldnames=fieldnames, extrasaction="ignore") for h in handles]
+                for writer in writers:
+                    writer.writeheader()
+            contact["index"] = index
+            writers[index % shards].writerow(contact)
+            count += 1
+    finally:
+        for h in handles:
+            h.close()
+    return count
+
+
+def run_shard(
+    shard: int,
+    input_file: str,
+    template: str,
+    output_file: str,
+    rate_limit: float,
+    cache_enabled: bool = True
+) -> dict:
+    """
+    Worker for run_sharded: drafts the contacts split_contacts() gave this
+    shard. Rows are written to a per-shard CSV tagged with their global index.
+    Returns throughput stats for the shard.
+    """
+    global _llm_cache, _rate_limiter, _openai_client, CACHE_ENABLED
+    # Never reuse a SQLite connection or HTTP pool inherited across fork
+    _llm_cache = None
+    _openai_client = None
+    CACHE_ENABLED = cache_enabled
+    _rate_limiter = RateLimiter(rate_limit, burst=2) if rate_limit > 0 else None
+    
+    stats = {"shard": shard, "contacts": 0, "drafted": 0, "errors": 0}
+    started = time.monotonic()
+    
+    with open(input_file, 'r', newline='', encoding='utf-8') as source, \
+            open(shard_output_path(output_file, shard), 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SHARD_FIELDS)
+        writer.writeheader()
+        for contact in csv.DictReader(source):
+            index = int(contact.pop("index"))
+            stats["contacts"] += 1
+            person = Contact.from_row(contact, keep_extra=False)
+            row = {
+                "index": index,
+                "email": contact[EMAIL_COLUMN],
+                "name": person.name or "Unknown",
+                "company": person.company or "Unknown",
+                "subject": "",
+                "body": "",
+                "error": "",
+            }
+            try:
+                row["subject"], row["body"] = generate_email_variants(template, contact, verbose=False)[0]
+                row["status"] = "drafted"
+                stats["drafted"] += 1
+            except Exception as e:
+                row["status"] = "error"
+                row["error"] = str(e)
+                stats["errors"] += 1
+            writer.writerow(row)
+            f.flush()
+    
+    stats["seconds"] = time.monotonic() - started
+    return stats
+
+
+def merge_shards(output_file: str, shards: int) -> tuple[int, int]:
+    """
+    Merge per-shard CSVs into one mail merge CSV in original contact order.
+    Each shard is already sorted by index, so this is a streaming k-way merge.
+    Returns (drafts written, errored rows left out).
+    """
+    handles = [open(shard_output_path(output_file, k), 'r', newline='', encoding='utf-8') for k in range(shards)]
+    written = 0
+    errors = 0
+    try:
+        readers = [((int(r["index"]), r) for r in csv.DictReader(h)) for h in handles]
+        with open(output_file, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.DictWriter(out, fieldnames=OUTPUT_FIELDS)
+            writer.writeheader()
+            for _, row in heapq.merge(*readers, key=lambda item: item[0]):
+                if row["status"] != "drafted":
+                    errors += 1
+                    continue
+                writer.writerow({k: row[k] for k in OUTPUT_FIELDS})
+                written += 1
+    finally:
+        for h in handles:
+            h.close()
+    return written, errors
+
+
+def run_sharded(
+    csv_path: str = None,
+    template_path: str = None,
+    output_path: str = None,
+    shards: int = 4,
+    rate_limit: float = 120,
+    min_title_score: float = 0.0
+):
+    """
+    Non-interactive batch mode: drafts every contact across a process pool
+    and writes one mail merge CSV in the original contact order.
+    rate_limit (requests/minute) is split evenly between the workers.
+    Drafts are NOT reviewed - check the output before sending.
+    """
+    if not template_path:
+        print("❌ No template provided. Use --template")
+        return
+    
+    with open(template_path, 'r') as f:
+        template = f.read()
+    
+    csv_file = csv_path or str(DEFAULT_CSV)
+    output_file = output_path or str(SCRIPT_DIR / f"mail_merge_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+    per_shard_rate = rate_limit / shards if rate_limit > 0 else 0
+    
+    print(f"📂 Drafting contacts from: {csv_file}")
+    print(f"⚙️  {shards} shards, {per_shard_rate:.1f} requests/min each")
+    
+    started = time.monotonic()
+    # Parse, dedupe and check the contacts once here; workers only draft
+    contacts = iter_contacts(csv_file, columns=template_columns(template), min_title_score=min_title_score)
+    try:
+        total = split_contacts(contacts, output_file, shards)
+        if not total:
+            print("✅ No contacts to process!")
+            return
+        print(f"✂️  Split {total} contacts across {shards} shards")
+        with ProcessPoolExecutor(max_workers=shards) as pool:
+            futures = [
+                pool.submit(run_shard, k, shard_input_path(output_file, k), template, output_file, per_shard_rate, CACHE_ENABLED)
+                for k in range(shards)
+            ]
+            results = []
+            for future in as_completed(futures):
+                stats = future.result()
+                print(f"   ✅ Shard {stats['shard']} finished: {stats['drafted']} drafted in {stats['seconds']:.1f}s")
+                results.append(stats)
+    finally:
+        for k in range(shards):
+            if os.path.exists(shard_input_path(output_file, k)):
+                os.remove(shard_input_path(output_file, k))
+    elapsed = time.monotonic() - started
+    
+    written, errors = merge_shards(output_file, shards)
+    for k in range(shards):
+        os.remove(shard_output_path(output_file, k))
+    
+    print(f"\n\n{'='*70}")
+    print("📊 SHARD THROUGHPUT")
+    print("=" * 70)
+    print(f"   {'Shard':<7}{'Contacts':>10}{'Drafted':>10}{'Errors':>8}{'Seconds':>10}{'Drafts/min':>12}")
+    for stats in sorted(results, key=lambda s: s["shard"]):
+        per_min = stats["drafted"] / stats["seconds"] * 60 if stats["seconds"] else 0
+        print(f"   {stats['shard']:<7}{stats['contacts']:>10}{stats['drafted']:>10}{stats['errors']:>8}{stats['seconds']:>10.1f}{per_min:>12.1f}")
+    total_per_min = written / elapsed * 60 if elapsed else 0
+    print(f"   {'Total':<7}{sum(s['contacts'] for s in results):>10}{written:>10}{errors:>8}{elapsed:>10.1f}{total_per_min:>12.1f}")
+    print(f"\n   Output: {output_file}")
+    print("\n⚠️  Drafts were not reviewed - read through the CSV before importing it.")
+    # Worker spans share this run's trace file but workers exit without printing
+    print_summary()
+
+
 def main():
     parser = argparse.ArgumentParser(description="AI-Enabled Email Outreach - Mail Merge Generator")
-    parser.add_argument("--csv", help="Path to CSV file with contacts")
+    parser.add_argument("--csv", help="Path to CSV or .parquet file with contacts")
     parser.add_argument("--template", required=True, help="Path to email template file")
     parser.add_argument("--output", help="Output path for mail merge CSV")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the LLM generation cache")
+    parser.add_argument("--resume", action="store_true", help="Continue a previous run, skipping contacts that already have a decision")
+    parser.add_argument("--variants", type=int, default=3, help="Alternative drafts generated per contact up front (default: 3)")
+    parser.add_argument("--no-stream", action="store_true", help="Wait for complete drafts instead of streaming the first one")
+    parser.add_argument("--shards", type=int, default=0, help="Draft without review across N worker processes")
+    parser.add_argument("--rate-limit", type=float, default=120, help="Total LLM requests/minute in sharded mode, split across shards (default: 120)")
+    parser.add_argument("--min-title-score", type=float, default=0.0, help="Skip contacts whose title scores below this (0-1) against the target roles")
     
     args = parser.parse_args()
     
+    if args.no_cache:
+        global CACHE_ENABLED
+        CACHE_ENABLED = False
+    
+    if args.shards > 0:
+        run_sharded(
+            csv_path=args.csv,
+            template_path=args.template,
+            output_path=args.output,
+            shards=args.shards,
+            rate_limit=args.rate_limit,
+            min_title_score=args.min_title_score
+        )
+        return
+    
     run_emailer(
         csv_path=args.csv,
         template_path=args.template,
-        output_path=args.output
+        output_path=args.output,
+        resume=args.resume,
+        variants=args.variants,
+        stream=not args.no_stream,
+        min_title_score=args.min_title_score
     )
 
 
@@ -0,0 +1,61 @@
+"""Which domains the company index treats as one company."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.company_identity import CompanyIndex, company_name, domain_stem
+
+
+class CompanyNameTest(unittest.TestCase):
+    def test_segment_closest_to_domain(self):
+        self.assertEqual(company_name("Home | Acme Inc.", "acme.com"), "Acme Inc.")
+        self.assertEqual(company_name("Vercel: Build and deploy the best web experiences", "vercel.com"), "Vercel")
+
+    def test_bot_walls_and_error_pages_have_no_name(self):
+        for title in ("Just a moment...", "403 Forbidden", "Attention Required! | Cloudflare", "404 Not Found"):
+            self.assertEqual(company_name(title), "", title)
+
+    def test_prefixes_only_stripped_for_known_stems(self):
+        self.assertEqual(domain_stem("google.com"), "google")
+        self.assertEqual(domain_stem("getacme.io"), "getacme")
+        self.assertEqual(domain_stem("getacme.io", {"acme"}), "acme")
+        self.assertEqual(domain_stem("acme.co.uk"), "acme")
+
+
+class CompanyIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "company_identity.jsonl")
+        open(self.path, "w").close()  # an existing file skips seeding from saved searches
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tld_variants_merge(self):
+        index = CompanyIndex(self.path)
+        self.assertEqual(index.resolve("vercel.com", "Vercel"), "vercel.com")
+        self.assertEqual(index.resolve("www.vercel.io", "Vercel Inc."), "vercel.com")
+
+    def test_same_stem_different_company_stays_separate(self):
+        index = CompanyIndex(self.path)
+        self.assertEqual(index.resolve("delta.io", "Delta Lake"), "delta.io")
+        self.assertEqual(index.resolve("delta.com", "Delta Air Lines"), "delta.com")
+
+    def test_bot_wall_titles_do_not_merge(self):
+        index = CompanyIndex(self.path)
+        self.assertEqual(index.resolve("alpha.com", "Just a moment..."), "alpha.com")
+        self.assertEqual(index.resolve("beta.com", "Just a moment..."), "beta.com")
+
+    def test_split_persists(self):
+        index = CompanyIndex(self.path)
+        index.resolve("vercel.com", "Vercel")
+        index.resolve("vercel.io", "Vercel")
+        self.assertTrue(index.split("vercel.io"))
+        self.assertEqual(CompanyIndex(self.path).resolve("vercel.io"), "vercel.io")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""iter_contacts filtering and deduplication. Needs the emailer's dependencies (openai, dotenv)."""
+
+import os
+import sys
+import csv
+import tempfile
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "request-sponsorship"))
+from common import suppression
+from common.suppression import SuppressionList
+
+try:
+    import emailer
+except ImportError:
+    emailer = None
+
+
+@unittest.skipIf(emailer is None, "emailer dependencies (openai, dotenv) are not installed")
+class IterContactsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        # An empty list of our own, never the project's suppression/ directory
+        saved = suppression._default
+        suppression._default = SuppressionList(os.path.join(self.tmp.name, "suppression"))
+        self.addCleanup(setattr, suppression, "_default", saved)
+        self.addCleanup(suppression._default.close)
+
+    def write_csv(self, rows: list[dict]) -> str:
+        path = os.path.join(self.tmp.name, "contacts.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["Name", "Company", "Domain", "Email"])
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def emails(self, path: str) -> list[str]:
+        return [row["Email"] for row in emailer.iter_contacts(path)]
+
+    def test_same_address_in_other_case_is_yielded_once(self):
+        path = self.write_csv([
+            {"Name": "Jane Doe", "Company": "Acme", "Domain": "acme.io", "Email": "jane@acme.io"},
+            {"Name": "Jane Doe", "Company": "Acme Inc", "Domain": "acme.io", "Email": "Jane@ACME.io"},
+        ])
+        self.assertEqual(self.emails(path), ["jane@acme.io"])
+
+    def test_gmail_variants_are_one_address(self):
+        path = self.write_csv([
+            {"Name": "Ann Bell", "Company": "Acme", "Domain": "acme.io", "Email": "a.b+hackathon@gmail.com"},
+            {"Name": "Ann Bell", "Company": "Acme", "Domain": "acme.io", "Email": "ab@gmail.com"},
+        ])
+        self.assertEqual(self.emails(path), ["a.b+hackathon@gmail.com"])
+
+    def test_invalid_and_suppressed_rows_are_skipped(self):
+        suppression._default.add(["blocked.io"])
+        path = self.write_csv([
+            {"Name": "No Email", "Company": "Acme", "Domain": "acme.io", "Email": ""},
+            {"Name": "Bad Email", "Company": "Acme", "Domain": "acme.io", "Email": "jane at acme"},
+            {"Name": "Blocked", "Company": "Blocked", "Domain": "blocked.io", "Email": "sam@blocked.io"},
+            {"Name": "Kept", "Company": "Acme", "Domain": "acme.io", "Email": "kim@acme.io"},
+        ])
+        self.assertEqual(self.emails(path), ["kim@acme.io"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""parse_json salvage of fenced and truncated LLM output. Run with `python -m unittest discover tests`."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.structured import parse_json
+
+
+class ParseJsonTest(unittest.TestCase):
+    def test_complete_json_in_fence_and_prose(self):
+        text = 'Here you go:\n```json\n{"approved": [{"domain": "vercel.com"}]}\n```'
+        self.assertEqual(parse_json(text), ({"approved": [{"domain": "vercel.com"}]}, 0))
+
+    def test_truncated_mid_item_keeps_complete_items(self):
+        text = '{"approved": [{"domain": "vercel.com", "confidence": "high"}, {"domain": "netlify.com", "confid'
+        value, dropped = parse_json(text)
+        self.assertEqual(value, {"approved": [{"domain": "vercel.com", "confidence": "high"}]})
+        self.assertGreater(dropped, 0)
+
+    def test_truncated_second_member_keeps_first(self):
+        text = '{"approved": [{"domain": "a.com"}], "rejected": [{"domain": "b.com", "reason": "too sm'
+        value, _ = parse_json(text)
+        self.assertEqual(value, {"approved": [{"domain": "a.com"}]})
+
+    def test_brackets_inside_strings_are_not_structure(self):
+        text = '[{"rationale": "Sponsors [many] hackathons, {really}"}, {"rationale": "cut'
+        value, _ = parse_json(text)
+        self.assertEqual(value, [{"rationale": "Sponsors [many] hackathons, {really}"}])
+
+    def test_nothing_salvageable(self):
+        self.assertIsNone(parse_json('{"approved": [{"domain": "a.c')[0])
+        self.assertIsNone(parse_json("I can't help with that.")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
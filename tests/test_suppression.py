@@ -0,0 +1,71 @@
+"""Address normalization and the on-disk suppression list."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.suppression import SuppressionList, entry_key, normalize_domain, normalize_email, read_entries_file
+
+
+class NormalizeTest(unittest.TestCase):
+    def test_gmail_dots_and_tags(self):
+        self.assertEqual(normalize_email("A.B+x@gmail.com"), "ab@gmail.com")
+        self.assertEqual(normalize_email("a.b@googlemail.com"), "ab@gmail.com")
+
+    def test_other_providers_keep_dots(self):
+        self.assertEqual(normalize_email(" Jane.Doe+news@Acme.io "), "jane.doe@acme.io")
+
+    def test_invalid_addresses(self):
+        self.assertEqual(normalize_email("not-an-email"), "")
+        self.assertEqual(normalize_email("+tag@acme.io"), "")
+
+    def test_domains_from_urls(self):
+        self.assertEqual(normalize_domain("https://www.Acme.io/about"), "acme.io")
+        self.assertEqual(normalize_domain("jane@acme.io"), "acme.io")
+
+    def test_entry_keys(self):
+        self.assertEqual(entry_key("A.B+x@gmail.com"), "e:ab@gmail.com")
+        self.assertEqual(entry_key("www.acme.io"), "d:acme.io")
+        self.assertEqual(entry_key(""), "")
+
+
+class SuppressionListTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def open_list(self) -> SuppressionList:
+        suppression = SuppressionList(self.directory)
+        self.addCleanup(suppression.close)
+        return suppression
+
+    def test_add_and_check(self):
+        suppression = self.open_list()
+        suppression.add(["ab@gmail.com", "acme.io"])
+        self.assertTrue(suppression.is_suppressed("A.B+promo@gmail.com"))
+        self.assertTrue(suppression.is_suppressed("jane@acme.io"))
+        self.assertTrue(suppression.is_suppressed(domain="https://acme.io"))
+        self.assertFalse(suppression.is_suppressed("jane@other.io"))
+
+    def test_hand_edited_entries_are_rebuilt(self):
+        self.open_list().add(["a@acme.io"])
+        with open(os.path.join(self.directory, "entries.tsv"), "a", encoding="utf-8") as f:
+            f.write("e:b@acme.io\t\t\n")
+        os.utime(os.path.join(self.directory, "index.bin"), ns=(0, 0))
+        self.assertTrue(self.open_list().is_suppressed("b@acme.io"))
+
+    def test_csv_import_prefers_emails_over_domains(self):
+        path = os.path.join(self.directory, "bounces.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Email,Domain\njane@acme.io,acme.io\n,other.io\n")
+        self.assertEqual(read_entries_file(path), ["jane@acme.io"])
+        self.assertEqual(read_entries_file(path, domains=True), ["jane@acme.io", "other.io"])
+
+
+if __name__ == "__main__":
+    unittest.main()